@@ -13,32 +13,63 @@ from sqlalchemy import engine_from_config
 from sqlalchemy import pool
 from alembic import context
 
-from project_manager.models import Base, SQLALCHEMY_DATABASE_URL
+from project_manager.models import Base, database_url, workspace_url
 
 import project_manager.models.project
 import project_manager.models.task
 import project_manager.models.user
+import project_manager.models.search
+from project_manager.models.search import SEARCH_INDEXES, _fts_name
 
 
 config = context.config
 
 
-config.set_main_option("sqlalchemy.url", SQLALCHEMY_DATABASE_URL)
+# `alembic -x workspace=NAME upgrade head` migrates one workspace and
+# `-x workspace=all` every one of them, one after the other; without -x it
+# is the current workspace (PM_WORKSPACE, default "default").
+workspace = context.get_x_argument(as_dictionary=True).get("workspace")
+if workspace:
+    from project_manager.workspaces import list_workspaces, workspace_exists
+
+    if workspace != "all" and not workspace_exists(workspace):
+        raise SystemExit(f"Workspace '{workspace}' not found.")
+    names = list_workspaces() if workspace == "all" else [workspace]
+    urls = {name: workspace_url(name) for name in names}
+else:
+    urls = {None: database_url()}
+
+config.set_main_option("sqlalchemy.url", next(iter(urls.values()), database_url()))
 
 
 fileConfig(config.config_file_name)
 
 target_metadata = Base.metadata
 
+# The FTS5 virtual tables and the shadow tables SQLite keeps for them; they
+# aren't in the metadata, so autogenerate would otherwise drop them.
+FTS_TABLES = {
+    _fts_name(base) + suffix
+    for base in SEARCH_INDEXES
+    for suffix in ("", "_data", "_idx", "_docsize", "_config", "_content")
+}
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    return not (type_ == "table" and name in FTS_TABLES)
+
 
 def run_migrations_offline():
     """Run migrations in 'offline' mode."""
     url = config.get_main_option("sqlalchemy.url")
+    if len(urls) > 1:
+        raise SystemExit("Offline mode writes the SQL of one database; pick one with -x workspace=NAME.")
     context.configure(
         url=url,
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -46,21 +77,25 @@ def run_migrations_offline():
 
 
 def run_migrations_online():
-    """Run migrations in 'online' mode."""
-    connectable = engine_from_config(
-        config.get_section(config.config_ini_section),
-        prefix="sqlalchemy.",
-        poolclass=pool.NullPool,
-    )
-
-    with connectable.connect() as connection:
-        context.configure(
-            connection=connection,
-            target_metadata=target_metadata,
+    """Run migrations in 'online' mode, on each selected workspace in turn."""
+    for name, url in urls.items():
+        if name is not None:
+            print(f"Workspace {name}: {url}")
+        connectable = engine_from_config(
+            {**config.get_section(config.config_ini_section), "sqlalchemy.url": url},
+            prefix="sqlalchemy.",
+            poolclass=pool.NullPool,
         )
 
-        with context.begin_transaction():
-            context.run_migrations()
+        with connectable.connect() as connection:
+            context.configure(
+                connection=connection,
+                target_metadata=target_metadata,
+                include_object=include_object,
+            )
+
+            with context.begin_transaction():
+                context.run_migrations()
 
 
 if context.is_offline_mode():
@@ -0,0 +1,43 @@
+"""Add composite indexes for helper queries
+
+Revision ID: 39dcec8ba561
+Revises: 2f25d887091f
+Create Date: 2026-10-17 20:26:25.721069
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '39dcec8ba561'
+down_revision: Union[str, None] = '2f25d887091f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # view_project_tasks: WHERE project_id = ? ORDER BY due_date, id, and the
+    # task join in list_projects. Nothing may follow due_date, or the rowid
+    # would stop being the next sort key and SQLite would sort again.
+    op.create_index('ix_tasks_project_id_due_date', 'tasks', ['project_id', 'due_date'], unique=False)
+    # list_tasks: ORDER BY due_date, id (the rowid is implicit in every index).
+    op.create_index('ix_tasks_due_date', 'tasks', ['due_date'], unique=False)
+    # User joins and ON DELETE SET NULL lookups.
+    op.create_index('ix_tasks_user_id', 'tasks', ['user_id'], unique=False)
+    # Status filters ordered by due date.
+    op.create_index('ix_tasks_status_due_date', 'tasks', ['status', 'due_date'], unique=False)
+    # list_projects: ORDER BY deadline, id.
+    op.create_index('ix_projects_deadline', 'projects', ['deadline'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_projects_deadline', table_name='projects')
+    op.drop_index('ix_tasks_status_due_date', table_name='tasks')
+    op.drop_index('ix_tasks_user_id', table_name='tasks')
+    op.drop_index('ix_tasks_due_date', table_name='tasks')
+    op.drop_index('ix_tasks_project_id_due_date', table_name='tasks')
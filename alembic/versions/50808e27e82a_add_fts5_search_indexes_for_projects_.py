@@ -0,0 +1,60 @@
+"""Add FTS5 search indexes for projects, tasks and users
+
+Revision ID: 50808e27e82a
+Revises: 39dcec8ba561
+Create Date: 2026-10-17 20:28:51.725467
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '50808e27e82a'
+down_revision: Union[str, None] = '39dcec8ba561'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Base table -> indexed text columns. Each gets an external-content FTS5
+# table (rowid = base id) kept in sync by insert/delete/update triggers.
+SEARCH_INDEXES = {
+    'projects': ('name', 'description'),
+    'tasks': ('name', 'description'),
+    'users': ('name', 'email'),
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for base, cols in SEARCH_INDEXES.items():
+        fts = f'{base}_fts'
+        col_list = ', '.join(cols)
+        new_vals = ', '.join(f'new.{c}' for c in cols)
+        old_vals = ', '.join(f'old.{c}' for c in cols)
+        insert_new = f"INSERT INTO {fts}(rowid, {col_list}) VALUES (new.id, {new_vals});"
+        delete_old = f"INSERT INTO {fts}({fts}, rowid, {col_list}) VALUES ('delete', old.id, {old_vals});"
+
+        op.execute(
+            f"CREATE VIRTUAL TABLE {fts} USING fts5("
+            f"{col_list}, content='{base}', content_rowid='id', "
+            f"tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+        )
+        op.execute(f"CREATE TRIGGER {fts}_ai AFTER INSERT ON {base} BEGIN {insert_new} END")
+        op.execute(f"CREATE TRIGGER {fts}_ad AFTER DELETE ON {base} BEGIN {delete_old} END")
+        op.execute(
+            f"CREATE TRIGGER {fts}_au AFTER UPDATE OF {col_list} ON {base} "
+            f"BEGIN {delete_old} {insert_new} END"
+        )
+        # Index the rows that already exist.
+        op.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for base in SEARCH_INDEXES:
+        fts = f'{base}_fts'
+        for suffix in ('au', 'ad', 'ai'):
+            op.execute(f"DROP TRIGGER IF EXISTS {fts}_{suffix}")
+        op.execute(f"DROP TABLE IF EXISTS {fts}")
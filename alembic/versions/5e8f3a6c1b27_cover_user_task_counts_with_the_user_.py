@@ -0,0 +1,36 @@
+"""Cover user task counts with the user index
+
+Revision ID: 5e8f3a6c1b27
+Revises: 7c41e0b9a2d5
+Create Date: 2026-10-18 11:03:52.207614
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e8f3a6c1b27'
+down_revision: Union[str, None] = '7c41e0b9a2d5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Workload report: tasks GROUP BY user_id, status with overdue counts and
+    # the earliest due date, answered from the index without reading the
+    # table. user_id stays the leading column, so user joins and ON DELETE
+    # SET NULL lookups use it as they used ix_tasks_user_id.
+    op.create_index(
+        'ix_tasks_user_id_status_due_date', 'tasks', ['user_id', 'status', 'due_date'], unique=False
+    )
+    op.drop_index('ix_tasks_user_id', table_name='tasks')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('ix_tasks_user_id', 'tasks', ['user_id'], unique=False)
+    op.drop_index('ix_tasks_user_id_status_due_date', table_name='tasks')
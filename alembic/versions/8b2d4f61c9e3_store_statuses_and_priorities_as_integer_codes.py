@@ -0,0 +1,243 @@
+"""Store statuses and priorities as integer codes
+
+Revision ID: 8b2d4f61c9e3
+Revises: 5e8f3a6c1b27
+Create Date: 2026-10-18 15:12:40.581903
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b2d4f61c9e3'
+down_revision: Union[str, None] = '5e8f3a6c1b27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Codes as in project_manager.models.enums at this revision.
+TASK_STATUSES = {1: 'To Do', 2: 'In Progress', 3: 'Done'}
+PROJECT_STATUSES = {1: 'Active', 2: 'Completed'}
+PRIORITIES = {1: 'High', 2: 'Medium', 3: 'Low'}
+
+# Rows copied per statement while rebuilding a table.
+CHUNK = 50000
+
+# SQLite can't change a column's type in place, so projects and tasks are
+# rebuilt: a new table is created, rows are copied into it CHUNK ids at a
+# time with the strings converted on the way, the old table is dropped and
+# the new one renamed. Ids are kept, so foreign keys, project_stats and the
+# external-content FTS tables stay valid; the triggers and indexes on the
+# two tables go with the old tables and are created again.
+
+
+def _to_code(column, labels, default):
+    # Case-insensitive like the old comparisons; anything unrecognised gets
+    # the column's default rather than failing the CHECK constraint.
+    whens = ' '.join(f"WHEN '{label.lower()}' THEN {code}" for code, label in labels.items())
+    return f"CASE lower(trim({column})) {whens} ELSE {default} END"
+
+
+def _to_label(column, labels):
+    whens = ' '.join(f"WHEN {code} THEN '{label}'" for code, label in labels.items())
+    return f"CASE {column} {whens} END"
+
+
+def _projects_table(name, coded):
+    kind = sa.SmallInteger() if coded else sa.String()
+    checks = (
+        sa.CheckConstraint(f"priority IN ({', '.join(map(str, PRIORITIES))})", name='ck_projects_priority'),
+        sa.CheckConstraint(f"status IN ({', '.join(map(str, PROJECT_STATUSES))})", name='ck_projects_status'),
+    ) if coded else ()
+    return op.create_table(
+        name,
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('description', sa.String(), nullable=True),
+        sa.Column('start_date', sa.Date(), nullable=False),
+        sa.Column('deadline', sa.Date(), nullable=False),
+        sa.Column('priority', kind, nullable=False),
+        sa.Column('status', kind, nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('name'),
+        *checks,
+    )
+
+
+def _tasks_table(name, coded):
+    checks = (
+        sa.CheckConstraint(f"status IN ({', '.join(map(str, TASK_STATUSES))})", name='ck_tasks_status'),
+    ) if coded else ()
+    return op.create_table(
+        name,
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('description', sa.String(), nullable=True),
+        sa.Column('status', sa.SmallInteger() if coded else sa.String(), nullable=False),
+        sa.Column('due_date', sa.Date(), nullable=True),
+        sa.Column('project_id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='SET NULL'),
+        sa.PrimaryKeyConstraint('id'),
+        *checks,
+    )
+
+
+def _rebuild(table, create, converted):
+    """Replace `table` by create(new_name), copying rows with `converted` {column: SQL}."""
+    new = f'_{table}_new'
+    columns = [c.name for c in create(new).columns]
+    values = ', '.join(converted.get(c, c) for c in columns)
+    bind = op.get_bind()
+    last = bind.execute(sa.text(f"SELECT max(id) FROM {table}")).scalar() or 0
+    for start in range(0, last, CHUNK):
+        bind.execute(
+            sa.text(
+                f"INSERT INTO {new} ({', '.join(columns)}) SELECT {values} FROM {table} "
+                "WHERE id > :start AND id <= :end"
+            ),
+            {"start": start, "end": start + CHUNK},
+        )
+    op.drop_table(table)
+    op.rename_table(new, table)
+
+
+def _create_project_indexes():
+    op.create_index('ix_projects_id', 'projects', ['id'], unique=False)
+    op.create_index('ix_projects_deadline', 'projects', ['deadline'], unique=False)
+
+
+def _create_task_indexes(open_status):
+    op.create_index('ix_tasks_id', 'tasks', ['id'], unique=False)
+    op.create_index('ix_tasks_project_id_due_date', 'tasks', ['project_id', 'due_date'], unique=False)
+    op.create_index('ix_tasks_due_date', 'tasks', ['due_date'], unique=False)
+    op.create_index('ix_tasks_status_due_date', 'tasks', ['status', 'due_date'], unique=False)
+    op.create_index(
+        'ix_tasks_user_id_status_due_date', 'tasks', ['user_id', 'status', 'due_date'], unique=False
+    )
+    op.create_index(
+        'ix_tasks_open_project_due_date', 'tasks', ['project_id', 'due_date', 'user_id'],
+        unique=False, sqlite_where=sa.text(open_status),
+    )
+    op.create_index(
+        'ix_tasks_open_user_due_date', 'tasks', ['user_id', 'due_date', 'project_id'],
+        unique=False, sqlite_where=sa.text(open_status),
+    )
+
+
+def _create_search_triggers(base):
+    # As in revision 50808e27e82a.
+    fts = f'{base}_fts'
+    cols = 'name, description'
+    insert_new = f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, new.name, new.description);"
+    delete_old = f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, old.name, old.description);"
+    op.execute(f"CREATE TRIGGER {fts}_ai AFTER INSERT ON {base} BEGIN {insert_new} END")
+    op.execute(f"CREATE TRIGGER {fts}_ad AFTER DELETE ON {base} BEGIN {delete_old} END")
+    op.execute(f"CREATE TRIGGER {fts}_au AFTER UPDATE OF {cols} ON {base} BEGIN {delete_old} {insert_new} END")
+
+
+def _create_stats_triggers(is_status, is_open):
+    # As in revision d98d6b2eff9e, with the status tests given as
+    # is_status(t, code) and is_open(t) for a task row t.
+    def add(t, sign):
+        return (
+            f"task_count = task_count {sign} 1, "
+            f"todo_count = todo_count {sign} ({is_status(t, 1)}), "
+            f"in_progress_count = in_progress_count {sign} ({is_status(t, 2)}), "
+            f"done_count = done_count {sign} ({is_status(t, 3)}), "
+            f"overdue_count = overdue_count {sign} ({is_open(t)} AND coalesce({t}.due_date < as_of, 0))"
+        )
+
+    next_due_after_insert = (
+        f"next_due_date = CASE WHEN {is_open('new')} AND new.due_date IS NOT NULL "
+        "AND (next_due_date IS NULL OR new.due_date < next_due_date) "
+        "THEN new.due_date ELSE next_due_date END"
+    )
+    next_due_after_delete = (
+        "next_due_date = CASE WHEN old.due_date = next_due_date THEN ("
+        "SELECT MIN(tasks.due_date) FROM tasks WHERE tasks.project_id = old.project_id "
+        f"AND {is_open('tasks')}) ELSE next_due_date END"
+    )
+    add_new = f"UPDATE project_stats SET {add('new', '+')}, {next_due_after_insert} WHERE project_id = new.project_id;"
+    remove_old = f"UPDATE project_stats SET {add('old', '-')}, {next_due_after_delete} WHERE project_id = old.project_id;"
+    op.execute(
+        "CREATE TRIGGER project_stats_project_ai AFTER INSERT ON projects BEGIN "
+        "INSERT OR IGNORE INTO project_stats (project_id, as_of) VALUES (new.id, date('now', 'localtime')); END"
+    )
+    op.execute(
+        "CREATE TRIGGER project_stats_project_ad AFTER DELETE ON projects BEGIN "
+        "DELETE FROM project_stats WHERE project_id = old.id; END"
+    )
+    op.execute(f"CREATE TRIGGER project_stats_task_ai AFTER INSERT ON tasks BEGIN {add_new} END")
+    op.execute(f"CREATE TRIGGER project_stats_task_ad AFTER DELETE ON tasks BEGIN {remove_old} END")
+    op.execute(
+        "CREATE TRIGGER project_stats_task_au AFTER UPDATE OF status, due_date, project_id ON tasks "
+        f"BEGIN {remove_old} {add_new} END"
+    )
+
+
+def _coded_status(t, code):
+    return f"{t}.status = {code}"
+
+
+def _coded_open(t):
+    return f"{t}.status <> 3"
+
+
+def _label_status(t, code):
+    return f"lower({t}.status) = '{TASK_STATUSES[code].lower()}'"
+
+
+def _label_open(t):
+    return f"lower({t}.status) <> 'done'"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _rebuild('projects', lambda name: _projects_table(name, coded=True), {
+        'priority': _to_code('priority', PRIORITIES, 2),
+        'status': _to_code('status', PROJECT_STATUSES, 1),
+    })
+    _rebuild('tasks', lambda name: _tasks_table(name, coded=True), {
+        'status': _to_code('status', TASK_STATUSES, 1),
+    })
+    _create_project_indexes()
+    # Every status filter is now an integer comparison. The partial indexes
+    # keep covering the open tasks for the deadline report; queries spell
+    # the predicate as Task.is_open() does, with the code as a literal.
+    _create_task_indexes('status <> 3')
+    for base in ('projects', 'tasks'):
+        _create_search_triggers(base)
+    _create_stats_triggers(_coded_status, _coded_open)
+
+    # Statuses that matched no label were counted as neither to do, in
+    # progress nor done; recount the projects that had any.
+    def count(code):
+        return (
+            "(SELECT count(*) FROM tasks WHERE tasks.project_id = project_stats.project_id "
+            f"AND {_coded_status('tasks', code)})"
+        )
+
+    op.execute(
+        f"UPDATE project_stats SET todo_count = {count(1)}, in_progress_count = {count(2)}, "
+        f"done_count = {count(3)} WHERE todo_count + in_progress_count + done_count <> task_count"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _rebuild('projects', lambda name: _projects_table(name, coded=False), {
+        'priority': _to_label('priority', PRIORITIES),
+        'status': _to_label('status', PROJECT_STATUSES),
+    })
+    _rebuild('tasks', lambda name: _tasks_table(name, coded=False), {
+        'status': _to_label('status', TASK_STATUSES),
+    })
+    _create_project_indexes()
+    _create_task_indexes("lower(status) <> 'done'")
+    for base in ('projects', 'tasks'):
+        _create_search_triggers(base)
+    _create_stats_triggers(_label_status, _label_open)
@@ -0,0 +1,102 @@
+"""Add project_stats table maintained by triggers
+
+Revision ID: d98d6b2eff9e
+Revises: 50808e27e82a
+Create Date: 2026-10-17 22:41:07.318254
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd98d6b2eff9e'
+down_revision: Union[str, None] = '50808e27e82a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+OPEN = "lower({t}.status) <> 'done'"
+
+
+def _add(t, sign):
+    return (
+        f"task_count = task_count {sign} 1, "
+        f"todo_count = todo_count {sign} (lower({t}.status) = 'to do'), "
+        f"in_progress_count = in_progress_count {sign} (lower({t}.status) = 'in progress'), "
+        f"done_count = done_count {sign} (lower({t}.status) = 'done'), "
+        f"overdue_count = overdue_count {sign} ({OPEN.format(t=t)} AND coalesce({t}.due_date < as_of, 0))"
+    )
+
+
+def _next_due_after_insert(t):
+    return (
+        f"next_due_date = CASE WHEN {OPEN.format(t=t)} AND {t}.due_date IS NOT NULL "
+        f"AND (next_due_date IS NULL OR {t}.due_date < next_due_date) "
+        f"THEN {t}.due_date ELSE next_due_date END"
+    )
+
+
+def _next_due_after_delete(t):
+    return (
+        f"next_due_date = CASE WHEN {t}.due_date = next_due_date THEN ("
+        f"SELECT MIN(tasks.due_date) FROM tasks WHERE tasks.project_id = {t}.project_id "
+        f"AND {OPEN.format(t='tasks')}) ELSE next_due_date END"
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'project_stats',
+        sa.Column('project_id', sa.Integer(), nullable=False),
+        sa.Column('task_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('todo_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('in_progress_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('done_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('overdue_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('next_due_date', sa.Date(), nullable=True),
+        sa.Column('as_of', sa.Date(), nullable=False),
+        sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('project_id'),
+    )
+
+    add_new = f"UPDATE project_stats SET {_add('new', '+')}, {_next_due_after_insert('new')} WHERE project_id = new.project_id;"
+    remove_old = f"UPDATE project_stats SET {_add('old', '-')}, {_next_due_after_delete('old')} WHERE project_id = old.project_id;"
+    op.execute(
+        "CREATE TRIGGER project_stats_project_ai AFTER INSERT ON projects BEGIN "
+        "INSERT OR IGNORE INTO project_stats (project_id, as_of) VALUES (new.id, date('now', 'localtime')); END"
+    )
+    op.execute(
+        "CREATE TRIGGER project_stats_project_ad AFTER DELETE ON projects BEGIN "
+        "DELETE FROM project_stats WHERE project_id = old.id; END"
+    )
+    op.execute(f"CREATE TRIGGER project_stats_task_ai AFTER INSERT ON tasks BEGIN {add_new} END")
+    op.execute(f"CREATE TRIGGER project_stats_task_ad AFTER DELETE ON tasks BEGIN {remove_old} END")
+    op.execute(
+        f"CREATE TRIGGER project_stats_task_au AFTER UPDATE OF status, due_date, project_id ON tasks "
+        f"BEGIN {remove_old} {add_new} END"
+    )
+
+    # Backfill from the existing tasks, with overdue counted as of today.
+    op.execute(
+        "INSERT INTO project_stats (project_id, task_count, todo_count, in_progress_count, done_count, "
+        "overdue_count, next_due_date, as_of) "
+        "SELECT projects.id, count(tasks.id), "
+        "count(CASE WHEN lower(tasks.status) = 'to do' THEN 1 END), "
+        "count(CASE WHEN lower(tasks.status) = 'in progress' THEN 1 END), "
+        "count(CASE WHEN lower(tasks.status) = 'done' THEN 1 END), "
+        f"count(CASE WHEN {OPEN.format(t='tasks')} AND tasks.due_date < date('now', 'localtime') THEN 1 END), "
+        f"min(CASE WHEN {OPEN.format(t='tasks')} THEN tasks.due_date END), "
+        "date('now', 'localtime') "
+        "FROM projects LEFT JOIN tasks ON tasks.project_id = projects.id "
+        "GROUP BY projects.id"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name in ('task_au', 'task_ad', 'task_ai', 'project_ad', 'project_ai'):
+        op.execute(f"DROP TRIGGER IF EXISTS project_stats_{name}")
+    op.drop_table('project_stats')
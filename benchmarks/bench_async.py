@@ -0,0 +1,157 @@
+# benchmarks/bench_async.py
+"""
+Requests per second of the async service API under concurrent load.
+
+    pipenv run python -m benchmarks.bench_async [--db bench.db] [--projects 1000 --tasks 100000 --users 500]
+                                                [--requests 2000] [--concurrency 1 4 16 64]
+
+Each request opens its own AsyncSession and makes one read through
+project_manager.async_services (a task page, a task by id, a project page or
+a user page, chosen at random). For every concurrency level that many
+clients share the request budget; the table shows throughput, p50/p95
+latency and the worst event-loop lag seen by a 1 ms ticker, which stays
+small while the reads run in aiosqlite's threads. The first row is the
+synchronous services doing the same requests one after another.
+
+Without --db a dataset is generated into a temporary file with
+benchmarks.datagen.
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import func, select
+from benchmarks.datagen import DEFAULT_SIZES, generate
+from project_manager.async_services import (
+    AsyncProjectService, AsyncSessionLocal, AsyncTaskService, AsyncUserService, create_async_sqlite_engine,
+)
+from project_manager.models import SessionLocal, create_sqlite_engine
+from project_manager.models.task import Task
+from project_manager.services import ProjectService, TaskService, UserService
+
+
+def build_requests(count, max_task, seed):
+    """[(service name, method, args)] for `count` random reads."""
+    rng = random.Random(seed)
+    kinds = [
+        lambda: ("task", "list", (), {"limit": 20}),
+        lambda: ("task", "get", (rng.randint(1, max_task),), {}),
+        lambda: ("project", "list", (), {"limit": 20}),
+        lambda: ("user", "list", (), {"limit": 20}),
+    ]
+    return [rng.choice(kinds)() for _ in range(count)]
+
+
+SYNC = {"task": TaskService, "project": ProjectService, "user": UserService}
+ASYNC = {"task": AsyncTaskService, "project": AsyncProjectService, "user": AsyncUserService}
+
+
+def _summary(latencies, seconds, lag=None):
+    ordered = sorted(latencies)
+    return {
+        "rps": len(ordered) / seconds,
+        "p50_ms": statistics.median(ordered) * 1000,
+        "p95_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000,
+        "lag_ms": lag * 1000 if lag is not None else None,
+    }
+
+
+def run_sync(requests):
+    latencies = []
+    started = time.perf_counter()
+    for service, method, args, kwargs in requests:
+        t = time.perf_counter()
+        with SessionLocal() as session:
+            getattr(SYNC[service](session), method)(*args, **kwargs)
+        latencies.append(time.perf_counter() - t)
+    return _summary(latencies, time.perf_counter() - started)
+
+
+async def run_async(requests, concurrency):
+    queue = list(reversed(requests))
+    latencies = []
+    lag = 0.0
+
+    async def ticker():
+        nonlocal lag
+        while True:
+            t = time.perf_counter()
+            await asyncio.sleep(0.001)
+            lag = max(lag, time.perf_counter() - t - 0.001)
+
+    async def client():
+        while queue:
+            service, method, args, kwargs = queue.pop()
+            t = time.perf_counter()
+            async with AsyncSessionLocal() as session:
+                await getattr(ASYNC[service](session), method)(*args, **kwargs)
+            latencies.append(time.perf_counter() - t)
+
+    tick = asyncio.create_task(ticker())
+    started = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    seconds = time.perf_counter() - started
+    tick.cancel()
+    return _summary(latencies, seconds, lag)
+
+
+async def run_levels(db_path, requests, levels):
+    engine = create_async_sqlite_engine(f"sqlite:///{os.path.abspath(db_path)}")
+    AsyncSessionLocal.configure(bind=engine)
+    await run_async(requests[:100], 4)  # open connections, warm the statement cache
+    results = {}
+    for level in levels:
+        results[level] = await run_async(requests, level)
+    await engine.dispose()
+    return results
+
+
+def _print_row(label, r):
+    lag = f"{r['lag_ms']:>10.1f}" if r["lag_ms"] is not None else f"{'-':>10}"
+    print(f"{label:<14}{r['rps']:>10,.0f}{r['p50_ms']:>10.2f}{r['p95_ms']:>10.2f}{lag}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--db", help="benchmark database; generated if it doesn't exist")
+    for name, default in DEFAULT_SIZES.items():
+        parser.add_argument(f"--{name}", type=int, default=default, help="rows to generate")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--requests", type=int, default=2000, help="requests per concurrency level")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16, 64])
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = args.db or os.path.join(tmp, "bench.db")
+        if not os.path.exists(db_path):
+            started = time.perf_counter()
+            seed_engine = create_sqlite_engine(f"sqlite:///{os.path.abspath(db_path)}", "bulk-load")
+            generate(seed_engine, args.projects, args.tasks, args.users, args.seed)
+            seed_engine.dispose()
+            print(f"Generated {db_path} in {time.perf_counter() - started:.1f}s")
+
+        engine = create_sqlite_engine(f"sqlite:///{os.path.abspath(db_path)}")
+        SessionLocal.configure(bind=engine)
+        with SessionLocal() as session:
+            max_task = session.execute(select(func.max(Task.id))).scalar() or 1
+        requests = build_requests(args.requests, max_task, args.seed)
+
+        print(f"\n{'clients':<14}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'lag ms':>10}")
+        print("-" * 54)
+        _print_row("sync, 1", run_sync(requests))
+        engine.dispose()
+        for level, result in asyncio.run(run_levels(db_path, requests, args.concurrency)).items():
+            _print_row(f"async, {level}", result)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,229 @@
+# benchmarks/bench_helpers.py
+"""
+Latency and memory of every helper's query and render path at scale.
+
+    pipenv run python -m benchmarks.bench_helpers [--db bench.db] [--projects 10000 --tasks 1000000 --users 5000]
+                                                  [--repeat 50] [--out results.json] [--compare old.json]
+
+Each case calls the real helper from project_manager.helpers with scripted
+answers to its prompts and its output captured, so the time covers the
+queries, the ORM/row handling and the printing. Cases are repeated with
+seeded random ids/names and reported as p50/p95 latency; one more traced run
+gives the peak Python memory. Results are written as JSON (by default to
+benchmarks/results/helpers-<commit>.json) so runs can be compared with
+--compare.
+
+Without --db a dataset is generated into a temporary file with
+benchmarks.datagen. An existing --db is reused; delete_project removes a few
+projects from it on every run.
+"""
+
+import argparse
+import builtins
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import sqlalchemy
+from sqlalchemy import func, select
+from benchmarks.datagen import DEFAULT_SIZES, generate
+from project_manager import helpers
+from project_manager.models import SessionLocal, create_sqlite_engine
+from project_manager.models.project import Project
+from project_manager.models.task import Task
+from project_manager.models.user import User
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+
+def _sample_names(conn, column, rng, count=20):
+    """A few real names, cut down to their first word, for the search cases."""
+    names = conn.execute(select(column).order_by(column).limit(500)).scalars().all()
+    return [name.split()[0] for name in rng.sample(names, min(count, len(names)))]
+
+
+def build_cases(conn, rng):
+    """
+    {case name: (helper, function returning that run's input answers)}.
+    Ids are picked uniformly from 1..max(id); delete_project takes existing
+    projects in random order.
+    """
+    max_project = conn.execute(select(func.max(Project.id))).scalar() or 1
+    max_task = conn.execute(select(func.max(Task.id))).scalar() or 1
+    max_user = conn.execute(select(func.max(User.id))).scalar() or 1
+    project_words = _sample_names(conn, Project.name, rng)
+    task_words = _sample_names(conn, Task.name, rng)
+    user_words = _sample_names(conn, User.name, rng)
+    deletable = conn.execute(select(Project.id)).scalars().all()
+    rng.shuffle(deletable)
+
+    return {
+        "list_projects": (helpers.list_projects, lambda: ["q"]),
+        "list_tasks": (helpers.list_tasks, lambda: ["q"]),
+        "list_users": (helpers.list_users, lambda: ["q"]),
+        "find_project (id)": (helpers.find_project, lambda: [str(rng.randint(1, max_project))]),
+        "find_project (name)": (helpers.find_project, lambda: [rng.choice(project_words), "q"]),
+        "find_task (id)": (helpers.find_task, lambda: [str(rng.randint(1, max_task))]),
+        "find_task (name)": (helpers.find_task, lambda: [rng.choice(task_words), "q"]),
+        "find_user (id)": (helpers.find_user, lambda: [str(rng.randint(1, max_user))]),
+        "find_user (name)": (helpers.find_user, lambda: [rng.choice(user_words), "q"]),
+        "view_project_tasks": (helpers.view_project_tasks, lambda: [str(rng.randint(1, max_project))]),
+        "delete_project": (helpers.delete_project, lambda: [str(deletable.pop()), "y"]),
+    }
+
+
+def call_helper(helper, answers):
+    """Run a helper with scripted input; returns what it printed."""
+    answers = iter(answers)
+    out = io.StringIO()
+    original_input = builtins.input
+    builtins.input = lambda prompt="": next(answers, "q")
+    try:
+        with contextlib.redirect_stdout(out):
+            helper()
+    finally:
+        builtins.input = original_input
+    text = out.getvalue()
+    if "❌ Error" in text:
+        raise RuntimeError(f"{helper.__name__} failed: {text.strip().splitlines()[-1]}")
+    return text
+
+
+def bench_case(helper, answers, repeat):
+    timings = []
+    for _ in range(repeat):
+        script = answers()
+        started = time.perf_counter()
+        call_helper(helper, script)
+        timings.append((time.perf_counter() - started) * 1000)
+
+    tracemalloc.start()
+    try:
+        call_helper(helper, answers())
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    ordered = sorted(timings)
+    return {
+        "runs": repeat,
+        "p50_ms": round(statistics.median(ordered), 3),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 3),
+        "max_ms": round(ordered[-1], 3),
+        "peak_kib": round(peak / 1024, 1),
+    }
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def run_benchmarks(db_path, repeat, seed, cases=None):
+    engine = create_sqlite_engine(f"sqlite:///{os.path.abspath(db_path)}")
+    SessionLocal.configure(bind=engine)
+    rng = random.Random(seed)
+    with engine.connect() as conn:
+        sizes = {
+            "projects": conn.execute(select(func.count(Project.id))).scalar(),
+            "tasks": conn.execute(select(func.count(Task.id))).scalar(),
+            "users": conn.execute(select(func.count(User.id))).scalar(),
+        }
+        all_cases = build_cases(conn, rng)
+
+    results = {}
+    for name, (helper, answers) in all_cases.items():
+        if cases and not any(name.startswith(c) for c in cases):
+            continue
+        call_helper(helper, answers())  # warm the page cache and statement cache
+        results[name] = bench_case(helper, answers, repeat)
+        print(
+            f"{name:<22}{results[name]['p50_ms']:>10.2f}{results[name]['p95_ms']:>10.2f}"
+            f"{results[name]['peak_kib']:>12,.0f}"
+        )
+    engine.dispose()
+    return sizes, results
+
+
+def print_comparison(results, baseline_path):
+    with open(baseline_path, encoding="utf-8") as fh:
+        baseline = json.load(fh)
+    print(f"\nCompared with {baseline.get('commit', '?')} ({baseline_path}):")
+    print(f"{'case':<22}{'p50 Δ%':>10}{'p95 Δ%':>10}{'peak Δ%':>12}")
+    for name, now in results.items():
+        before = baseline["results"].get(name)
+        if not before:
+            continue
+        deltas = [
+            (now[k] - before[k]) / before[k] * 100 if before[k] else 0.0
+            for k in ("p50_ms", "p95_ms", "peak_kib")
+        ]
+        print(f"{name:<22}{deltas[0]:>+10.1f}{deltas[1]:>+10.1f}{deltas[2]:>+12.1f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--db", help="benchmark database; generated if it doesn't exist")
+    for name, default in DEFAULT_SIZES.items():
+        parser.add_argument(f"--{name}", type=int, default=default, help="rows to generate")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=50, help="timed runs per case")
+    parser.add_argument("--case", action="append", help="only run cases starting with this (repeatable)")
+    parser.add_argument("--out", help="results file (default benchmarks/results/helpers-<commit>.json)")
+    parser.add_argument("--compare", help="earlier results file to compare against")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = args.db or os.path.join(tmp, "bench.db")
+        if not os.path.exists(db_path):
+            started = time.perf_counter()
+            seed_engine = create_sqlite_engine(f"sqlite:///{os.path.abspath(db_path)}", "bulk-load")
+            generate(seed_engine, args.projects, args.tasks, args.users, args.seed)
+            seed_engine.dispose()
+            print(f"Generated {db_path} in {time.perf_counter() - started:.1f}s")
+
+        print(f"\n{'case':<22}{'p50 ms':>10}{'p95 ms':>10}{'peak KiB':>12}")
+        print("-" * 54)
+        sizes, results = run_benchmarks(db_path, args.repeat, args.seed, args.case)
+
+    commit = _git_commit()
+    report = {
+        "commit": commit,
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "sqlalchemy": sqlalchemy.__version__,
+        "sqlite": sqlite3.sqlite_version,
+        "dataset": {**sizes, "seed": args.seed},
+        "results": results,
+    }
+    out = args.out or os.path.join(RESULTS_DIR, f"helpers-{commit}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    with open(out, "w", encoding="utf-8") as fh:
+        json.dump(report, fh, indent=2)
+    print(f"\n✅ Results written to {out}")
+
+    if args.compare:
+        print_comparison(results, args.compare)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,153 @@
+# benchmarks/bench_services.py
+"""
+Throughput and memory of the service layer against the ORM path it replaces.
+
+    pipenv run python -m benchmarks.bench_services [--db bench.db] [--projects 1000 --tasks 100000 --users 500]
+                                                   [--repeat 10] [--batch 500]
+
+Each case does the same work twice: once loading ORM entities (with the
+listing loader profile, so related rows come in one extra query rather than
+lazily) and once through project_manager.services, which builds slotted
+dataclasses from Core selects. Every run uses a fresh session, so identity
+map and change-tracking costs are included; the peak is the Python memory
+held while the result is still alive. Updates are rolled back after each run.
+
+Without --db a dataset is generated into a temporary file with
+benchmarks.datagen.
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import func, select
+from benchmarks.datagen import DEFAULT_SIZES, generate
+from project_manager.models import SessionLocal, create_sqlite_engine
+from project_manager.models.loading import loader_options
+from project_manager.models.project import Project
+from project_manager.models.task import Task
+from project_manager.models.user import User
+from project_manager.services import ProjectService, TaskService, UserService
+
+
+def build_cases(session, rng, batch):
+    """
+    {case: (orm, service)}: pairs of functions of a session returning the
+    rows they produced. Ids for the batch cases are drawn afresh per run.
+    """
+    max_task = session.execute(select(func.max(Task.id))).scalar() or 1
+
+    def ids():
+        return rng.sample(range(1, max_task + 1), min(batch, max_task))
+
+    def tasks_orm(session, limit=None):
+        stmt = select(Task).options(*loader_options(Task, "listing")).order_by(Task.due_date, Task.id)
+        return session.scalars(stmt if limit is None else stmt.limit(limit)).all()
+
+    def update_orm(session):
+        tasks = session.scalars(select(Task).where(Task.id.in_(ids()))).all()
+        for task in tasks:
+            task.status = "Done"
+        session.flush()
+        return len(tasks)
+
+    return {
+        "list all tasks": (tasks_orm, lambda s: TaskService(s).list(limit=None)),
+        "task page (50)": (lambda s: tasks_orm(s, 50), lambda s: TaskService(s).list(limit=50)),
+        "list all projects": (
+            lambda s: s.scalars(select(Project).options(*loader_options(Project, "listing"))
+                                .order_by(Project.deadline, Project.id)).all(),
+            lambda s: ProjectService(s).list(limit=None),
+        ),
+        "list all users": (
+            lambda s: s.scalars(select(User).order_by(User.name, User.id)).all(),
+            lambda s: UserService(s).list(limit=None),
+        ),
+        f"get {batch} tasks": (
+            lambda s: s.scalars(select(Task).options(*loader_options(Task, "listing"))
+                                .where(Task.id.in_(ids()))).all(),
+            lambda s: TaskService(s).get_many(ids()),
+        ),
+        f"update {batch} tasks": (update_orm, lambda s: TaskService(s).update_many(ids(), status="Done")),
+    }
+
+
+def _run(fn):
+    with SessionLocal() as session:
+        result = fn(session)
+        session.rollback()
+    return result
+
+
+def bench(fn, repeat):
+    """(p50 ms, rows per second, peak KiB) over `repeat` runs of fn(session)."""
+    timings, rows = [], 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = _run(fn)
+        timings.append(time.perf_counter() - started)
+        rows = result if isinstance(result, int) else len(result)
+
+    tracemalloc.start()
+    try:
+        with SessionLocal() as session:
+            result = fn(session)
+            _, peak = tracemalloc.get_traced_memory()
+            session.rollback()
+    finally:
+        tracemalloc.stop()
+    p50 = statistics.median(timings)
+    return p50 * 1000, rows / p50 if p50 else 0.0, peak / 1024
+
+
+def run_benchmarks(db_path, repeat, batch, seed):
+    engine = create_sqlite_engine(f"sqlite:///{os.path.abspath(db_path)}")
+    SessionLocal.configure(bind=engine)
+    rng = random.Random(seed)
+    with SessionLocal() as session:
+        cases = build_cases(session, rng, batch)
+
+    print(f"\n{'case':<20}{'path':<9}{'p50 ms':>10}{'rows/s':>12}{'peak KiB':>12}")
+    print("-" * 63)
+    for name, (orm, service) in cases.items():
+        _run(orm), _run(service)  # warm the page cache and statement cache
+        measured = {path: bench(fn, repeat) for path, fn in (("orm", orm), ("service", service))}
+        for path, (p50, rate, peak) in measured.items():
+            print(f"{name if path == 'orm' else '':<20}{path:<9}{p50:>10.2f}{rate:>12,.0f}{peak:>12,.0f}")
+        (orm_ms, _, orm_kib), (svc_ms, _, svc_kib) = measured["orm"], measured["service"]
+        print(f"{'':<20}{'Δ%':<9}{(svc_ms - orm_ms) / orm_ms * 100:>+10.1f}{'':>12}"
+              f"{(svc_kib - orm_kib) / orm_kib * 100 if orm_kib else 0.0:>+12.1f}")
+    engine.dispose()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--db", help="benchmark database; generated if it doesn't exist")
+    for name, default in DEFAULT_SIZES.items():
+        parser.add_argument(f"--{name}", type=int, default=default, help="rows to generate")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=10, help="timed runs per case and path")
+    parser.add_argument("--batch", type=int, default=500, help="ids per get_many/update_many case")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = args.db or os.path.join(tmp, "bench.db")
+        if not os.path.exists(db_path):
+            started = time.perf_counter()
+            seed_engine = create_sqlite_engine(f"sqlite:///{os.path.abspath(db_path)}", "bulk-load")
+            generate(seed_engine, args.projects, args.tasks, args.users, args.seed)
+            seed_engine.dispose()
+            print(f"Generated {db_path} in {time.perf_counter() - started:.1f}s")
+        run_benchmarks(db_path, args.repeat, args.batch, args.seed)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+# benchmarks/bench_sqlite_profiles.py
+"""
+Write and read throughput of each SQLite profile in project_manager.models.
+
+    pipenv run python -m benchmarks.bench_sqlite_profiles [--rows 50000] [--commits 500]
+
+Every profile gets its own fresh database file with the full schema
+(indexes and search triggers included) so the numbers reflect real writes.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import insert, select
+from project_manager.models import Base, SQLITE_PROFILES, create_sqlite_engine
+from project_manager.models.project import Project
+from project_manager.models.task import Task
+from project_manager.models.user import User
+import project_manager.models.search
+from project_manager.pagination import keyset_predicate
+from project_manager.queries import task_listing_select
+
+
+def _task_rows(count, project_id, start=0):
+    today = date.today()
+    return [
+        {
+            "name": f"Task {i}",
+            "description": f"Benchmark task number {i}",
+            "status": ("To Do", "In Progress", "Done")[i % 3],
+            "due_date": today + timedelta(days=i % 365),
+            "project_id": project_id,
+        }
+        for i in range(start, start + count)
+    ]
+
+
+def bench_profile(profile, rows, commits, batch_size=5000):
+    """Return {metric: rows per second} for one profile."""
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_sqlite_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}", profile)
+        Base.metadata.create_all(engine)
+        with engine.begin() as conn:
+            project_id = conn.execute(
+                insert(Project).values(
+                    name="Benchmark", start_date=date.today(),
+                    deadline=date.today() + timedelta(days=400),
+                    priority="Medium", status="Active",
+                )
+            ).inserted_primary_key[0]
+            conn.execute(insert(User).values(name="Bench", email="bench@example.com"))
+
+        results = {}
+
+        # One transaction (and one fsync) per row, like the interactive helpers.
+        started = time.perf_counter()
+        for row in _task_rows(commits, project_id):
+            with engine.begin() as conn:
+                conn.execute(insert(Task), row)
+        results["single-row commits/s"] = commits / (time.perf_counter() - started)
+
+        # Large executemany batches, like a bulk import.
+        started = time.perf_counter()
+        for offset in range(0, rows, batch_size):
+            with engine.begin() as conn:
+                conn.execute(insert(Task), _task_rows(min(batch_size, rows - offset), project_id, offset))
+        results["batched inserts/s"] = rows / (time.perf_counter() - started)
+
+        # Walk the whole task listing page by page.
+        read = 0
+        started = time.perf_counter()
+        with engine.connect() as conn:
+            key = None
+            while True:
+                page = conn.execute(
+                    task_listing_select(keyset_predicate(Task.due_date, Task.id, key), limit=100)
+                ).all()
+                if not page:
+                    break
+                read += len(page)
+                key = (page[-1].due_date, page[-1].id)
+        results["listing rows read/s"] = read / (time.perf_counter() - started)
+
+        # Random point lookups by primary key.
+        lookups = min(rows, 5000)
+        started = time.perf_counter()
+        with engine.connect() as conn:
+            for task_id in range(1, lookups + 1):
+                conn.execute(select(Task.name).where(Task.id == (task_id * 7919) % rows + 1)).one()
+        results["point lookups/s"] = lookups / (time.perf_counter() - started)
+
+        engine.dispose()
+        return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50000, help="rows for the batched insert test")
+    parser.add_argument("--commits", type=int, default=500, help="rows for the one-commit-per-row test")
+    parser.add_argument("--profile", action="append", choices=list(SQLITE_PROFILES),
+                        help="profile to run (repeatable; default all)")
+    args = parser.parse_args(argv)
+
+    profiles = args.profile or list(SQLITE_PROFILES)
+    table = {profile: bench_profile(profile, args.rows, args.commits) for profile in profiles}
+
+    metrics = list(next(iter(table.values())))
+    print(f"\n{'metric':<24}" + "".join(f"{p:>14}" for p in profiles))
+    print("-" * (24 + 14 * len(profiles)))
+    for metric in metrics:
+        print(f"{metric:<24}" + "".join(f"{table[p][metric]:>14,.0f}" for p in profiles))
+
+
+if __name__ == "__main__":
+    main()
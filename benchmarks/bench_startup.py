@@ -0,0 +1,91 @@
+# benchmarks/bench_startup.py
+"""
+Startup cost of the CLI, checked against a time budget.
+
+    pipenv run python -m benchmarks.bench_startup [--runs 5] [--import-budget-ms 600] [--command-budget-ms 1000]
+
+Measures, in fresh interpreters, the `-X importtime` cumulative time of
+project_manager.cli and the wall-clock time of a scripted `cli.py user list`
+against a scratch database (the first launch, which creates the schema, is
+reported separately). Exits with status 1 when a median is over budget, so
+it can gate a CI job.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+CLI = os.path.join(ROOT_DIR, "project_manager", "cli.py")
+
+
+def import_times(module="project_manager.cli"):
+    """{module: cumulative µs} for `module` and its direct imports, in one fresh interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT_DIR, capture_output=True, text=True, check=True,
+    )
+    # Lines come children-first, indented two spaces per level below " name".
+    children = {}
+    for line in result.stderr.splitlines():
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue
+        cumulative, name = int(fields[1]), fields[2]
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        if depth == 1:
+            children[name.strip()] = cumulative
+        elif depth == 0:
+            if name.strip() == module:
+                return {module: cumulative, **children}
+            children = {}
+    raise RuntimeError(f"{module} did not show up in the -X importtime output")
+
+
+def command_ms(args, env):
+    started = time.perf_counter()
+    subprocess.run([sys.executable, CLI, *args], cwd=ROOT_DIR, env=env, check=True,
+                   stdout=subprocess.DEVNULL)
+    return (time.perf_counter() - started) * 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="interpreters to start per measurement")
+    parser.add_argument("--import-budget-ms", type=float, default=600)
+    parser.add_argument("--command-budget-ms", type=float, default=1000)
+    args = parser.parse_args(argv)
+
+    runs = [import_times() for _ in range(args.runs)]
+    import_ms = statistics.median(r["project_manager.cli"] for r in runs) / 1000
+    print(f"\nimport project_manager.cli: {import_ms:.0f} ms (median of {args.runs})")
+    slowest = sorted(runs[-1].items(), key=lambda item: item[1], reverse=True)
+    for name, micros in slowest[1:8]:
+        print(f"   {name:<32}{micros / 1000:>8.1f} ms")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = {**os.environ, "PM_DATABASE_URL": f"sqlite:///{os.path.join(tmp, 'startup.db')}"}
+        first_ms = command_ms(["user", "list"], env)
+        warm = [command_ms(["user", "list"], env) for _ in range(args.runs)]
+    warm_ms = statistics.median(warm)
+    print(f"cli.py user list, first launch: {first_ms:.0f} ms")
+    print(f"cli.py user list: {warm_ms:.0f} ms (median of {args.runs})")
+
+    over = []
+    if import_ms > args.import_budget_ms:
+        over.append(f"import {import_ms:.0f} ms > {args.import_budget_ms:.0f} ms")
+    if warm_ms > args.command_budget_ms:
+        over.append(f"command {warm_ms:.0f} ms > {args.command_budget_ms:.0f} ms")
+    if over:
+        print(f"❌ Over budget: {'; '.join(over)}")
+        return 1
+    print("✅ Within budget.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,138 @@
+# benchmarks/datagen.py
+"""
+Seeded synthetic dataset for benchmarks.
+
+    pipenv run python -m benchmarks.datagen bench.db --projects 10000 --tasks 1000000 --users 5000 [--seed 42]
+
+The same seed and sizes always give the same rows. Distributions aim to look
+like a real team's database: project start dates over the last two years
+with one to twelve month durations, mostly Medium priority, older projects
+mostly Completed; tasks skewed towards a minority of large projects, due
+dates inside their project's window (some without one), statuses that depend
+on whether the due date has passed, and about one task in six unassigned.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import date, timedelta
+from itertools import islice
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import insert
+from project_manager.models import create_sqlite_engine
+from project_manager.models.enums import Priority, ProjectStatus, TaskStatus
+from project_manager.models.project import Project
+from project_manager.models.task import Task
+from project_manager.models.user import User
+from project_manager.schema import ensure_schema
+
+DEFAULT_SIZES = {"projects": 1000, "tasks": 100000, "users": 500}
+CHUNK_SIZE = 5000
+
+FIRST_NAMES = ("Enock", "Victor", "Erick", "Zawadi", "Amina", "Brian", "Wanjiru", "Otieno", "Faith", "Kevin")
+LAST_NAMES = ("Orir", "Mwangi", "Kamau", "Achieng", "Njoroge", "Wafula", "Chebet", "Mutua", "Kiprop", "Atieno")
+WORDS = (
+    "POS", "inventory", "billing", "onboarding", "dashboard", "API", "mobile", "reporting",
+    "payments", "search", "migration", "audit", "portal", "analytics", "checkout", "sync",
+)
+TASK_VERBS = ("Prototype", "Design", "Develop", "Test", "Document", "Deploy", "Review", "Refactor", "Fix")
+
+
+def _project_rows(rng, count, today):
+    for i in range(1, count + 1):
+        start = today - timedelta(days=rng.randint(0, 730))
+        deadline = start + timedelta(days=rng.randint(30, 365))
+        finished = deadline < today and rng.random() < 0.8
+        yield {
+            "name": f"{rng.choice(WORDS).title()} {rng.choice(WORDS)} {i}",
+            "description": f"{rng.choice(WORDS).title()} and {rng.choice(WORDS)} work for team {i % 97}",
+            "start_date": start,
+            "deadline": deadline,
+            "priority": rng.choices((Priority.HIGH, Priority.MEDIUM, Priority.LOW), (2, 5, 3))[0],
+            "status": ProjectStatus.COMPLETED if finished else ProjectStatus.ACTIVE,
+        }
+
+
+def _user_rows(rng, count):
+    for i in range(1, count + 1):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        yield {"name": f"{first} {last} {i}", "email": f"{first}.{last}.{i}@example.com".lower()}
+
+
+def _task_rows(rng, count, projects, users, today):
+    """`projects` is a list of (id, start_date, deadline); ids are 1-based positions."""
+    for i in range(1, count + 1):
+        # Squaring a uniform draw piles the tasks onto the lower project ids.
+        project_id, start, deadline = projects[int(len(projects) * rng.random() ** 2)]
+        due = None
+        if rng.random() < 0.9:
+            due = start + timedelta(days=rng.randint(0, (deadline - start).days))
+        if due is not None and due < today:
+            status = rng.choices((TaskStatus.DONE, TaskStatus.IN_PROGRESS, TaskStatus.TODO), (7, 2, 1))[0]
+        else:
+            status = rng.choices((TaskStatus.TODO, TaskStatus.IN_PROGRESS, TaskStatus.DONE), (6, 3, 1))[0]
+        yield {
+            "name": f"{rng.choice(TASK_VERBS)} {rng.choice(WORDS)} {i}",
+            "description": f"{rng.choice(TASK_VERBS)} the {rng.choice(WORDS)} {rng.choice(WORDS)}",
+            "status": status,
+            "due_date": due,
+            "project_id": project_id,
+            "user_id": rng.randint(1, users) if users and rng.random() < 0.85 else None,
+        }
+
+
+def _insert_chunks(conn, model, rows):
+    while True:
+        chunk = list(islice(rows, CHUNK_SIZE))
+        if not chunk:
+            return
+        conn.execute(insert(model), chunk)
+
+
+def generate(bind, projects=DEFAULT_SIZES["projects"], tasks=DEFAULT_SIZES["tasks"],
+             users=DEFAULT_SIZES["users"], seed=42, today=None):
+    """
+    Fill an empty database with the given numbers of rows. Ids come out as
+    1..N per table, which the benchmarks rely on to pick rows at random.
+    """
+    if projects < 1 and tasks:
+        raise ValueError("Tasks need at least one project.")
+    rng = random.Random(seed)
+    today = today or date.today()
+    ensure_schema(bind)
+    with bind.begin() as conn:
+        project_rows = list(_project_rows(rng, projects, today))
+        _insert_chunks(conn, Project, iter(project_rows))
+        _insert_chunks(conn, User, _user_rows(rng, users))
+        windows = [(i, p["start_date"], p["deadline"]) for i, p in enumerate(project_rows, 1)]
+        _insert_chunks(conn, Task, _task_rows(rng, tasks, windows, users, today))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("path", help="SQLite file to create (must not exist)")
+    for name, default in DEFAULT_SIZES.items():
+        parser.add_argument(f"--{name}", type=int, default=default)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    if os.path.exists(args.path):
+        print(f"❌ {args.path} already exists.")
+        return 1
+    engine = create_sqlite_engine(f"sqlite:///{os.path.abspath(args.path)}", "bulk-load")
+    started = time.perf_counter()
+    generate(engine, args.projects, args.tasks, args.users, args.seed)
+    engine.dispose()
+    print(
+        f"✅ Generated {args.projects} projects, {args.tasks} tasks and {args.users} users "
+        f"in {time.perf_counter() - started:.1f}s (seed {args.seed})."
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
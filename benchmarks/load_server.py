@@ -0,0 +1,163 @@
+# benchmarks/load_server.py
+"""
+Load test for the JSON HTTP server (cli.py serve) on localhost.
+
+    pipenv run python -m benchmarks.load_server [--db bench.db] [--clients 16] [--seconds 10]
+                                                [--write-ratio 0.1] [--url http://127.0.0.1:8000]
+
+Without --url a server is started on --db (generated with benchmarks.datagen
+if it doesn't exist) in a separate process and stopped afterwards. Each
+client thread keeps one HTTP/1.1 connection open and loops over a mix of
+listing pages (revalidated with If-None-Match, so unchanged pages come back
+304), single-task reads and, with probability --write-ratio, task status
+updates. Reports requests/sec, latency percentiles and the status codes seen.
+"""
+
+import argparse
+import http.client
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from urllib.parse import urlsplit
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.datagen import DEFAULT_SIZES, generate
+from project_manager.models import create_sqlite_engine
+
+CLI = os.path.join(os.path.dirname(__file__), "..", "project_manager", "cli.py")
+LISTINGS = ["/projects?limit=20", "/tasks?limit=20", "/users?limit=20"]
+
+
+def start_server(db_path, port, readers):
+    env = {**os.environ, "PM_DATABASE_URL": f"sqlite:///{os.path.abspath(db_path)}"}
+    process = subprocess.Popen(
+        [sys.executable, CLI, "serve", "--port", str(port), "--readers", str(readers)],
+        env=env, stdout=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            conn.request("GET", "/users?limit=1")
+            conn.getresponse().read()
+            return process
+        except OSError:
+            if process.poll() is not None:
+                raise RuntimeError("Server exited during startup.")
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError("Server did not start within 30s.")
+
+
+def client(host, port, stop_at, write_ratio, max_task, seed, latencies, statuses):
+    rng = random.Random(seed)
+    etags = {}
+    conn = http.client.HTTPConnection(host, port, timeout=30)
+    while time.perf_counter() < stop_at:
+        roll = rng.random()
+        headers, body = {}, None
+        if roll < write_ratio:
+            method, path = "PATCH", f"/tasks/{rng.randint(1, max_task)}"
+            body = json.dumps({"status": rng.choice(["To Do", "In Progress", "Done"])})
+            headers["Content-Type"] = "application/json"
+        elif roll < write_ratio + (1 - write_ratio) * 0.7:
+            method, path = "GET", rng.choice(LISTINGS)
+            if path in etags:
+                headers["If-None-Match"] = etags[path]
+        else:
+            method, path = "GET", f"/tasks/{rng.randint(1, max_task)}"
+        started = time.perf_counter()
+        try:
+            conn.request(method, path, body=body, headers=headers)
+            response = conn.getresponse()
+            response.read()
+        except (OSError, http.client.HTTPException):
+            statuses["error"] += 1
+            conn.close()
+            conn = http.client.HTTPConnection(host, port, timeout=30)
+            continue
+        latencies.append(time.perf_counter() - started)
+        statuses[response.status] += 1
+        if method == "GET" and response.getheader("ETag"):
+            etags[path] = response.getheader("ETag")
+    conn.close()
+
+
+def run_load(url, clients, seconds, write_ratio, max_task, seed):
+    parts = urlsplit(url)
+    latencies, statuses = [], Counter()
+    stop_at = time.perf_counter() + seconds
+    threads = [
+        threading.Thread(
+            target=client,
+            args=(parts.hostname, parts.port or 80, stop_at, write_ratio, max_task, seed + i, latencies, statuses),
+        )
+        for i in range(clients)
+    ]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    ordered = sorted(latencies)
+
+    def pct(p):
+        return ordered[min(len(ordered) - 1, int(len(ordered) * p))] * 1000 if ordered else 0.0
+
+    print(f"\n{clients} clients for {elapsed:.1f}s against {url}")
+    print(f"   {len(ordered) / elapsed:,.0f} req/s, {len(ordered)} requests")
+    if ordered:
+        print(f"   latency p50 {statistics.median(ordered) * 1000:.2f} ms, p95 {pct(0.95):.2f} ms, p99 {pct(0.99):.2f} ms")
+    print("   status: " + ", ".join(f"{code}: {n}" for code, n in sorted(statuses.items(), key=str)))
+    return statuses
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--url", help="server to test; default: start one on --db")
+    parser.add_argument("--db", help="database for the started server; generated if it doesn't exist")
+    for name, default in DEFAULT_SIZES.items():
+        parser.add_argument(f"--{name}", type=int, default=default, help="rows to generate")
+    parser.add_argument("--port", type=int, default=8765, help="port for the started server")
+    parser.add_argument("--readers", type=int, default=4, help="reader connections for the started server")
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--write-ratio", type=float, default=0.1, help="share of requests that update a task")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        server = None
+        url = args.url
+        max_task = args.tasks
+        if not url:
+            db_path = args.db or os.path.join(tmp, "bench.db")
+            if not os.path.exists(db_path):
+                started = time.perf_counter()
+                seed_engine = create_sqlite_engine(f"sqlite:///{os.path.abspath(db_path)}", "bulk-load")
+                generate(seed_engine, args.projects, args.tasks, args.users, args.seed)
+                seed_engine.dispose()
+                print(f"Generated {db_path} in {time.perf_counter() - started:.1f}s")
+            server = start_server(db_path, args.port, args.readers)
+            url = f"http://127.0.0.1:{args.port}"
+        try:
+            statuses = run_load(url, args.clients, args.seconds, args.write_ratio, max_task, args.seed)
+        finally:
+            if server:
+                server.terminate()
+                server.wait()
+    return 1 if statuses["error"] or any(isinstance(c, int) and c >= 500 for c in statuses) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
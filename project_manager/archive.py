@@ -0,0 +1,434 @@
+# project_manager/archive.py
+"""
+Cold storage for completed projects.
+
+archive_projects() moves completed projects whose deadline is more than N
+days past, with their tasks, out of the hot tables into a second SQLite
+file next to the database (db/database.db -> db/database.archive.db, one
+per workspace). Listings, searches and reports then never read them. The
+archive is ATTACHed to the connection as `archive`, so rows are copied by
+INSERT ... SELECT without passing through Python.
+
+Projects move CHUNK at a time. SQLite in WAL mode commits each attached
+file atomically but not the two together, so a chunk moves in a few
+transactions of one file each, with its project ids written to a move
+journal (archive.moves) under a batch number. The transaction that writes
+the hot side of a move also sets the hot database's PRAGMA user_version to
+that batch, which tells the two halves apart after a crash:
+
+    archive: copy into the archive + journal | delete hot rows + user_version | clear journal
+    restore: journal | copy into the hot tables + user_version | delete archived rows + clear journal
+
+Every run first finishes the batches an interrupted run left in the
+journal, oldest first, so rows are never matched up by id or name.
+
+IDs are kept where they are free. SQLite may hand an archived project's
+id (or task id) to a new row, so on the way in either direction an id that
+is already taken gets a new one above every id in both files.
+
+attach_archive() also creates two TEMP views over both files, all_projects
+and all_tasks, with an `archived` flag; `--include-archived` listings read
+them. Tasks of archived projects keep their user_id; a user deleted in the
+meantime is unassigned when the project is restored.
+"""
+
+import os
+from datetime import date, timedelta
+
+from sqlalchemy import Boolean, Column, Date, Index, Integer, MetaData, String, Table, insert, select
+from project_manager.cache import database_path, invalidate_lookups
+from project_manager.models.enums import CodedEnumType, Priority, ProjectStatus, TaskStatus
+from project_manager.models.project import Project, completion_percentage_expr
+from project_manager.models.user import User
+
+# Projects moved per pair of transactions.
+CHUNK = 100
+
+PROJECT_COLUMNS = ("name", "description", "start_date", "deadline", "priority", "status")
+COUNT_COLUMNS = ("task_count", "todo_count", "in_progress_count", "done_count")
+TASK_COLUMNS = ("name", "description", "status", "due_date")
+
+# ─── Archive Tables ──────────────────────────────────────────────────────────
+# The archived rows as they were, plus each project's final task counts (its
+# project_stats row is deleted with it) and the day it was archived. No
+# foreign keys: users stay in the hot database.
+
+archive_metadata = MetaData(schema="archive")
+
+archived_projects = Table(
+    "projects", archive_metadata,
+    Column("id", Integer, primary_key=True),
+    Column("name", String, nullable=False),
+    Column("description", String),
+    Column("start_date", Date, nullable=False),
+    Column("deadline", Date, nullable=False),
+    Column("priority", CodedEnumType(Priority), nullable=False),
+    Column("status", CodedEnumType(ProjectStatus), nullable=False),
+    *(Column(name, Integer, nullable=False, default=0) for name in COUNT_COLUMNS),
+    Column("archived_on", Date, nullable=False),
+    Index("ix_archive_projects_name", "name"),
+)
+
+archived_tasks = Table(
+    "tasks", archive_metadata,
+    Column("id", Integer, primary_key=True),
+    Column("name", String, nullable=False),
+    Column("description", String),
+    Column("status", CodedEnumType(TaskStatus), nullable=False),
+    Column("due_date", Date),
+    Column("project_id", Integer, nullable=False),
+    Column("user_id", Integer),
+    Index("ix_archive_tasks_project_id", "project_id"),
+    Index("ix_archive_tasks_due_date", "due_date"),
+)
+
+# Projects in the middle of a move, by the id in the file they are leaving.
+moves = Table(
+    "moves", archive_metadata,
+    Column("batch", Integer, primary_key=True),
+    Column("project_id", Integer, primary_key=True),
+    Column("direction", String, nullable=False),     # "archive" or "restore"
+)
+
+# ─── Hot + Archived Views ────────────────────────────────────────────────────
+# TEMP views, since only those may read an attached database. Ids are only
+# unique together with `archived`. all_tasks carries its project's name, so
+# a listing by due date merges two index scans instead of joining a view.
+
+_views = MetaData()
+
+all_projects = Table(
+    "all_projects", _views,
+    Column("id", Integer),
+    Column("name", String),
+    Column("description", String),
+    Column("start_date", Date),
+    Column("deadline", Date),
+    Column("priority", CodedEnumType(Priority)),
+    Column("status", CodedEnumType(ProjectStatus)),
+    *(Column(name, Integer) for name in COUNT_COLUMNS),
+    Column("archived", Boolean),
+)
+
+all_tasks = Table(
+    "all_tasks", _views,
+    Column("id", Integer),
+    Column("name", String),
+    Column("description", String),
+    Column("status", CodedEnumType(TaskStatus)),
+    Column("due_date", Date),
+    Column("project_id", Integer),
+    Column("project_name", String),
+    Column("user_id", Integer),
+    Column("archived", Boolean),
+)
+
+
+def _view_sql():
+    project_cols = ", ".join(PROJECT_COLUMNS)
+    counts = ", ".join(f"coalesce(s.{name}, 0) AS {name}" for name in COUNT_COLUMNS)
+    task_cols = ", ".join(f"t.{c}" for c in ("id", *TASK_COLUMNS, "project_id"))
+    return (
+        "CREATE TEMP VIEW IF NOT EXISTS all_projects AS "
+        f"SELECT p.id, {', '.join('p.' + c for c in PROJECT_COLUMNS)}, {counts}, 0 AS archived "
+        "FROM main.projects p LEFT JOIN main.project_stats s ON s.project_id = p.id "
+        f"UNION ALL SELECT id, {project_cols}, {', '.join(COUNT_COLUMNS)}, 1 FROM archive.projects",
+
+        "CREATE TEMP VIEW IF NOT EXISTS all_tasks AS "
+        f"SELECT {task_cols}, p.name AS project_name, t.user_id, 0 AS archived "
+        "FROM main.tasks t JOIN main.projects p ON p.id = t.project_id "
+        f"UNION ALL SELECT {task_cols}, p.name, t.user_id, 1 "
+        "FROM archive.tasks t JOIN archive.projects p ON p.id = t.project_id",
+    )
+
+
+def archive_path(bind) -> str:
+    """The archive file of the database behind an engine or connection."""
+    path = database_path(bind)
+    if path is None:
+        raise ValueError("An in-memory database has no archive.")
+    return os.path.splitext(path)[0] + ".archive.db"
+
+
+def attach_archive(connection):
+    """
+    Attach the archive (creating it on first use) as `archive` and create
+    the all_projects/all_tasks views. A no-op on a connection that already
+    has it. SQLite can't ATTACH inside a transaction, so call this before
+    the connection writes anything.
+    """
+    attached = {row[1] for row in connection.exec_driver_sql("PRAGMA database_list")}
+    if "archive" in attached:
+        return
+    connection.exec_driver_sql("ATTACH DATABASE ? AS archive", (archive_path(connection),))
+    archive_metadata.create_all(connection)
+    for statement in _view_sql():
+        connection.exec_driver_sql(statement)
+
+
+def all_projects_progress_select(*criteria, limit=None):
+    """
+    project_progress_select over the all_projects view, hot and archived
+    projects alike, with an `archived` column. Needs attach_archive().
+    """
+    p = all_projects
+    stmt = (
+        select(
+            p.c.id,
+            p.c.name,
+            p.c.deadline,
+            p.c.priority,
+            p.c.status,
+            p.c.task_count,
+            p.c.todo_count,
+            p.c.in_progress_count,
+            p.c.done_count,
+            completion_percentage_expr(p.c.done_count, p.c.task_count).label("completion_percentage"),
+            p.c.archived,
+        )
+        .where(*criteria)
+        .order_by(p.c.deadline, p.c.id, p.c.archived)
+    )
+    return stmt.limit(limit) if limit is not None else stmt
+
+
+def all_tasks_listing_select(*criteria, limit=None):
+    """
+    task_listing_select over the all_tasks view, hot and archived tasks
+    alike, with an `archived` column. Needs attach_archive().
+    """
+    t = all_tasks
+    stmt = (
+        select(
+            t.c.id,
+            t.c.name,
+            t.c.status,
+            t.c.due_date,
+            t.c.project_name,
+            User.name.label("user_name"),
+            User.email.label("user_email"),
+            t.c.archived,
+        )
+        .outerjoin(User, t.c.user_id == User.id)
+        .where(*criteria)
+        .order_by(t.c.due_date, t.c.id, t.c.archived)
+    )
+    return stmt.limit(limit) if limit is not None else stmt
+
+# ─── Moving Projects ─────────────────────────────────────────────────────────
+
+def _in(ids) -> str:
+    return ", ".join(str(int(i)) for i in ids)
+
+
+def _new_ids(conn, table, source, target, where) -> dict:
+    """
+    {id: new id} for the rows of source.table matching `where` whose id is
+    already used in target.table; the new ids are above every id in both.
+    """
+    taken = conn.exec_driver_sql(
+        f"SELECT s.id FROM {source}.{table} s JOIN {target}.{table} t ON t.id = s.id WHERE {where}"
+    ).scalars().all()
+    if not taken:
+        return {}
+    top = max(
+        conn.exec_driver_sql(f"SELECT coalesce(max(id), 0) FROM {schema}.{table}").scalar()
+        for schema in (source, target)
+    )
+    return {old: top + n for n, old in enumerate(taken, 1)}
+
+
+def _mapped(column, new_ids) -> str:
+    if not new_ids:
+        return column
+    whens = " ".join(f"WHEN {old} THEN {new}" for old, new in new_ids.items())
+    return f"CASE {column} {whens} ELSE {column} END"
+
+
+def _copy(conn, ids, source, target, project_values, task_user, params=()) -> int:
+    """
+    Copy projects `ids` and their tasks from source to target, the
+    projects' values given as {target column: SQL over p, s}; returns the
+    number of tasks copied.
+    """
+    in_ids = _in(ids)
+    project_ids = _new_ids(conn, "projects", source, target, f"s.id IN ({in_ids})")
+    task_ids = _new_ids(conn, "tasks", source, target, f"s.project_id IN ({in_ids})")
+    values = {"id": _mapped("p.id", project_ids), **project_values}
+    stats = "LEFT JOIN main.project_stats s ON s.project_id = p.id " if source == "main" else ""
+    conn.exec_driver_sql(
+        f"INSERT INTO {target}.projects ({', '.join(values)}) SELECT {', '.join(values.values())} "
+        f"FROM {source}.projects p {stats}WHERE p.id IN ({in_ids})",
+        params,
+    )
+    return conn.exec_driver_sql(
+        f"INSERT INTO {target}.tasks (id, {', '.join(TASK_COLUMNS)}, project_id, user_id) "
+        f"SELECT {_mapped('t.id', task_ids)}, {', '.join('t.' + c for c in TASK_COLUMNS)}, "
+        f"{_mapped('t.project_id', project_ids)}, {task_user} "
+        f"FROM {source}.tasks t WHERE t.project_id IN ({in_ids})"
+    ).rowcount
+
+
+def _delete(conn, ids, schema):
+    conn.exec_driver_sql(f"DELETE FROM {schema}.tasks WHERE project_id IN ({_in(ids)})")
+    conn.exec_driver_sql(f"DELETE FROM {schema}.projects WHERE id IN ({_in(ids)})")
+
+
+def _refuse_name_clashes(conn, ids):
+    """Raise ValueError if a hot project has the name of any archived project `ids`."""
+    clashes = conn.exec_driver_sql(
+        "SELECT DISTINCT a.name FROM archive.projects a JOIN main.projects p ON p.name = a.name "
+        f"WHERE a.id IN ({_in(ids)}) ORDER BY a.name"
+    ).scalars().all()
+    if clashes:
+        raise ValueError(
+            f"Projects named {', '.join(repr(n) for n in clashes)} already exist; "
+            "rename them before restoring."
+        )
+
+
+def _restore_copy(conn, ids) -> int:
+    """Copy archived projects `ids` into the hot tables; returns the number of tasks copied."""
+    _refuse_name_clashes(conn, ids)
+    return _copy(
+        conn, ids, "archive", "main", {c: f"p.{c}" for c in PROJECT_COLUMNS},
+        "(SELECT u.id FROM main.users u WHERE u.id = t.user_id)",
+    )
+
+# ─── Move Journal ────────────────────────────────────────────────────────────
+
+def _hot_batch(conn) -> int:
+    """The last batch whose hot side has committed."""
+    return conn.exec_driver_sql("PRAGMA main.user_version").scalar()
+
+
+def _set_hot_batch(conn, batch):
+    # pysqlite only opens a transaction at the first INSERT/UPDATE/DELETE,
+    # so this must follow the hot side's writes to commit with them.
+    conn.exec_driver_sql(f"PRAGMA main.user_version = {int(batch)}")
+
+
+def _journal(conn, batch, direction, ids):
+    conn.execute(insert(moves), [{"batch": batch, "project_id": i, "direction": direction} for i in ids])
+
+
+def _clear_journal(conn, batch):
+    conn.exec_driver_sql("DELETE FROM archive.moves WHERE batch = ?", (batch,))
+
+
+def _finish_moves(conn):
+    """Finish every batch an interrupted run left in the journal, oldest first."""
+    hot_batch = _hot_batch(conn)
+    pending = conn.exec_driver_sql("SELECT DISTINCT batch, direction FROM archive.moves ORDER BY batch").all()
+    for batch, direction in pending:
+        ids = conn.exec_driver_sql("SELECT project_id FROM archive.moves WHERE batch = ?", (batch,)).scalars().all()
+        if direction == "archive":
+            if batch > hot_batch:
+                _delete(conn, ids, "main")
+                _set_hot_batch(conn, batch)
+                conn.commit()
+            _clear_journal(conn, batch)
+        else:
+            if batch > hot_batch:
+                _restore_copy(conn, ids)
+                _set_hot_batch(conn, batch)
+                conn.commit()
+            _delete(conn, ids, "archive")
+            _clear_journal(conn, batch)
+        conn.commit()
+
+# ─── Archive & Restore ───────────────────────────────────────────────────────
+
+def archive_projects(engine, older_than_days: int, chunk_size: int = CHUNK, today=None):
+    """
+    Move completed projects whose deadline is more than `older_than_days`
+    before `today`, with their tasks, into the archive. Returns (projects,
+    tasks) moved.
+    """
+    if older_than_days < 0:
+        raise ValueError("older_than_days cannot be negative.")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1.")
+    today = today or date.today()
+    cutoff = today - timedelta(days=older_than_days)
+    archived_values = {
+        **{c: f"p.{c}" for c in PROJECT_COLUMNS},
+        **{c: f"coalesce(s.{c}, 0)" for c in COUNT_COLUMNS},
+        "archived_on": "?",
+    }
+    projects = tasks = 0
+    with engine.connect() as conn:
+        attach_archive(conn)
+        conn.commit()
+        _finish_moves(conn)
+        stmt = (
+            select(Project.id)
+            .where(Project.status == ProjectStatus.COMPLETED, Project.deadline < cutoff)
+            .order_by(Project.id)
+            .limit(chunk_size)
+        )
+        while ids := conn.execute(stmt).scalars().all():
+            batch = _hot_batch(conn) + 1
+            tasks += _copy(conn, ids, "main", "archive", archived_values, "t.user_id", (today,))
+            _journal(conn, batch, "archive", ids)
+            conn.commit()
+            _delete(conn, ids, "main")
+            _set_hot_batch(conn, batch)
+            conn.commit()
+            _clear_journal(conn, batch)
+            conn.commit()
+            projects += len(ids)
+    # Core statements: the session events never saw these projects go.
+    invalidate_lookups()
+    return projects, tasks
+
+
+def _archived_ids(conn, refs) -> list:
+    """Archived project ids for IDs or exact names; raises ValueError for unknown or ambiguous names."""
+    ids = []
+    for ref in refs:
+        column = "id" if str(ref).isdigit() else "name"
+        found = conn.exec_driver_sql(
+            f"SELECT id FROM archive.projects WHERE {column} = ?", (int(ref) if column == "id" else ref,)
+        ).scalars().all()
+        if not found:
+            raise ValueError(f"Archived project '{ref}' does not exist.")
+        if len(found) > 1:
+            raise ValueError(f"{len(found)} archived projects are named '{ref}'; restore one by ID.")
+        ids.append(found[0])
+    return sorted(set(ids))
+
+
+def restore_projects(engine, refs, chunk_size: int = CHUNK):
+    """
+    Move archived projects (IDs or exact names) and their tasks back into
+    the hot tables. Returns (projects, tasks) moved. Raises ValueError,
+    before moving anything, if a hot project has the name of any of them.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1.")
+    projects = tasks = 0
+    with engine.connect() as conn:
+        attach_archive(conn)
+        conn.commit()
+        ids = _archived_ids(conn, refs)
+        _finish_moves(conn)
+        # An interrupted restore of some of them has just been finished.
+        ids = conn.exec_driver_sql(
+            f"SELECT id FROM archive.projects WHERE id IN ({_in(ids)}) ORDER BY id"
+        ).scalars().all()
+        _refuse_name_clashes(conn, ids)
+        for start in range(0, len(ids), chunk_size):
+            chunk = ids[start:start + chunk_size]
+            batch = _hot_batch(conn) + 1
+            _journal(conn, batch, "restore", chunk)
+            conn.commit()
+            tasks += _restore_copy(conn, chunk)
+            _set_hot_batch(conn, batch)
+            conn.commit()
+            _delete(conn, chunk, "archive")
+            _clear_journal(conn, batch)
+            conn.commit()
+            projects += len(chunk)
+    invalidate_lookups()
+    return projects, tasks
@@ -0,0 +1,143 @@
+# project_manager/async_services.py
+"""
+Asyncio variant of project_manager.services, on SQLAlchemy's AsyncSession
+and the aiosqlite driver (pipenv install aiosqlite).
+
+    await prepare()
+    try:
+        async with AsyncSessionLocal() as session:
+            tasks = AsyncTaskService(session)
+            page = await tasks.search("invoice", limit=50)
+            await tasks.update_many([t.id for t in page], status="Done")
+            await session.commit()
+    finally:
+        await dispose()
+
+Every method runs the matching synchronous service method through
+AsyncSession.run_sync, so the rules, queries and row types are the same;
+only the database I/O is awaited. aiosqlite gives each connection its own
+thread, so reads in separate sessions run concurrently without blocking the
+event loop. As with the synchronous services, committing is up to the
+caller. Call dispose() before the event loop ends: until the engine's
+pooled connections are closed, their threads keep the process from exiting.
+"""
+
+import asyncio
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from project_manager.models import (
+    SQLITE_PROFILE, SQLITE_PROFILES, apply_sqlite_profile, database_url,
+)
+from project_manager.schema import ensure_schema
+from project_manager.services import ProjectService, ReportService, TaskService, UserService
+
+
+def async_url(url: str) -> str:
+    """sqlite:///path -> sqlite+aiosqlite:///path."""
+    if not url.startswith("sqlite:///"):
+        raise ValueError(f"Not a SQLite URL: {url}")
+    return "sqlite+aiosqlite:///" + url[len("sqlite:///"):]
+
+
+def create_async_sqlite_engine(url: str, profile: str = SQLITE_PROFILE):
+    """AsyncEngine for a sqlite:/// URL whose connections all use the given profile."""
+    if profile not in SQLITE_PROFILES:
+        raise ValueError(
+            f"Unknown SQLite profile '{profile}'. Choose one of: {', '.join(SQLITE_PROFILES)}."
+        )
+    try:
+        engine = create_async_engine(async_url(url), connect_args={"check_same_thread": False})
+    except ModuleNotFoundError as e:
+        raise ModuleNotFoundError(f"{e}; the async API needs `pipenv install aiosqlite`.") from None
+    event.listen(
+        engine.sync_engine,
+        "connect",
+        lambda dbapi_connection, connection_record: apply_sqlite_profile(dbapi_connection, profile),
+    )
+    return engine
+
+
+_async_engine = None
+
+
+def get_async_engine():
+    """The application's AsyncEngine, on the same database as get_engine()."""
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = create_async_sqlite_engine(database_url())
+    return _async_engine
+
+
+class LazyAsyncSessionmaker(async_sessionmaker):
+    """An async_sessionmaker that binds to get_async_engine() when the first session is made."""
+
+    def __call__(self, **local_kw):
+        if self.kw.get("bind") is None and "bind" not in local_kw:
+            self.kw["bind"] = get_async_engine()
+        return super().__call__(**local_kw)
+
+
+# Rows are plain dataclasses, so there is nothing for expire_on_commit to expire.
+AsyncSessionLocal = LazyAsyncSessionmaker(autoflush=False, expire_on_commit=False)
+
+
+async def prepare():
+    """Check (or create) the schema once, off the event loop, like cli.main does."""
+    await asyncio.to_thread(ensure_schema)
+
+
+async def dispose():
+    """Close the application's AsyncEngine; the next session opens a new one."""
+    global _async_engine
+    engine, _async_engine = _async_engine, None
+    if engine is not None:
+        if AsyncSessionLocal.kw.get("bind") is engine:
+            AsyncSessionLocal.kw["bind"] = None
+        await engine.dispose()
+
+
+def _delegate(service, name):
+    """An async method running `name` of the wrapped synchronous service."""
+    async def method(self, *args, **kwargs):
+        return await self.session.run_sync(
+            lambda session: getattr(service(session), name)(*args, **kwargs)
+        )
+    method.__name__ = name
+    method.__doc__ = getattr(service, name).__doc__
+    return method
+
+
+class _AsyncService:
+    """Awaitable wrapper over the synchronous service `service`."""
+
+    service = None
+    methods = ("list", "get", "get_many", "search", "create", "update", "delete")
+
+    def __init__(self, session):
+        self.session = session
+
+    def __init_subclass__(cls, **kw):
+        super().__init_subclass__(**kw)
+        for name in cls.methods:
+            setattr(cls, name, _delegate(cls.service, name))
+
+
+class AsyncProjectService(_AsyncService):
+    service = ProjectService
+    methods = (*_AsyncService.methods, "update_many", "tasks")
+
+
+class AsyncTaskService(_AsyncService):
+    service = TaskService
+    methods = (*_AsyncService.methods, "update_many", "set_status", "reassign", "shift_due_dates")
+
+
+class AsyncUserService(_AsyncService):
+    service = UserService
+    methods = (*_AsyncService.methods, "task_counts")
+
+
+class AsyncReportService(_AsyncService):
+    service = ReportService
+    methods = ("deadlines", "workload")
@@ -0,0 +1,343 @@
+# project_manager/cache.py
+"""
+Process-level caches: an LRU of lightweight user and project records, and
+results (such as reports) kept until the database changes.
+
+Prompts and commands look the same users and projects up over and over (the
+user picker in create_task/update_task, the project a task goes into). These
+lookups are answered from a size-bounded cache keyed by id and by name,
+holding plain namedtuples rather than ORM objects so nothing is tied to a
+session.
+
+Invalidation follows the ORM session events: after_flush evicts every user
+or project the flush inserted, updated or deleted, and that session skips
+the cache for those models until its transaction ends; after_commit evicts
+them again, and a rollback just forgets them. Bulk query.update()/delete() on
+either model clears its whole cache. Writes that bypass the Session (Core
+statements on a connection) must call invalidate_lookups() themselves.
+
+Commits from other processes can't raise session events, so after_begin also
+reads the database's data version (SQLite's PRAGMA data_version, on a
+connection that never writes) once per transaction, and the lookup caches
+start over when it has moved on. Cached results are stored with that data
+version and recomputed once any connection has committed since.
+"""
+
+import os
+import threading
+from collections import OrderedDict, namedtuple
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+from project_manager.config import get_setting
+from project_manager.models import create_sqlite_engine
+from project_manager.models.project import Project
+from project_manager.models.user import User
+
+LOOKUP_CACHE_SIZE = int(get_setting("lookup_cache_size", "1024"))
+RESULT_CACHE_SIZE = 64
+
+UserRecord = namedtuple("UserRecord", "id name email")
+ProjectRecord = namedtuple("ProjectRecord", "id name start_date deadline priority status")
+
+
+class LookupCache:
+    """LRU of `record_type` rows of `model`, reachable by id or by name."""
+
+    def __init__(self, model, record_type, maxsize=LOOKUP_CACHE_SIZE):
+        self.model = model
+        self.record_type = record_type
+        self.maxsize = maxsize
+        self.hits = self.misses = 0
+        self._columns = [getattr(model, field) for field in record_type._fields]
+        self._records = OrderedDict()   # id -> record, least recently used first
+        self._names = {}                # name -> id
+        self._all = None                # every record in name order, when they all fit
+        self._cached_version = None     # (database path, data generation) of the entries
+        self._lock = threading.Lock()
+
+    # Reads
+
+    def get(self, session, ref):
+        """The record for an id (int or digit string) or exact name, or None."""
+        by_id = str(ref).isdigit()
+        key = int(ref) if by_id else ref
+        version = self._version(session)
+        if version is None:
+            return self._fetch(session, by_id, key)
+        with self._lock:
+            record_id = key if by_id else self._names.get(key)
+            record = self._records.get(record_id)
+            if record is not None:
+                self._records.move_to_end(record_id)
+                self.hits += 1
+                return record
+            self.misses += 1
+        record = self._fetch(session, by_id, key)
+        if record is not None:
+            self._store(record, version)
+        return record
+
+    def all(self, session):
+        """Every record ordered by name; cached only while they all fit."""
+        version = self._version(session)
+        if version is None:
+            return self._fetch_all(session)
+        with self._lock:
+            if self._all is not None:
+                self.hits += 1
+                return self._all
+            self.misses += 1
+        records = self._fetch_all(session)
+        if len(records) <= self.maxsize:
+            with self._lock:
+                if self._cached_version == version:
+                    self._all = records
+            for record in records:
+                self._store(record, version)
+        return records
+
+    def _version(self, session):
+        """
+        The (database path, data generation) of the session's transaction,
+        emptying the cache first if it holds another database or an older
+        generation; None when the cache can't serve the session (in-memory
+        database, uncommitted changes to the model, or an older snapshot).
+        """
+        if _bypass(session, self.model):
+            return None
+        if "lookup_version" not in session.info:
+            session.connection()    # begins the transaction: see _after_begin
+        version = session.info["lookup_version"]
+        if version is None:
+            return None
+        with self._lock:
+            cached = self._cached_version
+            if version != cached:
+                if cached is not None and cached[0] == version[0] and cached[1] > version[1]:
+                    return None
+                self._clear()
+                self._cached_version = version
+        return version
+
+    def _fetch(self, session, by_id, key):
+        column = self.model.id if by_id else self.model.name
+        row = session.execute(select(*self._columns).where(column == key)).first()
+        return self.record_type(*row) if row else None
+
+    def _fetch_all(self, session):
+        rows = session.execute(select(*self._columns).order_by(self.model.name, self.model.id))
+        return tuple(self.record_type(*row) for row in rows)
+
+    def _store(self, record, version):
+        with self._lock:
+            # Fetched before a newer generation emptied the cache: maybe stale.
+            if version != self._cached_version:
+                return
+            self._records[record.id] = record
+            self._records.move_to_end(record.id)
+            self._names[record.name] = record.id
+            while len(self._records) > self.maxsize:
+                _, evicted = self._records.popitem(last=False)
+                if self._names.get(evicted.name) == evicted.id:
+                    del self._names[evicted.name]
+
+    # Invalidation
+
+    def evict(self, ids):
+        with self._lock:
+            self._all = None
+            for record_id in ids:
+                record = self._records.pop(record_id, None)
+                if record is not None and self._names.get(record.name) == record_id:
+                    del self._names[record.name]
+
+    def clear(self):
+        with self._lock:
+            self._clear()
+            self._cached_version = None
+
+    def _clear(self):
+        self._records.clear()
+        self._names.clear()
+        self._all = None
+
+
+user_cache = LookupCache(User, UserRecord)
+project_cache = LookupCache(Project, ProjectRecord)
+_CACHES = {User: user_cache, Project: project_cache}
+
+
+def lookup_user(session, ref):
+    return user_cache.get(session, ref)
+
+
+def lookup_project(session, ref):
+    return project_cache.get(session, ref)
+
+
+def all_users(session):
+    return user_cache.all(session)
+
+
+def invalidate_lookups():
+    """Drop everything; for writes made outside an ORM Session."""
+    for cache in _CACHES.values():
+        cache.clear()
+
+# ─── Session Events ──────────────────────────────────────────────────────────
+# session.info["lookup_changes"] maps a model to the ids its flushes touched,
+# or to None after a bulk update/delete, and session.info["lookup_version"]
+# holds the data version read when the transaction began, until it ends.
+
+def _bypass(session, model) -> bool:
+    return session is not None and model in session.info.get("lookup_changes", {})
+
+
+def _changes(session):
+    return session.info.setdefault("lookup_changes", {})
+
+
+def _evict_changes(session):
+    for model, ids in session.info.pop("lookup_changes", {}).items():
+        if ids is None:
+            _CACHES[model].clear()
+        else:
+            _CACHES[model].evict(ids)
+
+
+@event.listens_for(Session, "after_begin")
+def _after_begin(session, transaction, connection):
+    if transaction.parent is None:
+        path = database_path(connection)
+        session.info["lookup_version"] = path and (path, data_version(path).current())
+
+
+@event.listens_for(Session, "after_flush")
+def _after_flush(session, flush_context):
+    changes = _changes(session)
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        model = type(instance)
+        if model in _CACHES and changes.get(model, ()) is not None:
+            changes.setdefault(model, set()).add(instance.id)
+    for model, ids in changes.items():
+        if ids is None:
+            _CACHES[model].clear()
+        else:
+            _CACHES[model].evict(ids)
+
+
+def _after_bulk(update_context):
+    model = update_context.mapper.class_
+    if model in _CACHES:
+        _changes(update_context.session)[model] = None
+        _CACHES[model].clear()
+
+
+event.listen(Session, "after_bulk_update", _after_bulk)
+event.listen(Session, "after_bulk_delete", _after_bulk)
+
+
+@event.listens_for(Session, "after_commit")
+def _after_commit(session):
+    _evict_changes(session)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _after_transaction_end(session, transaction):
+    # Rolled back or closed: the changes never became visible, so the
+    # cache (evicted at flush time) is already right; just stop bypassing.
+    if transaction.parent is None:
+        session.info.pop("lookup_changes", None)
+        session.info.pop("lookup_version", None)
+
+# ─── Data Version ────────────────────────────────────────────────────────────
+
+class DataVersion:
+    """
+    A generation number that moves on whenever anything has committed to the
+    database since the last call. PRAGMA data_version ignores the reading
+    connection's own commits, so it is read on a read-only connection of its
+    own.
+    """
+
+    def __init__(self, url: str):
+        self._engine = create_sqlite_engine(url, read_only=True, pool_size=1)
+        self._conn = None
+        self._lock = threading.Lock()
+        self._data_version = None
+        self.generation = 0
+
+    def current(self) -> int:
+        with self._lock:
+            if self._conn is None:
+                self._conn = self._engine.connect()
+            version = self._conn.exec_driver_sql("PRAGMA data_version").scalar()
+            self._conn.rollback()
+            if version != self._data_version:
+                self._data_version = version
+                self.generation += 1
+            return self.generation
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            self._engine.dispose()
+
+
+_versions = {}      # database path -> DataVersion
+_results = OrderedDict()    # (database path, key) -> (generation, value), least recently used first
+_results_lock = threading.Lock()
+
+
+def database_path(bind):
+    """Absolute path of the SQLite file behind an engine or connection, or None for :memory:."""
+    url = bind.engine.url
+    path = url.database or ""
+    if url.query.get("uri") and path.startswith("file:"):
+        path = path[len("file:"):]
+    return os.path.abspath(path) if path and path != ":memory:" else None
+
+
+def data_version(path: str) -> DataVersion:
+    """The shared DataVersion of the database file at `path`."""
+    with _results_lock:
+        if path not in _versions:
+            _versions[path] = DataVersion(f"sqlite:///{path}")
+        return _versions[path]
+
+
+def _uncommitted_writes(session) -> bool:
+    # The driver only opens a transaction at the first write, so an open
+    # one means this session sees data nobody else does yet.
+    if not session.in_transaction():
+        return False
+    return session.connection().connection.driver_connection.in_transaction
+
+
+def cached_result(session, key, compute):
+    """
+    compute() for the committed data of the session's database, reused until
+    the data version changes. `key` tells apart results of the same
+    database; the value is shared between callers, so it must be immutable.
+    """
+    path = database_path(session.get_bind())
+    if path is None or _uncommitted_writes(session):
+        return compute()
+    generation = data_version(path).current()
+    with _results_lock:
+        hit = _results.get((path, key))
+        if hit is not None and hit[0] == generation:
+            _results.move_to_end((path, key))
+            return hit[1]
+    # Versioned before computing: a commit landing in between only makes
+    # the stored generation older, never the value.
+    value = compute()
+    with _results_lock:
+        _results[(path, key)] = (generation, value)
+        _results.move_to_end((path, key))
+        while len(_results) > RESULT_CACHE_SIZE:
+            _results.popitem(last=False)
+    return value
@@ -2,17 +2,16 @@
 
 import sys
 import os
+import argparse
+import json
+import shlex
+from dataclasses import asdict
+from datetime import date
+from sqlalchemy import select
 
 # Ensure the project root is on Python's path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-# Create tables if they don’t exist
-from project_manager.models import Base, engine
-import project_manager.models.project
-import project_manager.models.task
-import project_manager.models.user
-Base.metadata.create_all(bind=engine)
-
 from project_manager.helpers import (
     exit_program,
     create_project,
@@ -31,18 +30,64 @@ from project_manager.helpers import (
     list_users,
     find_user,
     delete_user,
+    view_workload,
 )
+from project_manager import operations
+from project_manager.models import DEFAULT_WORKSPACE, SessionLocal, current_workspace, get_engine, use_workspace
+from project_manager.models.project import Project
+from project_manager.models.stats import ProjectStats, diff_project_stats, rebuild_project_stats, refresh_overdue
+from project_manager.models.task import Task
+from project_manager.archive import all_projects_progress_select, all_tasks_listing_select, attach_archive
+from project_manager.queries import project_progress_select, task_listing_select, user_listing_select
+from project_manager.services import ReportService, TaskService
+from project_manager.instrumentation import print_profile, profile_queries
+from project_manager.schema import ensure_schema
+from project_manager.unit_of_work import batch_actions, begin_batch, commit_batch, in_batch, rollback_batch
+
+# Set by --profile: print the SQL profile of every menu action.
+PROFILE_ACTIONS = False
+
+
+def _menu_action(action):
+    """Run one menu action, followed by its SQL profile when --profile is on."""
+    if not PROFILE_ACTIONS:
+        return action()
+    with profile_queries() as profile:
+        action()
+    print_profile(profile, action.__name__)
+
+def _end_batch(commit):
+    """Commit or roll back the open batch and say what happened."""
+    try:
+        if commit:
+            print(f"✅ Batch committed: {commit_batch()} action(s) in one transaction.")
+        else:
+            print(f"✅ Batch rolled back: {rollback_batch()} action(s) discarded.")
+    except ValueError as e:
+        print(f"⚠️ {e}")
+    except Exception as e:
+        print(f"❌ Batch rolled back, the commit failed: {e}")
 
-def main():
+def interactive_main():
     while True:
         print("\n=== TASK & PROJECT MANAGER ===")
+        if current_workspace() != DEFAULT_WORKSPACE:
+            print(f"[workspace: {current_workspace()}]")
+        if in_batch():
+            print(f"[batch open: {batch_actions()} action(s) waiting for commit]")
         print("1. Projects")
         print("2. Tasks")
         print("3. Users")
+        print("4. Begin batch (many actions, one commit)")
+        print("5. Commit batch")
+        print("6. Roll back batch")
         print("0. Exit")
         choice = input("> ").strip()
 
         if choice == "0":
+            if in_batch():
+                answer = input("Commit the open batch before exiting? (y/n): ").strip().lower()
+                _end_batch(commit=answer == "y")
             exit_program()
         elif choice == "1":
             project_menu()
@@ -50,8 +95,18 @@ def main():
             task_menu()
         elif choice == "3":
             user_menu()
+        elif choice == "4":
+            try:
+                begin_batch()
+                print("✅ Batch started. Changes are kept until you commit or roll back.")
+            except ValueError as e:
+                print(f"⚠️ {e}")
+        elif choice == "5":
+            _end_batch(commit=True)
+        elif choice == "6":
+            _end_batch(commit=False)
         else:
-            print("❌ Invalid choice. Please select 0, 1, 2, or 3.")
+            print("❌ Invalid choice. Please select 0 to 6.")
 
 def project_menu():
     while True:
@@ -68,17 +123,17 @@ def project_menu():
         if choice == "0":
             return
         elif choice == "1":
-            create_project()
+            _menu_action(create_project)
         elif choice == "2":
-            list_projects()
+            _menu_action(list_projects)
         elif choice == "3":
-            find_project()
+            _menu_action(find_project)
         elif choice == "4":
-            update_project()    
+            _menu_action(update_project)    
         elif choice == "5":
-            delete_project()
+            _menu_action(delete_project)
         elif choice == "6":
-            view_project_tasks()
+            _menu_action(view_project_tasks)
         else:
             print("❌ Invalid choice. Choose 0–6.")
 
@@ -97,17 +152,17 @@ def task_menu():
         if choice == "0":
             return
         elif choice == "1":
-            create_task()
+            _menu_action(create_task)
         elif choice == "2":
-            list_tasks()
+            _menu_action(list_tasks)
         elif choice == "3":
-            find_task()
+            _menu_action(find_task)
         elif choice == "4":
-            update_task()          
+            _menu_action(update_task)          
         elif choice == "5":
-            delete_task()
+            _menu_action(delete_task)
         elif choice == "6":
-            view_task_details()
+            _menu_action(view_task_details)
         else:
             print("❌ Invalid choice. Choose 0–6.")
 
@@ -118,22 +173,632 @@ def user_menu():
         print("2. List all users")
         print("3. Find a user by name or ID")
         print("4. Delete a user")
+        print("5. Workload dashboard")
         print("0. Back to main menu")
         choice = input("> ").strip()
 
         if choice == "0":
             return
         elif choice == "1":
-            create_user()
+            _menu_action(create_user)
         elif choice == "2":
-            list_users()
+            _menu_action(list_users)
         elif choice == "3":
-            find_user()
+            _menu_action(find_user)
         elif choice == "4":
-            delete_user()
-        
+            _menu_action(delete_user)
+        elif choice == "5":
+            _menu_action(view_workload)
+        else:
+            print("❌ Invalid choice. Choose 0–5.")
+
+# ─── Command Mode ────────────────────────────────────────────────────────────
+# `cli.py <entity> <action> [options]` runs one operation without prompts;
+# `cli.py batch FILE` runs a file of such commands in one transaction.
+
+STREAM_BATCH = 1000
+
+
+def _date_arg(value):
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"'{value}' is not a YYYY-MM-DD date") from None
+
+
+def _print_json_rows(rows):
+    """Stream rows as a JSON array without holding them all in memory."""
+    first = True
+    sys.stdout.write("[")
+    for row in rows:
+        sys.stdout.write(("\n  " if first else ",\n  ") + json.dumps(row, default=str))
+        first = False
+    sys.stdout.write("]\n" if first else "\n]\n")
+
+
+def _print_rows(session, stmt, args, render):
+    rows = (dict(r._mapping) for r in session.execute(stmt.execution_options(yield_per=STREAM_BATCH)))
+    try:
+        if args.json:
+            _print_json_rows(rows)
+        else:
+            for row in rows:
+                print(render(row))
+        sys.stdout.flush()
+    except BrokenPipeError:
+        _stdout_closed()
+
+
+def _stdout_closed():
+    """
+    The reader of a piped listing (e.g. `| head`) has gone: stop printing,
+    and point stdout at /dev/null so the flush at exit doesn't fail again.
+    """
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, sys.stdout.fileno())
+    os.close(devnull)
+
+
+def _print_record(record: dict, args):
+    if args.json:
+        print(json.dumps(record, default=str, indent=2))
+    else:
+        width = max(len(k) for k in record) + 2
+        for key, value in record.items():
+            print(f"{(key.replace('_', ' ').title() + ':'):<{width}} {value if value is not None else '-'}")
+
+
+def _project_row(p):
+    return (
+        f"ID: {p['id']} | Name: {p['name']} | Deadline: {p['deadline']} | "
+        f"Priority: {p['priority']} | Progress: {p['completion_percentage']:.0f}%"
+        + (" | Archived" if p.get("archived") else "")
+    )
+
+
+def _task_row(t):
+    user = f" | User: {t['user_name']}" if t.get("user_name") else ""
+    project = f" | Project: {t['project_name']}" if t.get("project_name") else ""
+    archived = " | Archived" if t.get("archived") else ""
+    return (
+        f"ID: {t['id']} | Name: {t['name']}{project} | Status: {t['status']} | "
+        f"Due: {t['due_date'] or '-'}{user}{archived}"
+    )
+
+
+def _listing(session, args, hot, with_archived):
+    """The hot listing, or the one over hot and archived rows with --include-archived."""
+    if not args.include_archived:
+        return hot()
+    attach_archive(session.connection())
+    return with_archived()
+
+
+def _user_row(u):
+    return f"ID: {u['id']} | Name: {u['name']} | Email: {u['email']}"
+
+
+def _project_cmd(session, args):
+    if args.action == "list":
+        stmt = _listing(session, args, project_progress_select, all_projects_progress_select)
+        _print_rows(session, stmt, args, _project_row)
+    elif args.action == "show":
+        project = operations.get_project(session, args.ref, "detail")
+        refresh_overdue(session.connection())
+        completion, next_due, overdue = session.execute(
+            select(Project.completion_percentage, ProjectStats.next_due_date, ProjectStats.overdue_count)
+            .select_from(Project)
+            .outerjoin(ProjectStats, ProjectStats.project_id == Project.id)
+            .where(Project.id == project.id)
+        ).one()
+        _print_record({
+            "id": project.id, "name": project.name, "description": project.description,
+            "start_date": project.start_date, "deadline": project.deadline,
+            "priority": project.priority, "status": project.status,
+            "completion_percentage": round(completion, 1),
+            "next_due_date": next_due,
+            "overdue_tasks": overdue or 0,
+        }, args)
+    elif args.action == "tasks":
+        project = operations.get_project(session, args.ref)
+        _print_rows(
+            session,
+            select(Task.id, Task.name, Task.status, Task.due_date, Task.user_id)
+            .where(Task.project_id == project.id)
+            .order_by(Task.due_date, Task.id),
+            args,
+            _task_row,
+        )
+    elif args.action == "create":
+        project = operations.create_project(
+            session, args.name, args.deadline, args.description, args.start_date, args.priority
+        )
+        return f"✅ Project '{project.name}' created (ID: {project.id})."
+    elif args.action == "update":
+        project = operations.update_project(
+            session, args.ref, args.name, args.description, args.deadline, args.priority, args.status
+        )
+        return f"✅ Project ID {project.id} updated."
+    elif args.action == "delete":
+        project = operations.delete_project(session, args.ref)
+        return f"✅ Project '{project.name}' and its tasks have been deleted."
+
+
+def _task_cmd(session, args):
+    if args.action == "list":
+        stmt = _listing(session, args, task_listing_select, all_tasks_listing_select)
+        _print_rows(session, stmt, args, _task_row)
+    elif args.action == "show":
+        task = operations.get_task(session, args.id, "detail")
+        _print_record({
+            "id": task.id, "name": task.name, "description": task.description,
+            "status": task.status, "due_date": task.due_date,
+            "project": task.project.name, "user": task.user.name if task.user else None,
+        }, args)
+    elif args.action == "create":
+        task = operations.create_task(
+            session, args.name, args.project, args.description, args.status, args.due_date, args.user
+        )
+        return f"✅ Task '{task.name}' created (ID: {task.id})."
+    elif args.action == "update":
+        task = operations.update_task(
+            session, args.id, args.name, args.description, args.status, args.due_date,
+            args.project, args.user, args.unassign,
+        )
+        return f"✅ Task ID {task.id} updated."
+    elif args.action == "delete":
+        task = operations.delete_task(session, args.id)
+        return f"✅ Task '{task.name}' has been deleted."
+    elif args.action == "set-status":
+        count = TaskService(session).set_status(args.project, args.status, args.from_status)
+        return f"✅ Status changed on {count} tasks."
+    elif args.action == "reassign":
+        if not args.to_user and not args.unassign:
+            raise ValueError("Give --to-user or --unassign.")
+        count = TaskService(session).reassign(args.from_user, args.to_user, args.project)
+        return f"✅ {count} tasks {'reassigned' if args.to_user else 'unassigned'}."
+    elif args.action == "shift-due":
+        count = TaskService(session).shift_due_dates(args.project, args.days)
+        return f"✅ {count} due dates moved by {args.days:+d} days."
+
+
+def _user_cmd(session, args):
+    if args.action == "list":
+        _print_rows(session, user_listing_select(), args, _user_row)
+    elif args.action == "show":
+        user = operations.get_user(session, args.ref, "detail")
+        _print_record({"id": user.id, "name": user.name, "email": user.email}, args)
+    elif args.action == "create":
+        user = operations.create_user(session, args.name, args.email)
+        return f"✅ User '{user.name}' created (ID: {user.id})."
+    elif args.action == "update":
+        user = operations.update_user(session, args.ref, args.name, args.email)
+        return f"✅ User ID {user.id} updated."
+    elif args.action == "delete":
+        user = operations.delete_user(session, args.ref)
+        return f"✅ User '{user.name}' has been deleted."
+
+
+def _days(n: int) -> str:
+    if n == 0:
+        return "today"
+    unit = "day" if abs(n) == 1 else "days"
+    return f"in {n} {unit}" if n > 0 else f"{-n} {unit} ago"
+
+
+def _print_section(title, rows, total, render):
+    shown = f", first {len(rows)}" if len(rows) < total else ""
+    print(f"\n{title} ({total}{shown}):")
+    for row in rows:
+        print("   " + render(row))
+    if not rows:
+        print("   none")
+
+
+def _in_workspace(render):
+    """Render a WorkspaceRow of a cross-workspace report as its workspace and row."""
+    return lambda w: f"[{w.workspace}] {render(w.row)}"
+
+
+def _row_dict(row):
+    from project_manager.workspaces import WorkspaceRow
+
+    if isinstance(row, WorkspaceRow):
+        return {"workspace": row.workspace, **asdict(row.row)}
+    return asdict(row)
+
+
+def _report_cmd(session, args):
+    from project_manager import workspaces
+
+    tag = _in_workspace if args.all_workspaces else (lambda render: render)
+    if args.action == "deadlines":
+        if args.all_workspaces:
+            report = workspaces.deadlines(args.as_of, args.within, args.limit or None)
         else:
-            print("❌ Invalid choice. Choose 0–4.")
+            report = ReportService(session).deadlines(args.as_of, args.within, args.limit or None)
+        sections = {
+            "projects": report.projects, "by_project": report.by_project,
+            "by_user": report.by_user, "tasks": report.tasks,
+        }
+        totals = {name: len(rows) for name, rows in sections.items()}
+        if args.limit:
+            sections = {name: rows[:args.limit] for name, rows in sections.items()}
+        totals["tasks"] = report.overdue + report.due_soon
+        if args.json:
+            print(json.dumps({
+                "as_of": report.as_of, "within_days": report.within_days,
+                "overdue": report.overdue, "due_soon": report.due_soon,
+                **{name: [_row_dict(row) for row in rows] for name, rows in sections.items()},
+            }, default=str, indent=2))
+            return
+        print(
+            f"⏰ Deadlines on {report.as_of}: {report.overdue} overdue tasks, "
+            f"{report.due_soon} due within {report.within_days} days."
+        )
+        _print_section(
+            "Active projects past or near their deadline", sections["projects"], totals["projects"],
+            tag(lambda p: f"ID: {p.id} | Name: {p.name} | Deadline: {p.deadline} ({_days(p.deadline_in)}) | "
+                          f"Open tasks: {p.open_tasks}"),
+        )
+        _print_section(
+            "By project", sections["by_project"], totals["by_project"],
+            tag(lambda g: f"ID: {g.id} | Name: {g.name} | Overdue: {g.overdue} | Due soon: {g.due_soon} | "
+                          f"Earliest: {g.first_due} ({_days(g.first_due_in)}) | Deadline: {g.deadline}"),
+        )
+        _print_section(
+            "By user", sections["by_user"], totals["by_user"],
+            tag(lambda g: f"{f'ID: {g.id} | Name: {g.name}' if g.id is not None else 'Unassigned'} | "
+                          f"Overdue: {g.overdue} | Due soon: {g.due_soon} | "
+                          f"Earliest: {g.first_due} ({_days(g.first_due_in)})"),
+        )
+        _print_section(
+            "Tasks", sections["tasks"], totals["tasks"],
+            tag(lambda t: f"ID: {t.id} | Name: {t.name} | Project: {t.project_name} | Status: {t.status} | "
+                          f"Due: {t.due_date} ({_days(t.due_in)})" + (f" | User: {t.user_name}" if t.user_name else "")),
+        )
+    elif args.action == "workload":
+        if args.all_workspaces:
+            rows = workspaces.workload(args.as_of)
+        else:
+            rows = ReportService(session).workload(args.as_of)
+        if args.json:
+            try:
+                _print_json_rows(_row_dict(row) for row in rows)
+                sys.stdout.flush()
+            except BrokenPipeError:
+                _stdout_closed()
+            return
+        render = tag(
+            lambda w: f"{f'ID: {w.id} | Name: {w.name}' if w.id is not None else 'Unassigned'} | "
+                      f"To Do: {w.todo_count} | In Progress: {w.in_progress_count} | Done: {w.done_count} | "
+                      f"Overdue: {w.overdue_count} | Next due: {w.first_due or '-'}"
+        )
+        try:
+            for row in rows:
+                print(render(row))
+            sys.stdout.flush()
+        except BrokenPipeError:
+            _stdout_closed()
+
+    return 0
+
+
+def _workspace_cmd(args):
+    from project_manager import workspaces
+
+    if args.action == "create":
+        path = workspaces.create_workspace(args.name)
+        print(f"✅ Workspace '{args.name}' created in {path}.")
+    elif args.action == "list":
+        names = workspaces.list_workspaces()
+        for name, (projects, tasks, users) in workspaces.workspace_summary(names).items():
+            mark = "*" if name == current_workspace() else " "
+            print(
+                f"{mark} {name} | Projects: {projects} | Tasks: {tasks} | Users: {users} | "
+                f"File: {workspaces.workspace_path(name)}"
+            )
+        if not names:
+            print("No workspaces yet.")
+
+
+def _archive_cmd(args):
+    from project_manager import archive
+
+    engine = get_engine()
+    if args.entity == "archive":
+        projects, tasks = archive.archive_projects(engine, args.older_than, args.chunk_size)
+        print(f"✅ Archived {projects} projects and {tasks} tasks into {archive.archive_path(engine)}.")
+    else:
+        projects, tasks = archive.restore_projects(engine, args.refs, args.chunk_size)
+        print(f"✅ Restored {projects} projects and {tasks} tasks.")
+
+
+def _add_entity_parsers(sub):
+    """The <entity> <action> commands, shared by the command line and batch files."""
+    project = sub.add_parser("project", help="manage projects").add_subparsers(dest="action", required=True)
+    project_list = project.add_parser("list", help="list projects with progress")
+    project_show = project.add_parser("show", help="show one project")
+    project_show.add_argument("ref", help="project ID or exact name")
+    project_tasks = project.add_parser("tasks", help="list a project's tasks")
+    project_tasks.add_argument("ref", help="project ID or exact name")
+    for p in (project_list, project_show, project_tasks):
+        p.add_argument("--json", action="store_true", help="print JSON")
+    project_list.add_argument("--include-archived", action="store_true", help="list archived projects too")
+    p = project.add_parser("create", help="create a project")
+    p.add_argument("--name", required=True)
+    p.add_argument("--deadline", type=_date_arg, required=True)
+    p.add_argument("--description")
+    p.add_argument("--start-date", type=_date_arg)
+    p.add_argument("--priority", default="Medium", help="High, Medium or Low")
+    p = project.add_parser("update", help="update a project")
+    p.add_argument("ref", help="project ID or exact name")
+    p.add_argument("--name")
+    p.add_argument("--description")
+    p.add_argument("--deadline", type=_date_arg)
+    p.add_argument("--priority", help="High, Medium or Low")
+    p.add_argument("--status", help="Active or Completed")
+    p = project.add_parser("delete", help="delete a project and its tasks")
+    p.add_argument("ref", help="project ID or exact name")
+
+    task = sub.add_parser("task", help="manage tasks").add_subparsers(dest="action", required=True)
+    task_list = task.add_parser("list", help="list tasks by due date")
+    task_show = task.add_parser("show", help="show one task")
+    task_show.add_argument("id", type=int)
+    for p in (task_list, task_show):
+        p.add_argument("--json", action="store_true", help="print JSON")
+    task_list.add_argument("--include-archived", action="store_true", help="list archived tasks too")
+    p = task.add_parser("create", help="create a task")
+    p.add_argument("--name", required=True)
+    p.add_argument("--project", required=True, help="project ID or exact name")
+    p.add_argument("--description")
+    p.add_argument("--status", default="To Do", help="To Do, In Progress or Done")
+    p.add_argument("--due-date", type=_date_arg)
+    p.add_argument("--user", help="user ID or exact name")
+    p = task.add_parser("update", help="update a task")
+    p.add_argument("id", type=int)
+    p.add_argument("--name")
+    p.add_argument("--description")
+    p.add_argument("--status", help="To Do, In Progress or Done")
+    p.add_argument("--due-date", type=_date_arg)
+    p.add_argument("--project", help="move to this project (ID or exact name)")
+    p.add_argument("--user", help="reassign to this user (ID or exact name)")
+    p.add_argument("--unassign", action="store_true", help="remove the assigned user")
+    p = task.add_parser("delete", help="delete a task")
+    p.add_argument("id", type=int)
+    p = task.add_parser("set-status", help="set the status of every task in a project")
+    p.add_argument("--project", required=True, help="project ID or exact name")
+    p.add_argument("--status", required=True, help="To Do, In Progress or Done")
+    p.add_argument("--from-status", help="only change tasks currently in this status")
+    p = task.add_parser("reassign", help="move every task of one user to another")
+    p.add_argument("--from-user", required=True, help="user ID or exact name")
+    to = p.add_mutually_exclusive_group()
+    to.add_argument("--to-user", help="user ID or exact name")
+    to.add_argument("--unassign", action="store_true", help="leave the tasks unassigned")
+    p.add_argument("--project", help="only tasks in this project (ID or exact name)")
+    p = task.add_parser("shift-due", help="move a project's due dates by N days, clamped to its deadline")
+    p.add_argument("--project", required=True, help="project ID or exact name")
+    p.add_argument("--days", type=int, required=True, help="days to add (negative to bring forward)")
+
+    user = sub.add_parser("user", help="manage users").add_subparsers(dest="action", required=True)
+    user_list = user.add_parser("list", help="list users")
+    user_show = user.add_parser("show", help="show one user")
+    user_show.add_argument("ref", help="user ID or exact name")
+    for p in (user_list, user_show):
+        p.add_argument("--json", action="store_true", help="print JSON")
+    p = user.add_parser("create", help="create a user")
+    p.add_argument("--name", required=True)
+    p.add_argument("--email", required=True)
+    p = user.add_parser("update", help="update a user")
+    p.add_argument("ref", help="user ID or exact name")
+    p.add_argument("--name")
+    p.add_argument("--email")
+    p = user.add_parser("delete", help="delete a user")
+    p.add_argument("ref", help="user ID or exact name")
+
+
+ENTITY_COMMANDS = {"project": _project_cmd, "task": _task_cmd, "user": _user_cmd}
+
+
+def build_batch_parser():
+    parser = argparse.ArgumentParser(prog="batch line", add_help=False, exit_on_error=False)
+    _add_entity_parsers(parser.add_subparsers(dest="entity", required=True))
+    return parser
+
+
+def run_batch(path, quiet=False):
+    """
+    Run every command in `path` (one per line, same syntax as the command
+    line; blank lines and # comments skipped) in a single session and
+    transaction. Any failure rolls the whole batch back.
+    """
+    parser = build_batch_parser()
+    session = SessionLocal()
+    count = 0
+    try:
+        with open(path, encoding="utf-8") as fh:
+            for line_no, line in enumerate(fh, 1):
+                words = shlex.split(line, comments=True)
+                if not words:
+                    continue
+                try:
+                    args = parser.parse_args(words)
+                    message = ENTITY_COMMANDS[args.entity](session, args)
+                except (argparse.ArgumentError, ValueError) as e:
+                    raise ValueError(f"line {line_no}: {e}") from None
+                except SystemExit:
+                    raise ValueError(f"line {line_no}: invalid command '{line.strip()}'") from None
+                if message and not quiet:
+                    print(message)
+                count += 1
+        session.commit()
+        return count
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+
+def check_stats(repair=False) -> int:
+    """Diff project_stats against the tasks; 0 if they agree (or were repaired)."""
+    with get_engine().begin() as conn:
+        diffs = diff_project_stats(conn)
+        for project_id, column, stored, expected in diffs[:20]:
+            print(f"   project {project_id}: {column} is {stored}, expected {expected}")
+        if not diffs:
+            print("✅ project_stats match the tasks.")
+            return 0
+        print(f"⚠️ {len(diffs)} differences in project_stats.")
+        if not repair:
+            return 1
+        rebuild_project_stats(conn)
+    print("✅ project_stats rebuilt.")
+    return 0
+
+
+def build_parser():
+    from project_manager import archive, exporter, importer, server
+
+    parser = argparse.ArgumentParser(
+        prog="cli.py",
+        description="Task & Project Manager. Run without arguments for the interactive menus.",
+    )
+    parser.add_argument(
+        "--profile", dest="sql_profile", action="store_true",
+        help="report statements, DB time, rows and likely N+1 queries on stderr "
+             "(on its own: after every menu action)",
+    )
+    parser.add_argument(
+        "--workspace", metavar="NAME",
+        help=f"run in this workspace (one SQLite file per team; default: {current_workspace()})",
+    )
+    sub = parser.add_subparsers(dest="entity", required=True)
+    _add_entity_parsers(sub)
+
+    p = sub.add_parser("batch", help="run a file of commands in one transaction")
+    p.add_argument("path", help="file with one command per line, e.g. task create --name X --project 1")
+    p.add_argument("--quiet", action="store_true", help="only print the summary")
+    importer.build_parser(sub.add_parser("import", help="bulk import from CSV/JSONL"))
+    exporter.build_parser(sub.add_parser("export", help="export to NDJSON/CSV"))
+    sub.add_parser("explain", help="print the query plan of every helper's query")
+    server.build_parser(sub.add_parser("serve", help="serve the JSON HTTP API"))
+    report = sub.add_parser("report", help="reports computed in SQL").add_subparsers(dest="action", required=True)
+    p = report.add_parser("deadlines", help="overdue and due-soon tasks by project and by user")
+    p.add_argument("--as-of", type=_date_arg, help="day to report on (default: today)")
+    p.add_argument("--within", type=int, default=7, help="days ahead that count as due soon (default: 7)")
+    p.add_argument("--limit", type=int, default=20, help="rows per section, 0 for all (default: 20)")
+    p.add_argument("--json", action="store_true", help="print JSON")
+    p.add_argument("--all-workspaces", action="store_true", help="merge the report of every workspace")
+    p = report.add_parser("workload", help="tasks per user by status, overdue and next due date")
+    p.add_argument("--as-of", type=_date_arg, help="day overdue is counted on (default: today)")
+    p.add_argument("--json", action="store_true", help="print JSON")
+    p.add_argument("--all-workspaces", action="store_true", help="merge the report of every workspace")
+    workspace = sub.add_parser("workspace", help="list or create workspaces").add_subparsers(
+        dest="action", required=True
+    )
+    workspace.add_parser("list", help="every workspace with its size; * marks the current one")
+    workspace.add_parser("create", help="create an empty workspace").add_argument("name")
+    p = sub.add_parser("archive", help="move old completed projects and their tasks to the archive database")
+    p.add_argument("--older-than", type=int, required=True, metavar="DAYS",
+                   help="archive completed projects whose deadline is more than DAYS days past")
+    p.add_argument("--chunk-size", type=int, default=archive.CHUNK, help="projects per transaction")
+    p = sub.add_parser("restore", help="move archived projects and their tasks back")
+    p.add_argument("refs", nargs="+", metavar="PROJECT", help="archived project ID or exact name")
+    p.add_argument("--chunk-size", type=int, default=archive.CHUNK, help="projects per transaction")
+    p = sub.add_parser("stats", help="compare project_stats with a fresh count of the tasks")
+    p.add_argument("--repair", action="store_true", help="rebuild project_stats if they differ")
+    return parser
+
+
+def run_command(args) -> int:
+    """Run one parsed command-line command and return the exit status."""
+    try:
+        if args.entity in ENTITY_COMMANDS:
+            session = SessionLocal()
+            try:
+                message = ENTITY_COMMANDS[args.entity](session, args)
+                session.commit()
+            except Exception:
+                session.rollback()
+                raise
+            finally:
+                session.close()
+            if message:
+                print(message)
+        elif args.entity == "batch":
+            count = run_batch(args.path, args.quiet)
+            print(f"✅ Batch applied: {count} commands in one transaction.")
+        elif args.entity == "import":
+            from project_manager import importer
+            importer.run(args)
+        elif args.entity == "export":
+            from project_manager import exporter
+            exporter.run(args)
+        elif args.entity == "explain":
+            from project_manager.diagnostics import explain_helpers
+            explain_helpers()
+        elif args.entity == "report":
+            with SessionLocal() as session:
+                _report_cmd(session, args)
+        elif args.entity == "stats":
+            return check_stats(args.repair)
+        elif args.entity == "workspace":
+            _workspace_cmd(args)
+        elif args.entity in ("archive", "restore"):
+            _archive_cmd(args)
+        elif args.entity == "serve":
+            from project_manager import server
+            server.run(args)
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def _select_workspace(argv):
+    """
+    Apply a --workspace NAME given anywhere in argv and return argv without
+    it; it has to take effect before anything opens the database.
+    """
+    parser = argparse.ArgumentParser(add_help=False, allow_abbrev=False)
+    parser.add_argument("--workspace")
+    known, argv = parser.parse_known_args(argv)
+    if known.workspace is not None:
+        from project_manager.workspaces import workspace_exists
+
+        use_workspace(known.workspace)
+        if known.workspace != DEFAULT_WORKSPACE and not workspace_exists(known.workspace):
+            raise ValueError(
+                f"Workspace '{known.workspace}' not found. "
+                f"Create it with `cli.py workspace create {known.workspace}`."
+            )
+    return argv
+
+
+def main(argv=None):
+    global PROFILE_ACTIONS
+    argv = sys.argv[1:] if argv is None else argv
+    try:
+        argv = _select_workspace(argv)
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    if argv in ([], ["--profile"]):
+        PROFILE_ACTIONS = bool(argv)
+        ensure_schema()
+        interactive_main()
+        return 0
+    args = build_parser().parse_args(argv)
+    ensure_schema()
+    if not args.sql_profile:
+        return run_command(args)
+    with profile_queries() as profile:
+        status = run_command(args)
+    command = argv[:argv.index("--profile")] + argv[argv.index("--profile") + 1:]
+    print_profile(profile, " ".join(command), file=sys.stderr)
+    return status
+
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,28 @@
+# project_manager/config.py
+
+import os
+from configparser import ConfigParser
+from functools import lru_cache
+
+ROOT_DIR = os.path.dirname(os.path.dirname(__file__))
+CONFIG_FILE = os.environ.get("PM_CONFIG", os.path.join(ROOT_DIR, "project_manager.ini"))
+CONFIG_SECTION = "project_manager"
+
+
+@lru_cache(maxsize=1)
+def _file_settings() -> dict:
+    parser = ConfigParser()
+    parser.read(CONFIG_FILE)
+    return dict(parser[CONFIG_SECTION]) if parser.has_section(CONFIG_SECTION) else {}
+
+
+def get_setting(name: str, default=None):
+    """
+    Look up a setting: the PM_<NAME> environment variable wins, then the
+    [project_manager] section of project_manager.ini (or the file named by
+    PM_CONFIG), then `default`.
+    """
+    env_value = os.environ.get(f"PM_{name.upper()}")
+    if env_value is not None:
+        return env_value
+    return _file_settings().get(name.lower(), default)
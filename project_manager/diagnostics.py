@@ -0,0 +1,118 @@
+# project_manager/diagnostics.py
+
+import sys
+import os
+from datetime import date
+
+# Ensure the project root is on Python's path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import delete, select, update
+from project_manager.models import get_engine
+from project_manager.models.project import Project
+from project_manager.models.task import Task
+from project_manager.models.user import User
+from project_manager.models.search import ranked_search
+from project_manager.pagination import DEFAULT_PAGE_SIZE, keyset_predicate
+from project_manager.queries import (
+    deadline_groups_select,
+    deadline_projects_select,
+    deadline_tasks_select,
+    project_progress_select,
+    project_tasks_select,
+    task_listing_select,
+    user_listing_select,
+    workload_select,
+)
+from project_manager.schema import ensure_schema
+
+
+def helper_statements():
+    """
+    (label, statement) for the query behind each helper, with representative
+    parameters. Paged listings are shown for both the first and a later page.
+    """
+    today = date.today()
+    limit = DEFAULT_PAGE_SIZE + 1
+    return [
+        ("list_projects", project_progress_select(limit=limit)),
+        ("list_projects (next page)", project_progress_select(
+            keyset_predicate(Project.deadline, Project.id, (today, 1)), limit=limit)),
+        ("find_project (by ID)", select(Project, Project.completion_percentage).where(Project.id == 1)),
+        ("find_project (by name)", ranked_search(
+            select(Project.id, Project.name), Project, "term").limit(limit)),
+        ("view_project_tasks", project_tasks_select(1)),
+        # What ON DELETE CASCADE runs for delete_project; needs an index on tasks.project_id.
+        ("delete_project (cascade)", delete(Task).where(Task.project_id == 1)),
+        ("list_tasks", task_listing_select(limit=limit)),
+        ("list_tasks (next page)", task_listing_select(
+            keyset_predicate(Task.due_date, Task.id, (today, 1)), limit=limit)),
+        ("find_task (by ID)", select(Task).where(Task.id == 1)),
+        ("find_task (by name)", ranked_search(task_listing_select(), Task, "term").limit(limit)),
+        ("list_users", user_listing_select(limit=limit)),
+        ("list_users (next page)", user_listing_select(
+            keyset_predicate(User.name, User.id, ("m", 1)), limit=limit)),
+        ("find_user (by name)", ranked_search(user_listing_select(), User, "term").limit(limit)),
+        # What ON DELETE SET NULL runs for delete_user.
+        ("delete_user (set null)", update(Task).where(Task.user_id == 1).values(user_id=None)),
+        ("report deadlines (projects)", deadline_projects_select(today, 7)),
+        ("report deadlines (by project)", deadline_groups_select("project", today, 7)),
+        ("report deadlines (by user)", deadline_groups_select("user", today, 7)),
+        ("report deadlines (tasks)", deadline_tasks_select(today, 7, Task.due_date >= today, limit=limit)),
+        ("report workload", workload_select(today)),
+    ]
+
+
+def explain_query_plan(connection, stmt) -> list[tuple[int, str]]:
+    """
+    Run SQLite's EXPLAIN QUERY PLAN for `stmt` and return (depth, detail) rows.
+    """
+    sql = str(stmt.compile(dialect=connection.dialect, compile_kwargs={"literal_binds": True}))
+    depth = {0: -1}
+    plan = []
+    for node_id, parent, _, detail in connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}"):
+        depth[node_id] = depth.get(parent, -1) + 1
+        plan.append((depth[node_id], detail))
+    return plan
+
+
+def is_full_scan(detail: str, subqueries=()) -> bool:
+    """
+    A SCAN step that walks a whole table rather than an index. Scans of
+    subqueries (already bounded by their own plan) and FTS5 virtual tables
+    (answered from their own index) don't count.
+    """
+    if not detail.startswith("SCAN ") or "USING" in detail or "VIRTUAL TABLE" in detail:
+        return False
+    return detail.split()[1] not in ("CONSTANT", *subqueries)
+
+
+def explain_helpers(connection=None) -> int:
+    """
+    Print the query plan of every helper's query and return how many of them
+    still contain a full table scan.
+    """
+    if connection is None:
+        with get_engine().connect() as conn:
+            return explain_helpers(conn)
+
+    scans = 0
+    for label, stmt in helper_statements():
+        plan = explain_query_plan(connection, stmt)
+        subqueries = [
+            detail.split()[-1] for _, detail in plan
+            if detail.startswith(("CO-ROUTINE ", "MATERIALIZE "))
+        ]
+        full = [detail for _, detail in plan if is_full_scan(detail, subqueries)]
+        scans += bool(full)
+        print(f"\n{'⚠️' if full else '✅'} {label}")
+        for level, detail in plan:
+            marker = "  <-- full scan" if is_full_scan(detail, subqueries) else ""
+            print(f"   {'  ' * level}{detail}{marker}")
+    print(f"\n{scans} of {len(helper_statements())} helper queries use a full table scan.")
+    return scans
+
+
+if __name__ == "__main__":
+    ensure_schema()
+    explain_helpers()
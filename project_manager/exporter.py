@@ -0,0 +1,207 @@
+# project_manager/exporter.py
+"""
+Streaming export of projects, tasks and users to NDJSON or CSV.
+
+    pipenv run python -m project_manager.exporter dumps/ [--format csv] [--by-project --workers 4]
+
+Rows are streamed from Core selects over a read-only connection and written
+through large buffered file handles, so memory stays flat whatever the size
+of the database. Tasks carry their project and user names. With
+--by-project, tasks are split into one file per project and the projects
+are shared out between worker processes, each with its own read-only engine.
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import select
+from project_manager.models import create_sqlite_engine, database_url
+from project_manager.models.project import Project
+from project_manager.models.task import Task
+from project_manager.models.user import User
+
+FORMATS = {"ndjson": ".ndjson", "csv": ".csv"}
+WRITE_BUFFER = 1 << 20  # bytes
+YIELD_PER = 5000
+
+
+def _dataset_selects():
+    return {
+        "projects": select(
+            Project.id, Project.name, Project.description, Project.start_date,
+            Project.deadline, Project.priority, Project.status,
+        ).order_by(Project.id),
+        "tasks": select(
+            Task.id, Task.name, Task.description, Task.status, Task.due_date,
+            Task.project_id, Project.name.label("project_name"),
+            Task.user_id, User.name.label("user_name"), User.email.label("user_email"),
+        )
+        .join(Project, Task.project_id == Project.id)
+        .outerjoin(User, Task.user_id == User.id)
+        .order_by(Task.id),
+        "users": select(User.id, User.name, User.email).order_by(User.id),
+    }
+
+
+DATASETS = tuple(_dataset_selects())
+
+
+class RowWriter:
+    """Buffered NDJSON/CSV writer for rows sharing the same columns."""
+
+    def __init__(self, path: str, fmt: str, columns):
+        self._fh = open(path, "w", newline="", encoding="utf-8", buffering=WRITE_BUFFER)
+        self._fmt = fmt
+        self._columns = list(columns)
+        if fmt == "csv":
+            self._csv = csv.writer(self._fh)
+            self._csv.writerow(self._columns)
+
+    def write(self, row):
+        if self._fmt == "csv":
+            self._csv.writerow(row)
+        else:
+            self._fh.write(json.dumps(dict(zip(self._columns, row)), default=str))
+            self._fh.write("\n")
+
+    def close(self):
+        self._fh.close()
+
+
+def _stream(conn, stmt):
+    return conn.execution_options(stream_results=True, yield_per=YIELD_PER).execute(stmt)
+
+
+def export_dataset(conn, name: str, out_dir: str, fmt: str) -> int:
+    """Stream one dataset into <out_dir>/<name>.<ext>; returns the row count."""
+    result = _stream(conn, _dataset_selects()[name])
+    writer = RowWriter(os.path.join(out_dir, name + FORMATS[fmt]), fmt, result.keys())
+    count = 0
+    try:
+        for row in result:
+            writer.write(row)
+            count += 1
+    finally:
+        writer.close()
+        result.close()
+    return count
+
+
+def export_project_tasks(db_url: str, out_dir: str, fmt: str, first_id: int, last_id: int) -> int:
+    """
+    Write the tasks of projects first_id..last_id to one file per project
+    under <out_dir>/tasks/. Runs in a worker process with its own
+    read-only engine; returns the number of rows written.
+    """
+    worker_engine = create_sqlite_engine(db_url, read_only=True)
+    stmt = (
+        _dataset_selects()["tasks"]
+        .where(Task.project_id.between(first_id, last_id))
+        .order_by(None)
+        .order_by(Task.project_id, Task.due_date, Task.id)  # matches ix_tasks_project_id_due_date
+    )
+    count = 0
+    writer, current = None, None
+    try:
+        with worker_engine.connect() as conn:
+            result = _stream(conn, stmt)
+            columns = list(result.keys())
+            for row in result:
+                if row.project_id != current:
+                    if writer:
+                        writer.close()
+                    current = row.project_id
+                    path = os.path.join(out_dir, "tasks", f"project_{current}{FORMATS[fmt]}")
+                    writer = RowWriter(path, fmt, columns)
+                writer.write(row)
+                count += 1
+    finally:
+        if writer:
+            writer.close()
+        worker_engine.dispose()
+    return count
+
+
+def _project_id_ranges(conn, parts: int):
+    """Split the project ids into up to `parts` contiguous ranges of similar size."""
+    ids = conn.execute(select(Project.id).order_by(Project.id)).scalars().all()
+    if not ids:
+        return []
+    size = -(-len(ids) // parts)
+    return [(ids[i], ids[min(i + size, len(ids)) - 1]) for i in range(0, len(ids), size)]
+
+
+def export_database(out_dir, fmt="ndjson", datasets=DATASETS, by_project=False, workers=1,
+                    db_url=None):
+    """
+    Export the given datasets into `out_dir` and return {file label: rows}.
+    With by_project, tasks go to one file per project instead of tasks.<ext>.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown format '{fmt}'. Choose one of: {', '.join(FORMATS)}.")
+    db_url = db_url or database_url()
+    os.makedirs(out_dir, exist_ok=True)
+    counts = {}
+    read_engine = create_sqlite_engine(db_url, read_only=True)
+    try:
+        with read_engine.connect() as conn:
+            for name in datasets:
+                if name == "tasks" and by_project:
+                    continue
+                counts[name] = export_dataset(conn, name, out_dir, fmt)
+            ranges = _project_id_ranges(conn, max(workers, 1)) if by_project and "tasks" in datasets else []
+    finally:
+        read_engine.dispose()
+
+    if ranges:
+        os.makedirs(os.path.join(out_dir, "tasks"), exist_ok=True)
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(export_project_tasks, db_url, out_dir, fmt, first, last)
+                    for first, last in ranges
+                ]
+                counts["tasks (by project)"] = sum(f.result() for f in futures)
+        else:
+            first, last = ranges[0]
+            counts["tasks (by project)"] = export_project_tasks(db_url, out_dir, fmt, first, last)
+    return counts
+
+
+def build_parser(parser=None):
+    parser = parser or argparse.ArgumentParser(description="Export the database to NDJSON or CSV.")
+    parser.add_argument("out_dir", help="directory to write the export files into")
+    parser.add_argument("--format", choices=list(FORMATS), default="ndjson")
+    parser.add_argument("--only", action="append", choices=list(DATASETS),
+                        help="dataset to export (repeatable; default all)")
+    parser.add_argument("--by-project", action="store_true", help="one tasks file per project")
+    parser.add_argument("--workers", type=int, default=1, help="processes for --by-project")
+    return parser
+
+
+def run(args):
+    started = time.perf_counter()
+    counts = export_database(
+        args.out_dir,
+        fmt=args.format,
+        datasets=tuple(args.only or DATASETS),
+        by_project=args.by_project,
+        workers=args.workers,
+    )
+    seconds = time.perf_counter() - started
+    total = sum(counts.values())
+    for label, count in counts.items():
+        print(f"   {label}: {count} rows")
+    print(f"✅ Exported {total} rows to {args.out_dir} in {seconds:.2f}s.")
+    return counts
+
+
+if __name__ == "__main__":
+    run(build_parser().parse_args())
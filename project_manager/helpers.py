@@ -2,20 +2,112 @@
 
 from datetime import datetime, date
 import sqlalchemy as sa
-from project_manager.models import SessionLocal
+from project_manager import operations
+from project_manager.cache import all_users, lookup_project, lookup_user
+from project_manager.models.enums import Priority, TaskStatus
+from project_manager.models.loading import loader_options, profiled_query
 from project_manager.models.project import Project
 from project_manager.models.task import Task
 from project_manager.models.user import User
+from project_manager.models.search import fts_match_expression, ranked_search
+from project_manager.pagination import KeysetPager, OffsetPager
+from project_manager.queries import (
+    project_progress_select,
+    project_tasks_select,
+    task_listing_select,
+    user_listing_select,
+)
+from project_manager.services import ReportService
+from project_manager.unit_of_work import action_session, in_batch
 
 def exit_program():
     print("\nGoodbye!")
     exit()
 
+def menu_options(enum_class) -> str:
+    """'1=High, 2=Medium, 3=Low': the menu numbers are the stored codes."""
+    return ", ".join(f"{member.value}={member.label}" for member in enum_class)
+
+def menu_choice(enum_class, choice, default=None):
+    """The member numbered `choice` in menu_options, or `default`."""
+    try:
+        return enum_class.parse(int(choice))
+    except ValueError:
+        return default
+
+def browse_pages(pager, title, width, render_row, empty_message):
+    """
+    Print a keyset-paginated listing one page at a time. Rows are printed as
+    they stream in; navigation is only offered when there is more than one page.
+    """
+    while True:
+        shown = 0
+        for row in pager.rows():
+            if shown == 0:
+                print(f"\n{title}")
+                print("=" * width)
+            render_row(row)
+            shown += 1
+
+        if shown == 0:
+            print(empty_message)
+            if not pager.prev_page():
+                return
+            continue
+
+        print("=" * width)
+        if pager.page_number == 1 and not pager.has_next:
+            return
+
+        more = "" if pager.has_next else " (last page)"
+        print(f"Page {pager.page_number}{more} | {pager.page_size} per page")
+        choice = input("[n]ext, [p]revious, [s]ize, [q]uit: ").strip().lower()
+        if choice == "n":
+            if not pager.next_page():
+                print("⚠️ Already on the last page.")
+        elif choice == "p":
+            if not pager.prev_page():
+                print("⚠️ Already on the first page.")
+        elif choice == "s":
+            size = input("Rows per page: ").strip()
+            if size.isdigit() and int(size) > 0:
+                pager.resize(int(size))
+            else:
+                print("❌ Page size must be a positive number.")
+        elif choice in ("q", ""):
+            return
+        else:
+            print("❌ Invalid choice. Choose n, p, s or q.")
+
+def search_matches(session, stmt, model, term, title, width, render_row, not_found):
+    """
+    Ranked full-text search for `term` over `stmt` (a select of `model` rows).
+    Returns the id of the only match so the caller can show its details;
+    several matches are listed best-first, page by page, and None is returned.
+    """
+    if fts_match_expression(term) is None:
+        print(not_found)
+        return None
+
+    pager = OffsetPager(
+        session,
+        lambda limit, offset: ranked_search(stmt, model, term).limit(limit).offset(offset),
+    )
+    first_page = list(pager.rows())
+    if not first_page:
+        print(not_found)
+        return None
+    if len(first_page) == 1 and not pager.has_next:
+        return first_page[0].id
+
+    browse_pages(pager, title, width, render_row, not_found)
+    return None
+
 # ─── Project Helpers ─────────────────────────────────────────────────────────
 
 def create_project():
     """Create a new project with validation and save to the database."""
-    session = SessionLocal()
+    session = action_session()
     try:
         print("\n📋 CREATE NEW PROJECT")
         print("=" * 40)
@@ -25,7 +117,7 @@ def create_project():
             print("❌ Project name cannot be empty!")
             return
 
-        existing = session.query(Project).filter(Project.name == name).first()
+        existing = profiled_query(session, Project, "lookup").filter(Project.name == name).first()
         if existing:
             print(f"❌ A project named '{name}' already exists!")
             return
@@ -59,10 +151,9 @@ def create_project():
             print(f"❌ Deadline ({deadline}) cannot be before start date ({start_date})!")
             return
 
-        print("Priority levels: 1=High, 2=Medium, 3=Low")
-        priority_choice = input("Select priority (1-3) [default=2]: ").strip()
-        priority_map = {'1': 'High', '2': 'Medium', '3': 'Low'}
-        priority = priority_map.get(priority_choice, 'Medium')
+        print(f"Priority levels: {menu_options(Priority)}")
+        priority_choice = input(f"Select priority (1-3) [default={Priority.MEDIUM.value}]: ").strip()
+        priority = menu_choice(Priority, priority_choice, Priority.MEDIUM)
 
         project = Project(
             name=name,
@@ -75,7 +166,10 @@ def create_project():
         session.add(project)
         session.commit()
 
-        print(f"✅ Project '{name}' created successfully!")
+        if in_batch():
+            print(f"✅ Project '{name}' queued; will be created on commit.")
+        else:
+            print(f"✅ Project '{name}' created successfully!")
         print(f"   Start date:  {start_date}")
         print(f"   Deadline:    {deadline}")
         print(f"   Priority:    {priority}")
@@ -87,25 +181,28 @@ def create_project():
         session.close()
 
 def list_projects():
-    """List all projects with progress and days remaining."""
-    session = SessionLocal()
+    """List all projects with progress and days remaining, one page at a time."""
+    session = action_session()
     try:
-        projects = session.query(Project).order_by(Project.deadline).all()
-        if not projects:
-            print("\n⚠️ No projects found.\n")
-            return
+        today = date.today()
 
-        print("\n📋 PROJECT LIST")
-        print("=" * 60)
-        for p in projects:
+        def render(p):
             perc = f"{p.completion_percentage:.0f}%"
-            days = p.days_remaining
+            days = (p.deadline - today).days
             days_str = f"{days} days remaining" if days >= 0 else f"Overdue by {abs(days)} days"
             print(
                 f"ID: {p.id} | Name: {p.name} | Deadline: {p.deadline} | "
                 f"Priority: {p.priority} | Progress: {perc} | {days_str}"
             )
-        print("=" * 60)
+
+        pager = KeysetPager(
+            session,
+            lambda predicate, limit: project_progress_select(predicate, limit=limit),
+            Project.deadline,
+            Project.id,
+            key=lambda p: (p.deadline, p.id),
+        )
+        browse_pages(pager, "📋 PROJECT LIST", 60, render, "\n⚠️ No projects found.\n")
     except Exception as e:
         print(f"❌ Error listing projects: {e}")
     finally:
@@ -113,19 +210,40 @@ def list_projects():
 
 def find_project():
     """Find a project by ID or name, and show progress and days remaining."""
-    session = SessionLocal()
+    session = action_session()
     try:
         search_term = input("Enter project ID or name to search: ").strip()
         if search_term.isdigit():
-            project = session.query(Project).filter(Project.id == int(search_term)).first()
+            project_id = int(search_term)
         else:
-            project = session.query(Project).filter(Project.name.ilike(f"%{search_term}%")).first()
+            project_id = search_matches(
+                session,
+                sa.select(Project.id, Project.name, Project.deadline, Project.priority, Project.status),
+                Project,
+                search_term,
+                "📋 MATCHING PROJECTS",
+                60,
+                lambda p: print(
+                    f"ID: {p.id} | Name: {p.name} | Deadline: {p.deadline} | "
+                    f"Priority: {p.priority} | Status: {p.status}"
+                ),
+                f"⚠️ Project '{search_term}' not found.",
+            )
+            if project_id is None:
+                return
 
-        if not project:
+        found = (
+            profiled_query(session, Project, "detail")
+            .add_columns(Project.completion_percentage)
+            .filter(Project.id == project_id)
+            .first()
+        )
+        if not found:
             print(f"⚠️ Project '{search_term}' not found.")
             return
 
-        perc = f"{project.completion_percentage:.0f}% complete"
+        project, completion = found
+        perc = f"{completion:.0f}% complete"
         days = project.days_remaining
         days_str = (
             (f"{days} days remaining" if days >= 0 else f"Overdue by {abs(days)} days")
@@ -152,14 +270,14 @@ def find_project():
 
 def update_project():
     """Update a project’s name, description, deadline, or priority."""
-    session = SessionLocal()
+    session = action_session()
     try:
         project_id = input("Enter the project ID to update: ").strip()
         if not project_id.isdigit():
             print("❌ Invalid project ID.")
             return
 
-        project = session.query(Project).filter(Project.id == int(project_id)).first()
+        project = profiled_query(session, Project, "lookup").filter(Project.id == int(project_id)).first()
         if not project:
             print(f"⚠️ No project found with ID {project_id}.")
             return
@@ -189,11 +307,9 @@ def update_project():
                 return
 
         print(f"Current priority: {project.priority}")
-        print("Priority levels: 1=High, 2=Medium, 3=Low")
+        print(f"Priority levels: {menu_options(Priority)}")
         new_prio = input("Select new priority (1-3) (leave blank to keep current): ").strip()
-        if new_prio in ('1', '2', '3'):
-            priority_map = {'1': 'High', '2': 'Medium', '3': 'Low'}
-            project.priority = priority_map[new_prio]
+        project.priority = menu_choice(Priority, new_prio, project.priority)
 
         session.commit()
         print(f"✅ Project ID {project.id} updated successfully.")
@@ -206,14 +322,14 @@ def update_project():
 
 def delete_project():
     """Delete a project and its tasks."""
-    session = SessionLocal()
+    session = action_session()
     try:
         project_id = input("Enter the project ID to delete: ").strip()
         if not project_id.isdigit():
             print("❌ Invalid project ID.")
             return
 
-        project = session.query(Project).filter(Project.id == int(project_id)).first()
+        project = lookup_project(session, project_id)
         if not project:
             print(f"⚠️ No project found with ID {project_id}.")
             return
@@ -223,8 +339,7 @@ def delete_project():
             print("❌ Deletion cancelled.")
             return
 
-        session.query(Task).filter(Task.project_id == project.id).delete()
-        session.delete(project)
+        operations.delete_project(session, project.id)
         session.commit()
         print(f"✅ Project '{project.name}' and its tasks have been deleted.")
 
@@ -236,19 +351,21 @@ def delete_project():
 
 def view_project_tasks():
     """Display all tasks for a given project."""
-    session = SessionLocal()
+    session = action_session()
     try:
         project_id = input("Enter the project ID to view tasks: ").strip()
         if not project_id.isdigit():
             print("❌ Invalid project ID.")
             return
 
-        project = session.query(Project).filter(Project.id == int(project_id)).first()
+        project = profiled_query(session, Project, "lookup").filter(Project.id == int(project_id)).first()
         if not project:
             print(f"⚠️ No project found with ID {project_id}.")
             return
 
-        tasks = session.query(Task).filter(Task.project_id == project.id).order_by(Task.due_date).all()
+        tasks = session.scalars(
+            project_tasks_select(project.id).options(*loader_options(Task, "listing"))
+        ).all()
         if not tasks:
             print(f"\n⚠️ No tasks found for project '{project.name}'.\n")
             return
@@ -277,7 +394,7 @@ def view_project_tasks():
 
 def create_task():
     """Prompt user to create a new task."""
-    session = SessionLocal()
+    session = action_session()
     try:
         print("\n📝 CREATE NEW TASK")
         print("=" * 40)
@@ -292,7 +409,7 @@ def create_task():
             print("❌ Invalid project ID.")
             return
 
-        project = session.query(Project).filter(Project.id == int(project_id)).first()
+        project = lookup_project(session, project_id)
         if not project:
             print(f"❌ Project with ID {project_id} does not exist!")
             return
@@ -301,10 +418,9 @@ def create_task():
         if description == "":
             description = None
 
-        status_map = {'1': 'To Do', '2': 'In Progress', '3': 'Done'}
-        print("Task status options: 1=To Do, 2=In Progress, 3=Done")
-        status_choice = input("Select status (1-3) [default=1]: ").strip()
-        status = status_map.get(status_choice, 'To Do')
+        print(f"Task status options: {menu_options(TaskStatus)}")
+        status_choice = input(f"Select status (1-3) [default={TaskStatus.TODO.value}]: ").strip()
+        status = menu_choice(TaskStatus, status_choice, TaskStatus.TODO)
 
         due_input = input("Due date [YYYY-MM-DD] (optional): ").strip()
         if due_input == "":
@@ -318,7 +434,7 @@ def create_task():
 
         # Select user for this task (optional)
         print("\nAssign a user to this task (optional):")
-        users = session.query(User).all()
+        users = all_users(session)
         if users:
             for u in users:
                 print(f"  {u.id}. {u.name} ({u.email})")
@@ -326,7 +442,7 @@ def create_task():
             if user_choice == "":
                 user_id = None
             elif user_choice.isdigit():
-                chosen = session.query(User).filter(User.id == int(user_choice)).first()
+                chosen = lookup_user(session, user_choice)
                 if chosen:
                     user_id = chosen.id
                 else:
@@ -350,7 +466,10 @@ def create_task():
         session.add(task)
         session.commit()
 
-        print(f"✅ Task '{name}' created successfully under project '{project.name}'!")
+        if in_batch():
+            print(f"✅ Task '{name}' under project '{project.name}' queued; will be created on commit.")
+        else:
+            print(f"✅ Task '{name}' created successfully under project '{project.name}'!")
         if due_date:
             print(f"   Due date: {due_date}")
         print(f"   Status: {status}")
@@ -364,30 +483,32 @@ def create_task():
         session.close()
 
 def list_tasks():
-    """List all tasks."""
-    session = SessionLocal()
+    """List all tasks, one page at a time."""
+    session = action_session()
     try:
-        tasks = session.query(Task).order_by(Task.due_date).all()
-        if not tasks:
-            print("\n⚠️ No tasks found.\n")
-            return
+        today = date.today()
 
-        print("\n📝 TASK LIST")
-        print("=" * 60)
-        for t in tasks:
-            project_name = t.project.name if t.project else "No Project"
+        def render(t):
             due = t.due_date or "-"
-            days = t.days_remaining
+            days = (t.due_date - today).days if t.due_date else None
             time_str = (
                 f"{days}d remaining" if days is not None and days >= 0
                 else (f"Overdue by {abs(days)}d" if days is not None else "No due date")
             )
-            user_info = f" | User: {t.user.name} ({t.user.email})" if t.user else ""
+            user_info = f" | User: {t.user_name} ({t.user_email})" if t.user_name else ""
             print(
-                f"ID: {t.id} | Name: {t.name} | Project: {project_name} | "
+                f"ID: {t.id} | Name: {t.name} | Project: {t.project_name} | "
                 f"Status: {t.status} | Due: {due} ({time_str}){user_info}"
             )
-        print("=" * 60)
+
+        pager = KeysetPager(
+            session,
+            lambda predicate, limit: task_listing_select(predicate, limit=limit),
+            Task.due_date,
+            Task.id,
+            key=lambda t: (t.due_date, t.id),
+        )
+        browse_pages(pager, "📝 TASK LIST", 60, render, "\n⚠️ No tasks found.\n")
     except Exception as e:
         print(f"❌ Error listing tasks: {e}")
     finally:
@@ -395,14 +516,29 @@ def list_tasks():
 
 def find_task():
     """Find a task by ID or name."""
-    session = SessionLocal()
+    session = action_session()
     try:
         search_term = input("Enter task ID or name to search: ").strip()
         if search_term.isdigit():
-            task = session.query(Task).filter(Task.id == int(search_term)).first()
+            task_id = int(search_term)
         else:
-            task = session.query(Task).filter(Task.name.ilike(f"%{search_term}%")).first()
+            task_id = search_matches(
+                session,
+                task_listing_select(),
+                Task,
+                search_term,
+                "📝 MATCHING TASKS",
+                60,
+                lambda t: print(
+                    f"ID: {t.id} | Name: {t.name} | Project: {t.project_name} | "
+                    f"Status: {t.status} | Due: {t.due_date or '-'}"
+                ),
+                f"⚠️ Task '{search_term}' not found.",
+            )
+            if task_id is None:
+                return
 
+        task = profiled_query(session, Task, "detail").filter(Task.id == task_id).first()
         if not task:
             print(f"⚠️ Task '{search_term}' not found.")
             return
@@ -433,14 +569,14 @@ def find_task():
 
 def update_task():
     """Update a task’s name, description, status, due date, project, or user."""
-    session = SessionLocal()
+    session = action_session()
     try:
         task_id = input("Enter the task ID to update: ").strip()
         if not task_id.isdigit():
             print("❌ Invalid task ID.")
             return
 
-        task = session.query(Task).filter(Task.id == int(task_id)).first()
+        task = profiled_query(session, Task, "lookup").filter(Task.id == int(task_id)).first()
         if not task:
             print(f"⚠️ No task found with ID {task_id}.")
             return
@@ -457,11 +593,9 @@ def update_task():
             task.description = new_desc
 
         print(f"Current status: {task.status}")
-        print("Status options: 1=To Do, 2=In Progress, 3=Done")
+        print(f"Status options: {menu_options(TaskStatus)}")
         new_status = input("Select new status (1-3) (leave blank to keep current): ").strip()
-        if new_status in ('1', '2', '3'):
-            status_map = {'1': 'To Do', '2': 'In Progress', '3': 'Done'}
-            task.status = status_map[new_status]
+        task.status = menu_choice(TaskStatus, new_status, task.status)
 
         print(f"Current due date: {task.due_date or '-'}")
         new_due = input("New due date [YYYY-MM-DD] (leave blank to keep current): ").strip()
@@ -486,7 +620,7 @@ def update_task():
             if not new_proj.isdigit():
                 print("❌ Invalid project ID.")
                 return
-            proj = session.query(Project).filter(Project.id == int(new_proj)).first()
+            proj = lookup_project(session, new_proj)
             if not proj:
                 print(f"❌ Project with ID {new_proj} does not exist!")
                 return
@@ -494,7 +628,7 @@ def update_task():
 
         # Reassign user 
         print(f"Current assigned user ID: {task.user_id or 'None'}")
-        users = session.query(User).all()
+        users = all_users(session)
         if users:
             for u in users:
                 print(f"  {u.id}. {u.name} ({u.email})")
@@ -502,7 +636,7 @@ def update_task():
         if new_user == '0':
             task.user_id = None
         elif new_user.isdigit():
-            u = session.query(User).filter(User.id == int(new_user)).first()
+            u = lookup_user(session, new_user)
             if not u:
                 print("❌ Invalid user ID.")
                 return
@@ -519,14 +653,14 @@ def update_task():
 
 def delete_task():
     """Delete a task."""
-    session = SessionLocal()
+    session = action_session()
     try:
         task_id = input("Enter the task ID to delete: ").strip()
         if not task_id.isdigit():
             print("❌ Invalid task ID.")
             return
 
-        task = session.query(Task).filter(Task.id == int(task_id)).first()
+        task = profiled_query(session, Task, "delete").filter(Task.id == int(task_id)).first()
         if not task:
             print(f"⚠️ No task found with ID {task_id}.")
             return
@@ -548,14 +682,14 @@ def delete_task():
 
 def view_task_details():
     """Display details for a given task."""
-    session = SessionLocal()
+    session = action_session()
     try:
         task_id = input("Enter the task ID to view details: ").strip()
         if not task_id.isdigit():
             print("❌ Invalid task ID.")
             return
 
-        task = session.query(Task).filter(Task.id == int(task_id)).first()
+        task = profiled_query(session, Task, "detail").filter(Task.id == int(task_id)).first()
         if not task:
             print(f"⚠️ No task found with ID {task_id}.")
             return
@@ -588,7 +722,7 @@ def view_task_details():
 
 def create_user():
     """Create a new user with name and email."""
-    session = SessionLocal()
+    session = action_session()
     try:
         print("\n👤 CREATE NEW USER")
         print("=" * 40)
@@ -604,7 +738,7 @@ def create_user():
             return
 
         # Check for duplicate email or name
-        existing = session.query(User).filter(
+        existing = profiled_query(session, User, "lookup").filter(
             sa.or_(User.email == email, User.name == name)
         ).first()
         if existing:
@@ -615,7 +749,10 @@ def create_user():
         session.add(user)
         session.commit()
 
-        print(f"✅ User '{name}' created successfully (ID: {user.id})")
+        if in_batch():
+            print(f"✅ User '{name}' queued; will be created on commit.")
+        else:
+            print(f"✅ User '{name}' created successfully (ID: {user.id})")
 
     except Exception as e:
         session.rollback()
@@ -624,19 +761,23 @@ def create_user():
         session.close()
 
 def list_users():
-    """List all users."""
-    session = SessionLocal()
+    """List all users, one page at a time."""
+    session = action_session()
     try:
-        users = session.query(User).order_by(User.name).all()
-        if not users:
-            print("\n⚠️ No users found.\n")
-            return
-
-        print("\n👥 USER LIST")
-        print("=" * 50)
-        for u in users:
-            print(f"ID: {u.id} | Name: {u.name} | Email: {u.email}")
-        print("=" * 50)
+        pager = KeysetPager(
+            session,
+            lambda predicate, limit: user_listing_select(predicate, limit=limit),
+            User.name,
+            User.id,
+            key=lambda u: (u.name, u.id),
+        )
+        browse_pages(
+            pager,
+            "👥 USER LIST",
+            50,
+            lambda u: print(f"ID: {u.id} | Name: {u.name} | Email: {u.email}"),
+            "\n⚠️ No users found.\n",
+        )
     except Exception as e:
         print(f"❌ Error listing users: {e}")
     finally:
@@ -644,14 +785,26 @@ def list_users():
 
 def find_user():
     """Find a user by ID or name."""
-    session = SessionLocal()
+    session = action_session()
     try:
         search_term = input("Enter user ID or name to search: ").strip()
         if search_term.isdigit():
-            user = session.query(User).filter(User.id == int(search_term)).first()
+            user_id = int(search_term)
         else:
-            user = session.query(User).filter(User.name.ilike(f"%{search_term}%")).first()
+            user_id = search_matches(
+                session,
+                user_listing_select(),
+                User,
+                search_term,
+                "👥 MATCHING USERS",
+                50,
+                lambda u: print(f"ID: {u.id} | Name: {u.name} | Email: {u.email}"),
+                f"⚠️ User '{search_term}' not found.",
+            )
+            if user_id is None:
+                return
 
+        user = profiled_query(session, User, "detail").filter(User.id == user_id).first()
         if not user:
             print(f"⚠️ User '{search_term}' not found.")
             return
@@ -670,14 +823,14 @@ def find_user():
 
 def delete_user():
     """Delete a user by ID."""
-    session = SessionLocal()
+    session = action_session()
     try:
         user_id = input("Enter the user ID to delete: ").strip()
         if not user_id.isdigit():
             print("❌ Invalid user ID.")
             return
 
-        user = session.query(User).filter(User.id == int(user_id)).first()
+        user = lookup_user(session, user_id)
         if not user:
             print(f"⚠️ No user found with ID {user_id}.")
             return
@@ -687,7 +840,7 @@ def delete_user():
             print("❌ Deletion cancelled.")
             return
 
-        session.delete(user)
+        operations.delete_user(session, user.id)
         session.commit()
         print(f"✅ User '{user.name}' has been deleted.")
 
@@ -696,3 +849,27 @@ def delete_user():
         print(f"❌ Error deleting user: {e}")
     finally:
         session.close()
+
+def view_workload():
+    """Each user's tasks by status, overdue count and next due date, busiest first."""
+    session = action_session()
+    try:
+        rows = ReportService(session).workload()
+        if not rows:
+            print("\n⚠️ No tasks found.\n")
+            return
+
+        print("\n📊 WORKLOAD")
+        print("=" * 100)
+        for w in rows:
+            who = f"ID: {w.id} | {w.name}" if w.id is not None else "Unassigned"
+            print(
+                f"{who} | To Do: {w.todo_count} | In Progress: {w.in_progress_count} | "
+                f"Done: {w.done_count} | Overdue: {w.overdue_count} | Next due: {w.first_due or '-'}"
+            )
+        print("=" * 100)
+
+    except Exception as e:
+        print(f"❌ Error building the workload: {e}")
+    finally:
+        session.close()
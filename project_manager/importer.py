@@ -0,0 +1,386 @@
+# project_manager/importer.py
+"""
+Bulk import of projects, tasks or users from CSV or JSONL files.
+
+    pipenv run python -m project_manager.importer tasks backlog.csv [--rejects bad.csv]
+
+Rows are streamed from the file and handled a chunk at a time: names are
+resolved and uniqueness is checked with one query per chunk, the same rules
+as the model validators are applied, and the valid rows go in as a single
+executemany inside that chunk's own transaction. Rows that fail are written,
+in input order with their line number and the reason, to a reject file in
+the input's format.
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from collections import namedtuple
+from datetime import date
+from itertools import islice
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import insert, or_, select
+from project_manager.models import SQLITE_PROFILES, create_sqlite_engine, database_url, get_engine
+from project_manager.models.enums import Priority, ProjectStatus, TaskStatus
+from project_manager.models.project import Project, check_deadline
+from project_manager.models.task import Task, check_due_date
+from project_manager.models.user import User
+from project_manager.schema import ensure_schema
+
+DEFAULT_CHUNK_SIZE = 5000
+
+ImportReport = namedtuple("ImportReport", "inserted rejected seconds")
+
+# A JSONL line that is not a JSON object: rejected before validation.
+UnreadableRecord = namedtuple("UnreadableRecord", "record error")
+
+
+class RejectedRow(ValueError):
+    """A row that fails validation; the message is written to the reject file."""
+
+
+# ─── Reading & Writing ───────────────────────────────────────────────────────
+
+def _is_csv(path: str) -> bool:
+    return path.lower().endswith(".csv")
+
+
+def read_records(path: str):
+    """
+    Stream (line number, record) pairs from a CSV (with a header row) or
+    JSONL file, records as dicts. Empty CSV cells become None. A JSONL line
+    that does not parse, or is not an object, comes out as an UnreadableRecord.
+    """
+    with open(path, newline="", encoding="utf-8") as fh:
+        if _is_csv(path):
+            reader = csv.DictReader(fh)
+            for record in reader:
+                yield reader.line_num, {k: (v if v != "" else None) for k, v in record.items()}
+        else:
+            for number, line in enumerate(fh, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError as e:
+                    yield number, UnreadableRecord({"raw": line.rstrip("\r\n")}, f"line {number}: {e}")
+                    continue
+                if isinstance(record, dict):
+                    yield number, record
+                else:
+                    yield number, UnreadableRecord(
+                        {"raw": line.rstrip("\r\n")},
+                        f"line {number}: expected a JSON object, got {type(record).__name__}",
+                    )
+
+
+class RejectWriter:
+    """
+    Lazily opened reject file in the same format as the input, with extra
+    `line` (of the input) and `error` fields on every row.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.count = 0
+        self._fh = None
+        self._csv = None
+
+    def write(self, line: int, record: dict, error: str):
+        if self._fh is None:
+            self._fh = open(self.path, "w", newline="", encoding="utf-8")
+            if _is_csv(self.path):
+                self._csv = csv.DictWriter(self._fh, fieldnames=["line", *record, "error"], extrasaction="ignore")
+                self._csv.writeheader()
+        row = {"line": line, **record, "error": error}
+        if self._csv is not None:
+            self._csv.writerow(row)
+        else:
+            self._fh.write(json.dumps(row, default=str) + "\n")
+        self.count += 1
+
+    def close(self):
+        if self._fh is not None:
+            self._fh.close()
+
+# ─── Field Parsing ───────────────────────────────────────────────────────────
+
+def _text(record, field, required=False):
+    value = record.get(field)
+    value = str(value).strip() if value is not None else ""
+    if required and not value:
+        raise RejectedRow(f"{field} is required")
+    return value or None
+
+
+def _date(record, field, required=False):
+    value = _text(record, field, required)
+    if value is None:
+        return None
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise RejectedRow(f"{field} '{value}' is not a YYYY-MM-DD date") from None
+
+
+def _choice(record, field, enum_class, default):
+    value = _text(record, field)
+    if value is None:
+        return default
+    try:
+        return enum_class.parse(value, field)
+    except ValueError as e:
+        raise RejectedRow(str(e).rstrip(".")) from None
+
+
+def _id(record, field):
+    value = _text(record, field)
+    if value is None:
+        return None
+    if not value.isdigit():
+        raise RejectedRow(f"{field} '{value}' is not an ID")
+    return int(value)
+
+
+def _ref(record, field):
+    """An ID (digits) or exact name, as the CLI's --project/--user take them."""
+    value = _text(record, field)
+    return int(value) if value is not None and value.isdigit() else value
+
+
+def _describe(ref) -> str:
+    return f"ID {ref}" if isinstance(ref, int) else f"'{ref}'"
+
+# ─── Chunk Validation ────────────────────────────────────────────────────────
+# Each validator takes the connection and a list of (line, raw record) pairs
+# and returns (valid rows ready for INSERT, [(line, record, error), ...]).
+
+def _validate_users(conn, records):
+    parsed, rejected = [], []
+    for line, record in records:
+        try:
+            row = {"name": _text(record, "name", True), "email": _text(record, "email", True)}
+            parsed.append((line, record, row))
+        except RejectedRow as e:
+            rejected.append((line, record, str(e)))
+
+    names = {row["name"] for _, _, row in parsed}
+    emails = {row["email"] for _, _, row in parsed}
+    taken = conn.execute(
+        select(User.name, User.email).where(or_(User.name.in_(names), User.email.in_(emails)))
+    ).all()
+    taken_names = {name for name, _ in taken}
+    taken_emails = {email for _, email in taken}
+
+    valid = []
+    for line, record, row in parsed:
+        if row["name"] in taken_names or row["email"] in taken_emails:
+            rejected.append((line, record, "a user with that name or email already exists"))
+            continue
+        taken_names.add(row["name"])
+        taken_emails.add(row["email"])
+        valid.append(row)
+    return valid, rejected
+
+
+def _validate_projects(conn, records):
+    today = date.today()
+    parsed, rejected = [], []
+    for line, record in records:
+        try:
+            row = {
+                "name": _text(record, "name", True),
+                "description": _text(record, "description"),
+                "start_date": _date(record, "start_date") or today,
+                "deadline": _date(record, "deadline", True),
+                "priority": _choice(record, "priority", Priority, Priority.MEDIUM),
+                "status": _choice(record, "status", ProjectStatus, ProjectStatus.ACTIVE),
+            }
+            check_deadline(row["start_date"], row["deadline"])
+            parsed.append((line, record, row))
+        except ValueError as e:
+            rejected.append((line, record, str(e)))
+
+    names = {row["name"] for _, _, row in parsed}
+    taken = set(conn.execute(select(Project.name).where(Project.name.in_(names))).scalars())
+
+    valid = []
+    for line, record, row in parsed:
+        if row["name"] in taken:
+            rejected.append((line, record, f"a project named '{row['name']}' already exists"))
+            continue
+        taken.add(row["name"])
+        valid.append(row)
+    return valid, rejected
+
+
+def _validate_tasks(conn, records):
+    today = date.today()
+    parsed, rejected = [], []
+    for line, record in records:
+        try:
+            project_ref = _id(record, "project_id") or _ref(record, "project")
+            if project_ref is None:
+                raise RejectedRow("project or project_id is required")
+            row = {
+                "name": _text(record, "name", True),
+                "description": _text(record, "description"),
+                "status": _choice(record, "status", TaskStatus, TaskStatus.TODO),
+                "due_date": _date(record, "due_date"),
+            }
+            parsed.append((line, record, row, project_ref, _id(record, "user_id") or _ref(record, "user")))
+        except RejectedRow as e:
+            rejected.append((line, record, str(e)))
+
+    # Resolve every project and user the chunk mentions, by ID or by name, in one query each.
+    project_refs = {ref for _, _, _, ref, _ in parsed}
+    user_refs = {ref for _, _, _, _, ref in parsed if ref is not None}
+    projects = {}
+    for project_id, name, deadline in conn.execute(
+        select(Project.id, Project.name, Project.deadline).where(or_(
+            Project.id.in_([r for r in project_refs if isinstance(r, int)]),
+            Project.name.in_([r for r in project_refs if isinstance(r, str)]),
+        ))
+    ):
+        projects[project_id] = projects[name] = (project_id, deadline)
+    users = {}
+    for user_id, name in conn.execute(
+        select(User.id, User.name).where(or_(
+            User.id.in_([r for r in user_refs if isinstance(r, int)]),
+            User.name.in_([r for r in user_refs if isinstance(r, str)]),
+        ))
+    ):
+        users[user_id] = users[name] = user_id
+
+    valid = []
+    for line, record, row, project_ref, user_ref in parsed:
+        try:
+            if project_ref not in projects:
+                raise RejectedRow(f"project {_describe(project_ref)} does not exist")
+            if user_ref is not None and user_ref not in users:
+                raise RejectedRow(f"user {_describe(user_ref)} does not exist")
+            row["project_id"], deadline = projects[project_ref]
+            row["user_id"] = users.get(user_ref)
+            check_due_date(row["due_date"], deadline, today)
+            valid.append(row)
+        except ValueError as e:
+            rejected.append((line, record, str(e)))
+    return valid, rejected
+
+
+IMPORTERS = {
+    "projects": (Project, _validate_projects),
+    "tasks": (Task, _validate_tasks),
+    "users": (User, _validate_users),
+}
+
+# ─── Import ──────────────────────────────────────────────────────────────────
+
+def default_reject_path(path: str) -> str:
+    stem, ext = os.path.splitext(path)
+    return f"{stem}.rejects{ext or '.jsonl'}"
+
+
+def import_records(kind, records, rejects, bind=None, chunk_size=DEFAULT_CHUNK_SIZE, progress=None):
+    """
+    Validate and insert `records` (an iterable of (line number, dict) pairs)
+    as `kind` rows, one transaction per chunk. Rejected records, and any
+    UnreadableRecords, go to `rejects.write()` in line order.
+    Returns an ImportReport.
+    """
+    if kind not in IMPORTERS:
+        raise ValueError(f"Unknown import kind '{kind}'. Choose one of: {', '.join(IMPORTERS)}.")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1.")
+    model, validate = IMPORTERS[kind]
+    bind = bind or get_engine()
+    records = iter(records)
+
+    inserted = rejected = 0
+    started = time.perf_counter()
+    while True:
+        chunk = list(islice(records, chunk_size))
+        if not chunk:
+            break
+        unreadable = [(line, *record) for line, record in chunk if isinstance(record, UnreadableRecord)]
+        if unreadable:
+            chunk = [(line, record) for line, record in chunk if not isinstance(record, UnreadableRecord)]
+        with bind.begin() as conn:
+            valid, bad = validate(conn, chunk) if chunk else ([], [])
+            if valid:
+                conn.execute(insert(model), valid)
+        bad = sorted(unreadable + bad, key=lambda reject: reject[0])
+        for line, record, error in bad:
+            rejects.write(line, record, error)
+        inserted += len(valid)
+        rejected += len(bad)
+        if progress:
+            progress(inserted, rejected, time.perf_counter() - started)
+    return ImportReport(inserted, rejected, time.perf_counter() - started)
+
+
+def import_file(kind, path, reject_path=None, bind=None, chunk_size=DEFAULT_CHUNK_SIZE, progress=None):
+    """
+    Import a CSV/JSONL file; see import_records. Rejects go to `reject_path`
+    (default: <input>.rejects.<ext>), which is only created if a row fails.
+    """
+    rejects = RejectWriter(reject_path or default_reject_path(path))
+    try:
+        return import_records(kind, read_records(path), rejects, bind, chunk_size, progress)
+    finally:
+        rejects.close()
+
+
+def print_report(report: ImportReport, reject_path: str):
+    rate = report.inserted / report.seconds if report.seconds else 0.0
+    print(f"✅ Imported {report.inserted} rows in {report.seconds:.2f}s ({rate:,.0f} rows/sec).")
+    if report.rejected:
+        print(f"⚠️ Rejected {report.rejected} rows; see {reject_path}")
+
+
+def _chunk_size_arg(value):
+    try:
+        size = int(value)
+    except ValueError:
+        size = 0
+    if size < 1:
+        raise argparse.ArgumentTypeError(f"'{value}' is not a number of rows (1 or more)")
+    return size
+
+
+def build_parser(parser=None):
+    parser = parser or argparse.ArgumentParser(description="Bulk import projects, tasks or users.")
+    parser.add_argument("kind", choices=list(IMPORTERS), help="what the file contains")
+    parser.add_argument("path", help="CSV (with header) or JSONL file")
+    parser.add_argument("--rejects", help="where to write rejected rows (default <input>.rejects.<ext>)")
+    parser.add_argument("--chunk-size", type=_chunk_size_arg, default=DEFAULT_CHUNK_SIZE, help="rows per transaction")
+    parser.add_argument("--pragma-profile", choices=list(SQLITE_PROFILES),
+                        help="SQLite profile for this import, e.g. bulk-load")
+    return parser
+
+
+def run(args):
+    ensure_schema()
+    bind = (
+        create_sqlite_engine(database_url(), args.pragma_profile) if args.pragma_profile else get_engine()
+    )
+    reject_path = args.rejects or default_reject_path(args.path)
+    report = import_file(
+        args.kind,
+        args.path,
+        reject_path,
+        bind=bind,
+        chunk_size=args.chunk_size,
+        progress=lambda done, bad, secs: print(f"   {done} imported, {bad} rejected ({secs:.1f}s)"),
+    )
+    print_report(report, reject_path)
+    return report
+
+
+if __name__ == "__main__":
+    run(build_parser().parse_args())
@@ -0,0 +1,150 @@
+# project_manager/instrumentation.py
+"""
+Per-command SQL instrumentation.
+
+    with profile_queries() as profile:
+        list_tasks()
+    print_profile(profile, "list_tasks")
+
+While the block runs, before/after_cursor_execute hooks record every
+statement any engine sends: how many, the time spent in the database, the
+rows returned (or affected) and the slowest ones. Statements that run again
+and again with the same shape and different parameters are reported as
+likely N+1 patterns, e.g. one lazy load of Task.project per task. cli.py
+exposes this as the --profile flag.
+"""
+
+import re
+import sys
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+N_PLUS_ONE_THRESHOLD = 3  # same shape this many times in one command
+SHOW_SLOWEST = 3
+
+_IN_LIST_RE = re.compile(r"IN \((?:\?|%s|:\w+)(?:, ?(?:\?|%s|:\w+))*\)")
+_LITERAL_RE = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_SPACE_RE = re.compile(r"\s+")
+_SELECT_LIST_RE = re.compile(r"^SELECT .+? FROM ")
+
+
+def statement_shape(statement: str) -> str:
+    """The statement with literals and IN lists collapsed, on one line."""
+    shape = _IN_LIST_RE.sub("IN (...)", statement)
+    shape = _LITERAL_RE.sub("?", shape)
+    return _SPACE_RE.sub(" ", shape).strip()
+
+
+class _RowCountingCursor:
+    """Wraps a DBAPI cursor to add the rows it hands out to a statement record."""
+
+    def __init__(self, cursor, record):
+        self._cursor = cursor
+        self._record = record
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def fetchone(self):
+        row = self._cursor.fetchone()
+        if row is not None:
+            self._record["rows"] += 1
+        return row
+
+    def fetchmany(self, *args):
+        rows = self._cursor.fetchmany(*args)
+        self._record["rows"] += len(rows)
+        return rows
+
+    def fetchall(self):
+        rows = self._cursor.fetchall()
+        self._record["rows"] += len(rows)
+        return rows
+
+
+class QueryProfile:
+    """Statements recorded by one profile_queries() block."""
+
+    def __init__(self):
+        self.statements = []   # {"sql", "shape", "seconds", "rows"} in execution order
+        self.wall_seconds = 0.0
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    @property
+    def db_seconds(self) -> float:
+        return sum(s["seconds"] for s in self.statements)
+
+    @property
+    def rows(self) -> int:
+        return sum(s["rows"] for s in self.statements)
+
+    def slowest(self, n=SHOW_SLOWEST):
+        return sorted(self.statements, key=lambda s: s["seconds"], reverse=True)[:n]
+
+    def repeated_shapes(self, threshold=N_PLUS_ONE_THRESHOLD):
+        """[(shape, times run)] for shapes run at least `threshold` times, most first."""
+        counts = Counter(s["shape"] for s in self.statements)
+        return [(shape, n) for shape, n in counts.most_common() if n >= threshold]
+
+    # Engine event hooks
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_start_time"].pop()
+        record = {"sql": statement, "shape": statement_shape(statement), "seconds": elapsed, "rows": 0}
+        if cursor.description is None:
+            record["rows"] = max(cursor.rowcount, 0)
+        elif context is not None:
+            # Rows are fetched after this hook, so count them as the result reads them.
+            context.cursor = _RowCountingCursor(cursor, record)
+        self.statements.append(record)
+
+
+@contextmanager
+def profile_queries(bind=Engine):
+    """
+    Record every statement run through `bind` (default: every engine) inside
+    the block, and yield the QueryProfile being filled in.
+    """
+    profile = QueryProfile()
+    event.listen(bind, "before_cursor_execute", profile._before_cursor_execute)
+    event.listen(bind, "after_cursor_execute", profile._after_cursor_execute)
+    started = time.perf_counter()
+    try:
+        yield profile
+    finally:
+        profile.wall_seconds = time.perf_counter() - started
+        event.remove(bind, "before_cursor_execute", profile._before_cursor_execute)
+        event.remove(bind, "after_cursor_execute", profile._after_cursor_execute)
+
+
+def _short(sql: str, width=100) -> str:
+    """One line, with the column list of a SELECT elided so the FROM/WHERE shows."""
+    sql = _SELECT_LIST_RE.sub("SELECT ... FROM ", _SPACE_RE.sub(" ", sql).strip(), count=1)
+    return sql if len(sql) <= width else sql[:width - 3] + "..."
+
+
+def print_profile(profile: QueryProfile, title="command", file=None):
+    """Print a short report of a QueryProfile (to stdout unless `file` is given)."""
+    file = file or sys.stdout
+    print(f"\n🔎 SQL profile: {title}", file=file)
+    print(
+        f"   {profile.count} statements, {profile.db_seconds * 1000:.1f} ms in the database "
+        f"({profile.wall_seconds * 1000:.1f} ms total), {profile.rows} rows",
+        file=file,
+    )
+    if profile.statements:
+        print("   Slowest:", file=file)
+        for s in profile.slowest():
+            print(f"   {s['seconds'] * 1000:8.2f} ms {s['rows']:>7} rows  {_short(s['sql'])}", file=file)
+    for shape, times in profile.repeated_shapes():
+        print(f"   ⚠️ Possible N+1: {times} × {_short(shape)}", file=file)
@@ -1,22 +1,195 @@
 # project_manager/models/__init__.py
 
 import os
-from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+import re
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import declarative_base, sessionmaker
+from project_manager.config import get_setting
 
 ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
 DB_DIR = os.path.join(ROOT_DIR, "db")
-if not os.path.isdir(DB_DIR):
-    os.makedirs(DB_DIR, exist_ok=True)
 
-SQLALCHEMY_DATABASE_URL = f"sqlite:///{os.path.join(DB_DIR, 'database.db')}"
-
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False},
-    echo=False,
+SQLALCHEMY_DATABASE_URL = get_setting(
+    "database_url", f"sqlite:///{os.path.join(DB_DIR, 'database.db')}"
 )
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Workspaces: one SQLite file per team. "default" is the database above;
+# every other workspace NAME lives in WORKSPACE_DIR/NAME.db. Pick one with
+# the PM_WORKSPACE environment variable, `workspace` in project_manager.ini
+# or `cli.py --workspace NAME`.
+DEFAULT_WORKSPACE = "default"
+WORKSPACE_DIR = get_setting("workspace_dir", os.path.join(DB_DIR, "workspaces"))
+_WORKSPACE_NAME_RE = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_-]*$")
+_workspace = get_setting("workspace", DEFAULT_WORKSPACE)
+
+# Pragmas applied to every new connection. Pick one with the PM_SQLITE_PROFILE
+# environment variable or `sqlite_profile` in project_manager.ini.
+#   safe      - WAL with a full fsync per commit; survives power loss
+#   fast      - WAL syncing only at checkpoints; survives crashes, not power loss
+#   bulk-load - no fsync at all, for one-off imports you can redo
+SQLITE_PROFILES = {
+    "safe": {
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+        "cache_size": -16000,        # KiB (negative) -> 16 MB
+        "mmap_size": 0,
+        "temp_store": "DEFAULT",
+        "busy_timeout": 5000,        # ms
+    },
+    "fast": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -64000,
+        "mmap_size": 268435456,      # 256 MB
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    },
+    "bulk-load": {
+        "journal_mode": "WAL",
+        "synchronous": "OFF",
+        "cache_size": -256000,
+        "mmap_size": 1073741824,     # 1 GB
+        "temp_store": "MEMORY",
+        "busy_timeout": 30000,
+    },
+}
+SQLITE_PROFILE = get_setting("sqlite_profile", "safe")
+
+
+def apply_sqlite_profile(dbapi_connection, profile: str, read_only: bool = False):
+    """
+    Run the pragmas of the named profile on a raw sqlite3 connection.
+    Read-only connections can't change the journal mode, so they skip it.
+    Foreign keys are enforced under every profile: deletes rely on the
+    ON DELETE CASCADE / SET NULL actions of the schema.
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma, value in SQLITE_PROFILES[profile].items():
+            if read_only and pragma == "journal_mode":
+                continue
+            cursor.execute(f"PRAGMA {pragma} = {value}")
+        cursor.execute("PRAGMA foreign_keys = ON")
+    finally:
+        cursor.close()
+
+
+def read_only_url(url: str) -> str:
+    """
+    Turn a sqlite:///path URL into one that opens the file read-only.
+    """
+    path = url[len("sqlite:///"):]
+    return f"sqlite:///file:{path}?mode=ro&uri=true"
+
+
+def create_sqlite_engine(url: str, profile: str = SQLITE_PROFILE, read_only: bool = False, **engine_kw):
+    """
+    Engine for a SQLite URL whose connections all use the given profile.
+    With read_only=True every connection opens the file in read-only mode.
+    Extra keyword arguments (e.g. pool_size) go to create_engine.
+    """
+    if profile not in SQLITE_PROFILES:
+        raise ValueError(
+            f"Unknown SQLite profile '{profile}'. Choose one of: {', '.join(SQLITE_PROFILES)}."
+        )
+    sqlite_engine = create_engine(
+        read_only_url(url) if read_only else url,
+        connect_args={"check_same_thread": False},
+        echo=False,
+        **engine_kw,
+    )
+    event.listen(
+        sqlite_engine,
+        "connect",
+        lambda dbapi_connection, connection_record: apply_sqlite_profile(
+            dbapi_connection, profile, read_only
+        ),
+    )
+    return sqlite_engine
+
+
+def enable_savepoints(sqlite_engine, begin: str = "BEGIN"):
+    """
+    Have this engine's connections open their transactions with `begin`
+    (e.g. "BEGIN IMMEDIATE") as soon as SQLAlchemy begins one. pysqlite on
+    its own only opens a transaction at the first DML statement, which
+    breaks SAVEPOINTs: a SAVEPOINT issued first becomes the transaction.
+    """
+    def driver_autocommit(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    event.listen(sqlite_engine, "connect", driver_autocommit)
+    event.listen(sqlite_engine, "begin", lambda conn: conn.exec_driver_sql(begin))
+
+
+def workspace_url(name: str) -> str:
+    """The database URL of a workspace. Raises ValueError for a bad name."""
+    if not _WORKSPACE_NAME_RE.match(name or ""):
+        raise ValueError(
+            f"Workspace name '{name}' must start with a letter or digit and use only "
+            "letters, digits, '-' and '_'."
+        )
+    if name == DEFAULT_WORKSPACE:
+        return SQLALCHEMY_DATABASE_URL
+    return f"sqlite:///{os.path.join(WORKSPACE_DIR, name + '.db')}"
+
+
+def current_workspace() -> str:
+    return _workspace
+
+
+def database_url() -> str:
+    """The URL of the current workspace's database."""
+    return workspace_url(_workspace)
+
+
+# The engine is built on first use rather than at import, so importing the
+# models (or running `cli.py --help`) never touches the disk.
+_engine = None
+
+
+def use_workspace(name: str):
+    """
+    Make `name` the current workspace: get_engine() and SessionLocal switch
+    to its database. Sessions already open keep the old one, so call this
+    before the first session (the CLI does it while parsing --workspace).
+    """
+    global _workspace, _engine
+    workspace_url(name)
+    if name != _workspace:
+        if _engine is not None:
+            _engine.dispose()
+        _workspace, _engine = name, None
+        SessionLocal.kw.pop("bind", None)
+
+
+def get_engine():
+    """The application engine, created (with its db/ directory) on first call."""
+    global _engine
+    if _engine is None:
+        url = database_url()
+        db_path = url[len("sqlite:///"):]
+        if os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        _engine = create_sqlite_engine(url)
+    return _engine
+
+
+def __getattr__(name):
+    # `from project_manager.models import engine` keeps working, lazily.
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class LazySessionmaker(sessionmaker):
+    """A sessionmaker that binds to get_engine() when the first session is made."""
+
+    def __call__(self, **local_kw):
+        if self.kw.get("bind") is None and "bind" not in local_kw:
+            self.kw["bind"] = get_engine()
+        return super().__call__(**local_kw)
+
+
+SessionLocal = LazySessionmaker(autocommit=False, autoflush=False)
 Base = declarative_base()
@@ -0,0 +1,94 @@
+# project_manager/models/enums.py
+
+import enum
+from sqlalchemy import SmallInteger
+from sqlalchemy.types import TypeDecorator
+
+# Statuses and priorities are stored as small integer codes (one byte per
+# row and index entry instead of a string) and checked by CHECK constraints.
+# These enums are the one definition of the codes and their display labels;
+# alembic revision 8b2d4f61c9e3 converted the old string columns.
+
+
+class CodedEnum(enum.Enum):
+    """
+    An enum whose members are (code, label). str() gives the label, so
+    f-strings and json.dumps(..., default=str) show "In Progress", not 2.
+    """
+
+    def __new__(cls, code, label):
+        member = object.__new__(cls)
+        member._value_ = code
+        member.label = label
+        return member
+
+    def __str__(self):
+        return self.label
+
+    @classmethod
+    def labels(cls) -> tuple:
+        return tuple(member.label for member in cls)
+
+    @classmethod
+    def parse(cls, value, field="Value"):
+        """
+        The member for a member, a code, or a label or name in any case
+        ("done", "IN_PROGRESS"). Raises ValueError for anything else.
+        """
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, int) and not isinstance(value, bool):
+            if value in cls._value2member_map_:
+                return cls(value)
+        elif isinstance(value, str):
+            key = value.strip().lower()
+            for member in cls:
+                if key in (member.label.lower(), member.name.lower()):
+                    return member
+        raise ValueError(f"{field} '{value}' must be one of: {', '.join(cls.labels())}.")
+
+    @classmethod
+    def check_sql(cls, column: str) -> str:
+        """SQL for a CHECK constraint allowing only the codes in `column`."""
+        return f"{column} IN ({', '.join(str(member.value) for member in cls)})"
+
+
+class TaskStatus(CodedEnum):
+    TODO = (1, "To Do")
+    IN_PROGRESS = (2, "In Progress")
+    DONE = (3, "Done")
+
+
+class ProjectStatus(CodedEnum):
+    ACTIVE = (1, "Active")
+    COMPLETED = (2, "Completed")
+
+
+class Priority(CodedEnum):
+    HIGH = (1, "High")
+    MEDIUM = (2, "Medium")
+    LOW = (3, "Low")
+
+
+class CodedEnumType(TypeDecorator):
+    """
+    A CodedEnum column stored as its SMALLINT code. Binds accept whatever
+    CodedEnum.parse does, so filters like Task.status == "done" still work;
+    rows come back as members.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_class):
+        super().__init__()
+        self.enum_class = enum_class
+
+    def process_bind_param(self, value, dialect):
+        return None if value is None else self.enum_class.parse(value).value
+
+    def process_literal_param(self, value, dialect):
+        return self.process_bind_param(value, dialect)
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else self.enum_class(value)
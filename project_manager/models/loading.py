@@ -0,0 +1,64 @@
+# project_manager/models/loading.py
+
+from sqlalchemy.orm import raiseload, selectinload
+
+from .project import Project
+from .task import Task
+from .user import User
+
+# Relationships default to lazy="select"; each helper picks one of these
+# named profiles so it loads exactly the graph it renders. Anything outside
+# the profile raises instead of silently emitting a lazy load per row.
+#
+#   listing - rows shown in a list view
+#   detail  - a single row shown with everything it displays
+#   lookup  - a single row fetched to read or edit its own columns
+#   delete  - a row about to be deleted, with what its cascades need
+LOADER_PROFILES = {
+    Project: {
+        # Progress comes from SQL aggregates, so tasks are never loaded here.
+        "listing": lambda: (raiseload("*"),),
+        "detail": lambda: (raiseload("*"),),
+        "lookup": lambda: (raiseload("*"),),
+        # Tasks are removed by ON DELETE CASCADE, so nothing is loaded.
+        "delete": lambda: (raiseload("*"),),
+    },
+    Task: {
+        "listing": lambda: (
+            selectinload(Task.project).raiseload("*"),
+            selectinload(Task.user).raiseload("*"),
+            raiseload("*"),
+        ),
+        "detail": lambda: (
+            selectinload(Task.project).raiseload("*"),
+            selectinload(Task.user).raiseload("*"),
+            raiseload("*"),
+        ),
+        # The due_date validator and deadline check read task.project.
+        "lookup": lambda: (selectinload(Task.project).raiseload("*"), raiseload("*")),
+        "delete": lambda: (raiseload("*"),),
+    },
+    User: {
+        "listing": lambda: (raiseload("*"),),
+        "detail": lambda: (raiseload("*"),),
+        "lookup": lambda: (raiseload("*"),),
+        # Tasks are unassigned by ON DELETE SET NULL, so nothing is loaded.
+        "delete": lambda: (raiseload("*"),),
+    },
+}
+
+
+def loader_options(model, profile: str) -> tuple:
+    """
+    Return the loader options for `model` under the named profile, e.g.
+    session.query(Task).options(*loader_options(Task, "listing")).
+    """
+    try:
+        return LOADER_PROFILES[model][profile]()
+    except KeyError:
+        raise ValueError(f"No loader profile '{profile}' for {model.__name__}.") from None
+
+
+def profiled_query(session, model, profile: str):
+    """Shortcut for session.query(model) with the named loader profile applied."""
+    return session.query(model).options(*loader_options(model, profile))
@@ -1,27 +1,46 @@
 # project_manager/models/project.py
 
 from datetime import date
-from sqlalchemy import Column, Integer, String, Date, Boolean
+from sqlalchemy import CheckConstraint, Column, Integer, String, Date, Boolean, case, func, select
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship, validates
 from . import Base
+from .enums import CodedEnumType, Priority, ProjectStatus, TaskStatus
+from .stats import ProjectStats
+from .task import Task
+
+
+def check_deadline(start_date, deadline):
+    """
+    Raise ValueError if the deadline falls before the start date.
+    """
+    if start_date is not None and deadline < start_date:
+        raise ValueError(f"Deadline ({deadline}) cannot be before start date ({start_date}).")
 
 
 class Project(Base):
     __tablename__ = "projects"
+    __table_args__ = (
+        CheckConstraint(Priority.check_sql("priority"), name="ck_projects_priority"),
+        CheckConstraint(ProjectStatus.check_sql("status"), name="ck_projects_status"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, unique=True, nullable=False)
     description = Column(String, nullable=True)
     start_date = Column(Date, nullable=False, default=date.today)
-    deadline = Column(Date, nullable=False)
-    priority = Column(String, nullable=False, default="Medium")  # High, Medium, Low
-    status = Column(String, nullable=False, default="Active")    # Active or Completed
+    deadline = Column(Date, nullable=False, index=True)
+    priority = Column(CodedEnumType(Priority), nullable=False, default=Priority.MEDIUM)
+    status = Column(CodedEnumType(ProjectStatus), nullable=False, default=ProjectStatus.ACTIVE)
 
+    # The tasks go with the project through ON DELETE CASCADE, so deleting a
+    # project never loads them.
     tasks = relationship(
         "Task",
         back_populates="project",
         cascade="all, delete-orphan",
-        lazy="joined",
+        passive_deletes=True,
+        lazy="select",
     )
 
     @validates("deadline")
@@ -29,22 +48,72 @@ class Project(Base):
         """
         Ensure that deadline is not before start_date.
         """
-        if deadline_value < self.start_date:
-            raise ValueError(
-                f"Deadline ({deadline_value}) cannot be before start date ({self.start_date})."
-            )
+        check_deadline(self.start_date, deadline_value)
         return deadline_value
 
-    @property
+    @validates("priority", "status")
+    def validate_choice(self, key, value):
+        """
+        Store a Priority / ProjectStatus whatever label or code was assigned.
+        """
+        enum_class = Priority if key == "priority" else ProjectStatus
+        return enum_class.parse(value, key.capitalize())
+
+    @hybrid_property
+    def task_count(self) -> int:
+        return len(self.tasks)
+
+    @task_count.expression
+    def task_count(cls):
+        return cls._stat(ProjectStats.task_count)
+
+    @hybrid_property
+    def todo_count(self) -> int:
+        return sum(1 for t in self.tasks if t.status is TaskStatus.TODO)
+
+    @todo_count.expression
+    def todo_count(cls):
+        return cls._stat(ProjectStats.todo_count)
+
+    @hybrid_property
+    def in_progress_count(self) -> int:
+        return sum(1 for t in self.tasks if t.status is TaskStatus.IN_PROGRESS)
+
+    @in_progress_count.expression
+    def in_progress_count(cls):
+        return cls._stat(ProjectStats.in_progress_count)
+
+    @hybrid_property
+    def done_count(self) -> int:
+        return sum(1 for t in self.tasks if t.status is TaskStatus.DONE)
+
+    @done_count.expression
+    def done_count(cls):
+        return cls._stat(ProjectStats.done_count)
+
+    @hybrid_property
     def completion_percentage(self) -> float:
         """
         Returns percentage of tasks marked “Done” for this project.
         """
         if not self.tasks:
             return 0.0
-        total = len(self.tasks)
-        done_count = sum(1 for t in self.tasks if t.status.lower() == "done")
-        return (done_count / total) * 100.0
+        return (self.done_count / self.task_count) * 100.0
+
+    @completion_percentage.expression
+    def completion_percentage(cls):
+        return completion_percentage_expr(cls.done_count, cls.task_count)
+
+    @classmethod
+    def _stat(cls, column):
+        """This project's value of a project_stats column (0 if it has no row)."""
+        return func.coalesce(
+            select(column)
+            .where(ProjectStats.project_id == cls.id)
+            .correlate_except(ProjectStats)
+            .scalar_subquery(),
+            0,
+        )
 
     @property
     def days_remaining(self) -> int:
@@ -56,3 +125,10 @@ class Project(Base):
 
     def __repr__(self):
         return f"<Project(id={self.id}, name='{self.name}', status='{self.status}')>"
+
+
+def completion_percentage_expr(done, total):
+    """
+    SQL for done/total as a percentage, 0 when a project has no tasks.
+    """
+    return case((total == 0, 0.0), else_=done * 100.0 / total)
@@ -0,0 +1,85 @@
+# project_manager/models/search.py
+
+import re
+from sqlalchemy import column, event, literal_column, table
+from . import Base
+
+# FTS5 indexes over the searchable text of each table. They are external-
+# content tables (the text lives only in the base table) kept in sync by
+# triggers, so ORM writes, bulk inserts and raw SQL all stay searchable.
+SEARCH_INDEXES = {
+    "projects": ("name", "description"),
+    "tasks": ("name", "description"),
+    "users": ("name", "email"),
+}
+
+
+def _fts_name(base: str) -> str:
+    return f"{base}_fts"
+
+
+def search_index_ddl(base: str) -> list[str]:
+    """
+    CREATE statements for the FTS5 table of `base` and its sync triggers.
+    """
+    fts = _fts_name(base)
+    cols = SEARCH_INDEXES[base]
+    col_list = ", ".join(cols)
+    new_vals = ", ".join(f"new.{c}" for c in cols)
+    old_vals = ", ".join(f"old.{c}" for c in cols)
+    insert_new = f"INSERT INTO {fts}(rowid, {col_list}) VALUES (new.id, {new_vals});"
+    delete_old = f"INSERT INTO {fts}({fts}, rowid, {col_list}) VALUES ('delete', old.id, {old_vals});"
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+        f"{col_list}, content='{base}', content_rowid='id', "
+        f"tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {base} BEGIN {insert_new} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {base} BEGIN {delete_old} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {col_list} ON {base} "
+        f"BEGIN {delete_old} {insert_new} END",
+    ]
+
+
+def install_search_indexes(connection):
+    """
+    Create any missing FTS5 tables and triggers, and fill newly created
+    tables from the rows already in their base table.
+    """
+    existing = set(connection.exec_driver_sql(
+        "SELECT name FROM sqlite_master WHERE type = 'table'"
+    ).scalars())
+    for base in SEARCH_INDEXES:
+        for ddl in search_index_ddl(base):
+            connection.exec_driver_sql(ddl)
+        fts = _fts_name(base)
+        if fts not in existing:
+            connection.exec_driver_sql(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_search_indexes(target, connection, **kw):
+    if connection.dialect.name == "sqlite":
+        install_search_indexes(connection)
+
+
+def fts_match_expression(term: str) -> str | None:
+    """
+    Turn free text into an FTS5 MATCH expression where every word must
+    appear as a word prefix, or None if the text has no searchable words.
+    """
+    words = re.findall(r"\w+", term)
+    return " ".join(f'"{w}"*' for w in words) or None
+
+
+def ranked_search(stmt, model, term: str):
+    """
+    Restrict `stmt` (a select over `model`) to rows whose indexed text
+    matches `term`, best matches first.
+    """
+    fts = table(_fts_name(model.__tablename__), column("rowid"), column("rank"))
+    return (
+        stmt.join(fts, fts.c.rowid == model.id)
+        .where(literal_column(fts.name).op("MATCH")(fts_match_expression(term)))
+        .order_by(None)
+        .order_by(fts.c.rank, model.id)
+    )
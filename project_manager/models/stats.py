@@ -0,0 +1,166 @@
+# project_manager/models/stats.py
+
+from datetime import date
+from sqlalchemy import Column, Date, ForeignKey, Integer, event, text
+from . import Base
+from .enums import TaskStatus
+
+# One row per project with its task counts, kept current by triggers on
+# projects and tasks so progress reads are a primary-key lookup instead of a
+# scan of the project's tasks. Statuses are compared by their TaskStatus
+# codes, spelled as literals like OPEN_STATUS_SQL. Overdue counts depend on the day, so they are relative to
+# the row's as_of date and refresh_overdue() moves stale rows to today.
+
+TODO, IN_PROGRESS, DONE = (status.value for status in TaskStatus)
+OPEN = f"{{t}}.status <> {DONE}"
+
+
+class ProjectStats(Base):
+    __tablename__ = "project_stats"
+
+    project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True)
+    task_count = Column(Integer, nullable=False, default=0, server_default="0")
+    todo_count = Column(Integer, nullable=False, default=0, server_default="0")
+    in_progress_count = Column(Integer, nullable=False, default=0, server_default="0")
+    done_count = Column(Integer, nullable=False, default=0, server_default="0")
+    overdue_count = Column(Integer, nullable=False, default=0, server_default="0")  # open, due before as_of
+    next_due_date = Column(Date, nullable=True)  # earliest due date of an open task
+    as_of = Column(Date, nullable=False)
+
+    def __repr__(self):
+        return f"<ProjectStats(project_id={self.project_id}, tasks={self.task_count}, done={self.done_count})>"
+
+
+def _add(t: str, sign: str) -> str:
+    """SET clause adding (sign '+') or removing ('-') task row `t` (new/old)."""
+    is_open = OPEN.format(t=t)
+    return (
+        f"task_count = task_count {sign} 1, "
+        f"todo_count = todo_count {sign} ({t}.status = {TODO}), "
+        f"in_progress_count = in_progress_count {sign} ({t}.status = {IN_PROGRESS}), "
+        f"done_count = done_count {sign} ({t}.status = {DONE}), "
+        f"overdue_count = overdue_count {sign} ({is_open} AND coalesce({t}.due_date < as_of, 0))"
+    )
+
+
+def _next_due_after_insert(t: str) -> str:
+    return (
+        f"next_due_date = CASE WHEN {OPEN.format(t=t)} AND {t}.due_date IS NOT NULL "
+        f"AND (next_due_date IS NULL OR {t}.due_date < next_due_date) "
+        f"THEN {t}.due_date ELSE next_due_date END"
+    )
+
+
+def _next_due_after_delete(t: str) -> str:
+    # Only when the leaving task was the earliest: look the new one up
+    # through ix_tasks_project_id_due_date.
+    return (
+        f"next_due_date = CASE WHEN {t}.due_date = next_due_date THEN ("
+        f"SELECT MIN(tasks.due_date) FROM tasks WHERE tasks.project_id = {t}.project_id "
+        f"AND {OPEN.format(t='tasks')}) ELSE next_due_date END"
+    )
+
+
+def project_stats_ddl() -> list[str]:
+    """CREATE TRIGGER statements that keep project_stats in step with the tasks."""
+    add_new = f"UPDATE project_stats SET {_add('new', '+')}, {_next_due_after_insert('new')} WHERE project_id = new.project_id;"
+    remove_old = f"UPDATE project_stats SET {_add('old', '-')}, {_next_due_after_delete('old')} WHERE project_id = old.project_id;"
+    return [
+        "CREATE TRIGGER IF NOT EXISTS project_stats_project_ai AFTER INSERT ON projects BEGIN "
+        "INSERT OR IGNORE INTO project_stats (project_id, as_of) VALUES (new.id, date('now', 'localtime')); END",
+        "CREATE TRIGGER IF NOT EXISTS project_stats_project_ad AFTER DELETE ON projects BEGIN "
+        "DELETE FROM project_stats WHERE project_id = old.id; END",
+        f"CREATE TRIGGER IF NOT EXISTS project_stats_task_ai AFTER INSERT ON tasks BEGIN {add_new} END",
+        f"CREATE TRIGGER IF NOT EXISTS project_stats_task_ad AFTER DELETE ON tasks BEGIN {remove_old} END",
+        f"CREATE TRIGGER IF NOT EXISTS project_stats_task_au AFTER UPDATE OF status, due_date, project_id ON tasks "
+        f"BEGIN {remove_old} {add_new} END",
+    ]
+
+
+def expected_stats_sql(today) -> tuple:
+    """(SQL, params) computing every project's stats from scratch, in column order."""
+    return (
+        "SELECT projects.id AS project_id, "
+        "count(tasks.id) AS task_count, "
+        f"count(CASE WHEN tasks.status = {TODO} THEN 1 END) AS todo_count, "
+        f"count(CASE WHEN tasks.status = {IN_PROGRESS} THEN 1 END) AS in_progress_count, "
+        f"count(CASE WHEN tasks.status = {DONE} THEN 1 END) AS done_count, "
+        f"count(CASE WHEN {OPEN.format(t='tasks')} AND tasks.due_date < :today THEN 1 END) AS overdue_count, "
+        f"min(CASE WHEN {OPEN.format(t='tasks')} THEN tasks.due_date END) AS next_due_date, "
+        ":today AS as_of "
+        "FROM projects LEFT JOIN tasks ON tasks.project_id = projects.id "
+        "GROUP BY projects.id",
+        {"today": str(today)},
+    )
+
+
+STATS_COLUMNS = (
+    "project_id", "task_count", "todo_count", "in_progress_count", "done_count",
+    "overdue_count", "next_due_date", "as_of",
+)
+
+
+def rebuild_project_stats(connection, today=None):
+    """Recompute every row of project_stats from the tasks table."""
+    sql, params = expected_stats_sql(today or date.today())
+    connection.execute(text("DELETE FROM project_stats"))
+    connection.execute(text(f"INSERT INTO project_stats ({', '.join(STATS_COLUMNS)}) {sql}"), params)
+
+
+def refresh_overdue(connection, today=None) -> int:
+    """
+    Recount overdue tasks for rows whose as_of isn't `today` (default: the
+    current date) and move them to it. Returns the number of rows refreshed.
+    """
+    today = str(today or date.today())
+    return connection.execute(
+        text(
+            "UPDATE project_stats SET as_of = :today, overdue_count = ("
+            "SELECT count(*) FROM tasks WHERE tasks.project_id = project_stats.project_id "
+            f"AND tasks.due_date < :today AND {OPEN.format(t='tasks')}) "
+            "WHERE as_of <> :today"
+        ),
+        {"today": today},
+    ).rowcount
+
+
+def diff_project_stats(connection, today=None):
+    """
+    [(project_id, column, stored, expected)] wherever project_stats disagrees
+    with a fresh count, a missing or extra row showing as column '*'. Overdue
+    counts are compared after refreshing to `today`.
+    """
+    today = today or date.today()
+    refresh_overdue(connection, today)
+    sql, params = expected_stats_sql(today)
+    expected = {row[0]: row for row in connection.execute(text(sql), params)}
+    stored = {
+        row[0]: row
+        for row in connection.execute(text(f"SELECT {', '.join(STATS_COLUMNS)} FROM project_stats"))
+    }
+    diffs = []
+    for project_id in sorted(expected.keys() | stored.keys()):
+        want, have = expected.get(project_id), stored.get(project_id)
+        if want is None or have is None:
+            diffs.append((project_id, "*", have, want))
+            continue
+        for name, a, b in zip(STATS_COLUMNS[1:-1], have[1:-1], want[1:-1]):
+            if str(a) != str(b):
+                diffs.append((project_id, name, a, b))
+    return diffs
+
+
+def install_project_stats(connection, backfill=False):
+    """Create the triggers, and fill project_stats from the tasks if asked."""
+    for ddl in project_stats_ddl():
+        connection.exec_driver_sql(ddl)
+    if backfill:
+        rebuild_project_stats(connection)
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_project_stats(target, connection, tables=(), **kw):
+    if connection.dialect.name == "sqlite":
+        install_project_stats(
+            connection, backfill=any(t.name == "project_stats" for t in tables)
+        )
@@ -1,37 +1,93 @@
 # project_manager/models/task.py
 
 from datetime import date
-from sqlalchemy import Column, Integer, String, Date, ForeignKey
+from sqlalchemy import CheckConstraint, Column, Integer, String, Date, ForeignKey, Index, literal_column, text
+from sqlalchemy.ext.hybrid import hybrid_method
 from sqlalchemy.orm import relationship, validates
 from . import Base
+from .enums import CodedEnumType, TaskStatus
+
+# Not done. Queries must spell it the same way, with the code as a literal
+# rather than a bound parameter (Task.is_open()), for SQLite to use the
+# partial ix_tasks_open_* indexes.
+OPEN_STATUS_SQL = f"status <> {TaskStatus.DONE.value}"
+
+
+def check_due_date(due_value, project_deadline=None, today=None):
+    """
+    Raise ValueError if a due date is in the past or after the project deadline.
+    """
+    if not due_value:
+        return
+    if due_value < (today or date.today()):
+        raise ValueError(f"Due date ({due_value}) cannot be in the past.")
+    if project_deadline and due_value > project_deadline:
+        raise ValueError(
+            f"Due date ({due_value}) cannot exceed project deadline ({project_deadline})."
+        )
 
 class Task(Base):
     __tablename__ = "tasks"
+    # Mirrors alembic revisions 39dcec8ba561, 7c41e0b9a2d5, 5e8f3a6c1b27 and 8b2d4f61c9e3; see those migrations for the access paths.
+    __table_args__ = (
+        CheckConstraint(TaskStatus.check_sql("status"), name="ck_tasks_status"),
+        Index("ix_tasks_project_id_due_date", "project_id", "due_date"),
+        Index("ix_tasks_due_date", "due_date"),
+        Index("ix_tasks_user_id_status_due_date", "user_id", "status", "due_date"),
+        Index("ix_tasks_status_due_date", "status", "due_date"),
+        Index("ix_tasks_open_project_due_date", "project_id", "due_date", "user_id", sqlite_where=text(OPEN_STATUS_SQL)),
+        Index("ix_tasks_open_user_due_date", "user_id", "due_date", "project_id", sqlite_where=text(OPEN_STATUS_SQL)),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False)
     description = Column(String, nullable=True)
-    status = Column(String, nullable=False, default="To Do")  # To Do, In Progress, Done
+    status = Column(CodedEnumType(TaskStatus), nullable=False, default=TaskStatus.TODO)
     due_date = Column(Date, nullable=True)
     project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
 
-    project = relationship("Project", back_populates="tasks", lazy="joined")
-    user = relationship("User", back_populates="tasks", lazy="joined")
+    project = relationship("Project", back_populates="tasks", lazy="select")
+    user = relationship("User", back_populates="tasks", lazy="select")
 
     @validates("due_date")
     def validate_due_date(self, key, due_value):
         """
         Ensure due_date is not in the past and, if project.deadline exists, not after it.
         """
-        if due_value and due_value < date.today():
-            raise ValueError(f"Due date ({due_value}) cannot be in the past.")
-        if self.project and self.project.deadline and due_value and due_value > self.project.deadline:
-            raise ValueError(
-                f"Due date ({due_value}) cannot exceed project deadline ({self.project.deadline})."
-            )
+        check_due_date(due_value, self.project.deadline if self.project else None)
         return due_value
 
+    @validates("status")
+    def validate_status(self, key, status):
+        """
+        Store a TaskStatus whatever label or code was assigned.
+        """
+        return TaskStatus.parse(status, "Status")
+
+    @hybrid_method
+    def has_status(self, status) -> bool:
+        """
+        Status check against a TaskStatus or any label TaskStatus.parse
+        accepts, usable on instances and in queries.
+        """
+        return self.status is TaskStatus.parse(status, "Status")
+
+    @has_status.expression
+    def has_status(cls, status):
+        return cls.status == TaskStatus.parse(status, "Status")
+
+    @hybrid_method
+    def is_open(self) -> bool:
+        """
+        Not done, usable on instances and in queries.
+        """
+        return self.status is not TaskStatus.DONE
+
+    @is_open.expression
+    def is_open(cls):
+        return cls.status != literal_column(str(TaskStatus.DONE.value))
+
     @property
     def days_remaining(self) -> int | None:
         if not self.due_date:
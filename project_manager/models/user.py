@@ -11,8 +11,11 @@ class User(Base):
     name = Column(String, nullable=False, unique=True)
     email = Column(String, nullable=False, unique=True)
 
-    # One-to-many: a User can have many Tasks
-    tasks = relationship("Task", back_populates="user", cascade="all, delete-orphan", lazy="joined")
+    # One-to-many: a User can have many Tasks. Deleting a user keeps the
+    # tasks and leaves them unassigned (tasks.user_id ON DELETE SET NULL).
+    tasks = relationship(
+        "Task", back_populates="user", cascade="save-update, merge", passive_deletes=True, lazy="select"
+    )
 
     def __repr__(self):
         return f"<User(id={self.id}, name='{self.name}', email='{self.email}')>"
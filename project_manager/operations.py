@@ -0,0 +1,210 @@
+# project_manager/operations.py
+"""
+Non-interactive create/update/delete operations behind the command mode of
+cli.py. Each takes an open session and plain values, enforces the same rules
+as the interactive helpers, raises ValueError when a rule is broken (NotFound
+when a referenced row is missing), and leaves committing to the caller, so
+many of them can share one transaction.
+"""
+
+from datetime import date
+import sqlalchemy as sa
+from project_manager.cache import lookup_project, lookup_user
+from project_manager.models.loading import profiled_query
+from project_manager.models.project import Project, check_deadline
+from project_manager.models.task import Task, check_due_date
+from project_manager.models.user import User
+
+
+class NotFound(ValueError):
+    """A referenced project, task or user doesn't exist."""
+
+
+def get_project(session, ref, profile="lookup") -> Project:
+    """A project by ID (int or digit string) or exact name."""
+    query = profiled_query(session, Project, profile)
+    if str(ref).isdigit():
+        project = query.filter(Project.id == int(ref)).first()
+    else:
+        project = query.filter(Project.name == ref).first()
+    if not project:
+        raise NotFound(f"Project '{ref}' does not exist.")
+    return project
+
+
+def get_task(session, task_id, profile="lookup") -> Task:
+    task = profiled_query(session, Task, profile).filter(Task.id == int(task_id)).first()
+    if not task:
+        raise NotFound(f"Task {task_id} does not exist.")
+    return task
+
+
+def get_user(session, ref, profile="lookup") -> User:
+    """A user by ID (int or digit string) or exact name."""
+    query = profiled_query(session, User, profile)
+    if str(ref).isdigit():
+        user = query.filter(User.id == int(ref)).first()
+    else:
+        user = query.filter(User.name == ref).first()
+    if not user:
+        raise NotFound(f"User '{ref}' does not exist.")
+    return user
+
+
+def _project_record(session, ref):
+    """Cached id/name/dates of a project, for when the ORM object isn't needed."""
+    project = lookup_project(session, ref)
+    if not project:
+        raise NotFound(f"Project '{ref}' does not exist.")
+    return project
+
+
+def _user_record(session, ref):
+    user = lookup_user(session, ref)
+    if not user:
+        raise NotFound(f"User '{ref}' does not exist.")
+    return user
+
+def _delete_row(session, model, row_id):
+    """
+    DELETE one row by id, leaving dependent rows to the foreign key actions
+    instead of loading them. ORM-enabled so the lookup cache hears of it.
+    """
+    session.flush()
+    deleted = session.execute(
+        sa.delete(model).where(model.id == row_id), execution_options={"synchronize_session": False}
+    ).rowcount
+    if not deleted:
+        raise NotFound(f"{model.__name__} {row_id} does not exist.")
+    session.expire_all()
+
+# ─── Projects ────────────────────────────────────────────────────────────────
+
+def create_project(session, name, deadline, description=None, start_date=None, priority="Medium"):
+    name = (name or "").strip()
+    if not name:
+        raise ValueError("Project name cannot be empty.")
+    if session.query(Project.id).filter(Project.name == name).first():
+        raise ValueError(f"A project named '{name}' already exists.")
+    start_date = start_date or date.today()
+    check_deadline(start_date, deadline)
+    project = Project(
+        name=name,
+        description=description or None,
+        start_date=start_date,
+        deadline=deadline,
+        priority=priority,
+    )
+    session.add(project)
+    session.flush()
+    return project
+
+
+def update_project(session, ref, name=None, description=None, deadline=None, priority=None, status=None):
+    project = get_project(session, ref)
+    if name:
+        project.name = name
+    if description:
+        project.description = description
+    if deadline:
+        project.deadline = deadline
+    if priority:
+        project.priority = priority
+    if status:
+        project.status = status
+    session.flush()
+    return project
+
+
+def delete_project(session, ref):
+    """Delete a project with one statement; its tasks and stats go by ON DELETE CASCADE."""
+    project = _project_record(session, ref)
+    _delete_row(session, Project, project.id)
+    return project
+
+# ─── Tasks ───────────────────────────────────────────────────────────────────
+
+def create_task(session, name, project, description=None, status="To Do", due_date=None, user=None):
+    name = (name or "").strip()
+    if not name:
+        raise ValueError("Task name cannot be empty.")
+    project = _project_record(session, project)
+    check_due_date(due_date, project.deadline)
+    task = Task(
+        name=name,
+        description=description or None,
+        status=status,
+        due_date=due_date,
+        project_id=project.id,
+        user_id=_user_record(session, user).id if user else None,
+    )
+    session.add(task)
+    session.flush()
+    return task
+
+
+def update_task(session, task_id, name=None, description=None, status=None, due_date=None,
+                project=None, user=None, unassign=False):
+    task = get_task(session, task_id)
+    if name:
+        task.name = name
+    if description:
+        task.description = description
+    if status:
+        task.status = status
+    if project:
+        new_project = get_project(session, project)
+        if not due_date and task.due_date and task.due_date > new_project.deadline:
+            raise ValueError(
+                f"Due date ({task.due_date}) cannot exceed project deadline ({new_project.deadline})."
+            )
+        task.project = new_project
+    if due_date:
+        task.due_date = due_date
+    if unassign:
+        task.user_id = None
+    elif user:
+        task.user_id = _user_record(session, user).id
+    session.flush()
+    return task
+
+
+def delete_task(session, task_id):
+    task = get_task(session, task_id, "delete")
+    session.delete(task)
+    session.flush()
+    return task
+
+# ─── Users ───────────────────────────────────────────────────────────────────
+
+def create_user(session, name, email):
+    name, email = (name or "").strip(), (email or "").strip()
+    if not name or not email:
+        raise ValueError("User name and email cannot be empty.")
+    if session.query(User.id).filter(sa.or_(User.email == email, User.name == name)).first():
+        raise ValueError("A user with that name or email already exists.")
+    user = User(name=name, email=email)
+    session.add(user)
+    session.flush()
+    return user
+
+
+def update_user(session, ref, name=None, email=None):
+    user = get_user(session, ref)
+    name, email = (name or "").strip(), (email or "").strip()
+    clashes = [column == value for column, value in ((User.name, name), (User.email, email)) if value]
+    if clashes and session.query(User.id).filter(User.id != user.id, sa.or_(*clashes)).first():
+        raise ValueError("A user with that name or email already exists.")
+    if name:
+        user.name = name
+    if email:
+        user.email = email
+    session.flush()
+    return user
+
+
+def delete_user(session, ref):
+    """Delete a user with one statement; their tasks are unassigned by ON DELETE SET NULL."""
+    user = _user_record(session, ref)
+    _delete_row(session, User, user.id)
+    return user
@@ -0,0 +1,116 @@
+# project_manager/pagination.py
+
+from sqlalchemy import and_, or_, true
+from project_manager.config import get_setting
+
+DEFAULT_PAGE_SIZE = int(get_setting("page_size", "20"))
+
+
+def keyset_predicate(sort_col, id_col, key):
+    """
+    WHERE clause for rows strictly after `key` = (sort_value, id) in
+    ascending (sort_col, id_col) order. `sort_col` may be nullable: SQLite
+    sorts NULLs first, so a NULL key continues through the NULL run before
+    moving on to every non-NULL value.
+    """
+    if key is None:
+        return true()
+    value, last_id = key
+    if value is None:
+        return or_(and_(sort_col.is_(None), id_col > last_id), sort_col.is_not(None))
+    # The redundant `sort_col >= value` lets SQLite seek the index instead of scanning.
+    return and_(sort_col >= value, or_(sort_col > value, id_col > last_id))
+
+
+class KeysetPager:
+    """
+    Walks a listing one page at a time by seeking from the last key of the
+    previous page instead of using OFFSET, so every page costs the same no
+    matter how deep it is or how large the table grows.
+
+    `build(predicate, limit)` returns the ordered select for one page;
+    `key(row)` returns the (sort_value, id) pair the listing is ordered by.
+    """
+
+    def __init__(self, session, build, sort_col, id_col, key, page_size=DEFAULT_PAGE_SIZE):
+        if page_size < 1:
+            raise ValueError("Page size must be at least 1.")
+        self._session = session
+        self._build = build
+        self._sort_col = sort_col
+        self._id_col = id_col
+        self._key = key
+        self.page_size = page_size
+        self._starts = [None]  # start key of every page visited so far
+        self._next_start = None
+        self.has_next = False
+
+    @property
+    def page_number(self) -> int:
+        return len(self._starts)
+
+    def rows(self):
+        """
+        Stream the rows of the current page straight from the cursor.
+        """
+        predicate = keyset_predicate(self._sort_col, self._id_col, self._starts[-1])
+        # One extra row tells us whether another page follows.
+        stmt = self._build(predicate, self.page_size + 1)
+        result = self._session.execute(stmt.execution_options(yield_per=self.page_size + 1))
+        self.has_next = False
+        last = None
+        try:
+            for count, row in enumerate(result):
+                if count == self.page_size:
+                    self.has_next = True
+                    break
+                last = row
+                yield row
+        finally:
+            result.close()
+        self._next_start = self._key(last) if last is not None else None
+
+    def next_page(self) -> bool:
+        if not self.has_next:
+            return False
+        self._starts.append(self._next_start)
+        return True
+
+    def prev_page(self) -> bool:
+        if len(self._starts) == 1:
+            return False
+        self._starts.pop()
+        return True
+
+    def resize(self, page_size: int):
+        """Change the page size and restart from the first page."""
+        if page_size < 1:
+            raise ValueError("Page size must be at least 1.")
+        self.page_size = page_size
+        self._starts = [None]
+        self.has_next = False
+
+
+class OffsetPager(KeysetPager):
+    """
+    Same interface as KeysetPager for result sets with no stable key to seek
+    on, such as ranked search results. `build(limit, offset)` returns the
+    select for one page; keep these to small, interactive result sets.
+    """
+
+    def __init__(self, session, build, page_size=DEFAULT_PAGE_SIZE):
+        super().__init__(session, build, None, None, key=None, page_size=page_size)
+
+    def rows(self):
+        offset = (self.page_number - 1) * self.page_size
+        stmt = self._build(self.page_size + 1, offset)
+        self.has_next = False
+        result = self._session.execute(stmt)
+        try:
+            for count, row in enumerate(result):
+                if count == self.page_size:
+                    self.has_next = True
+                    break
+                yield row
+        finally:
+            result.close()
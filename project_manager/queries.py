@@ -0,0 +1,206 @@
+# project_manager/queries.py
+
+from sqlalchemy import Date, Integer, case, cast, func, literal, select
+from project_manager.models.enums import ProjectStatus, TaskStatus
+from project_manager.models.project import Project, completion_percentage_expr
+from project_manager.models.stats import ProjectStats
+from project_manager.models.task import Task
+from project_manager.models.user import User
+
+# Listing selects take extra WHERE criteria (e.g. a keyset predicate) and an
+# optional LIMIT, and always end with the id so their order is total.
+
+# ─── Project Queries ─────────────────────────────────────────────────────────
+
+def project_progress_select(*criteria, limit=None):
+    """
+    One row per project with its per-status task counts and completion
+    percentage, read from project_stats by primary key, so the cost of a
+    page does not depend on how many tasks its projects have.
+    """
+    def stat(column):
+        return func.coalesce(column, 0)
+
+    task_count = stat(ProjectStats.task_count)
+    done_count = stat(ProjectStats.done_count)
+    stmt = (
+        select(
+            Project.id,
+            Project.name,
+            Project.deadline,
+            Project.priority,
+            Project.status,
+            task_count.label("task_count"),
+            stat(ProjectStats.todo_count).label("todo_count"),
+            stat(ProjectStats.in_progress_count).label("in_progress_count"),
+            done_count.label("done_count"),
+            completion_percentage_expr(done_count, task_count).label("completion_percentage"),
+        )
+        .outerjoin(ProjectStats, ProjectStats.project_id == Project.id)
+        .where(*criteria)
+        .order_by(Project.deadline, Project.id)
+    )
+    return stmt.limit(limit) if limit is not None else stmt
+
+# ─── Task Queries ────────────────────────────────────────────────────────────
+
+def task_listing_select(*criteria, limit=None):
+    """
+    Flat task rows with their project and user names, ordered by (due_date, id).
+    """
+    stmt = (
+        select(
+            Task.id,
+            Task.name,
+            Task.status,
+            Task.due_date,
+            Project.name.label("project_name"),
+            User.name.label("user_name"),
+            User.email.label("user_email"),
+        )
+        .join(Project, Task.project_id == Project.id)
+        .outerjoin(User, Task.user_id == User.id)
+        .where(*criteria)
+        .order_by(Task.due_date, Task.id)
+    )
+    return stmt.limit(limit) if limit is not None else stmt
+
+def project_tasks_select(project_id: int):
+    """
+    Task entities of one project ordered by (due_date, id).
+    """
+    return select(Task).where(Task.project_id == project_id).order_by(Task.due_date, Task.id)
+
+# ─── User Queries ────────────────────────────────────────────────────────────
+
+def user_listing_select(*criteria, limit=None):
+    """
+    User rows ordered by (name, id).
+    """
+    stmt = select(User.id, User.name, User.email).where(*criteria).order_by(User.name, User.id)
+    return stmt.limit(limit) if limit is not None else stmt
+
+# ─── Report Queries ──────────────────────────────────────────────────────────
+
+# Date arithmetic is left to SQLite (date(), julianday()), so a report is a
+# few aggregate statements however many tasks match.
+
+def days_between(start, end):
+    """Whole days from `start` to `end`, negative if `end` is earlier."""
+    return cast(func.julianday(end) - func.julianday(start), Integer)
+
+def deadline_window(as_of, within_days: int):
+    """(as_of, last due date that counts as due soon) as SQL date expressions."""
+    as_of = literal(as_of, Date)
+    return as_of, func.date(as_of, f"+{int(within_days)} days")
+
+def deadline_groups_select(by: str, as_of, within_days: int):
+    """
+    Overdue and due-soon counts and the earliest due date of the open tasks
+    due on or before the end of the window, one row per project
+    (by="project") or per user (by="user"; unassigned tasks have id and name
+    None), most overdue first. Each is one pass over ix_tasks_open_project_due_date
+    or ix_tasks_open_user_due_date, already in group order.
+    """
+    as_of_date, horizon = deadline_window(as_of, within_days)
+    key = Task.project_id if by == "project" else Task.user_id
+    groups = (
+        select(
+            key.label("id"),
+            func.count(case((Task.due_date < as_of_date, 1))).label("overdue"),
+            func.count(case((Task.due_date >= as_of_date, 1))).label("due_soon"),
+            func.min(Task.due_date).label("first_due"),
+        )
+        .where(Task.is_open(), Task.due_date <= horizon)
+        .group_by(key)
+        .subquery("groups")
+    )
+    first_due_in = days_between(as_of_date, groups.c.first_due).label("first_due_in")
+    if by == "project":
+        stmt = select(
+            groups.c.id, Project.name, Project.deadline,
+            days_between(as_of_date, Project.deadline).label("deadline_in"),
+            groups.c.overdue, groups.c.due_soon, groups.c.first_due, first_due_in,
+        ).join(Project, Project.id == groups.c.id)
+    else:
+        stmt = select(
+            groups.c.id, User.name, groups.c.overdue, groups.c.due_soon, groups.c.first_due, first_due_in,
+        ).outerjoin(User, User.id == groups.c.id)
+    return stmt.order_by(groups.c.overdue.desc(), groups.c.first_due, groups.c.id)
+
+def deadline_tasks_select(as_of, within_days: int, *criteria, limit=None):
+    """The open tasks in the window with project and user names, by (due_date, id)."""
+    as_of_date, horizon = deadline_window(as_of, within_days)
+    stmt = (
+        select(
+            Task.id, Task.name, Task.status, Task.due_date,
+            days_between(as_of_date, Task.due_date).label("due_in"),
+            Task.project_id, Project.name.label("project_name"),
+            Task.user_id, User.name.label("user_name"),
+        )
+        .join(Project, Task.project_id == Project.id)
+        .outerjoin(User, Task.user_id == User.id)
+        .where(Task.is_open(), Task.due_date <= horizon, *criteria)
+        .order_by(Task.due_date, Task.id)
+    )
+    return stmt.limit(limit) if limit is not None else stmt
+
+def deadline_projects_select(as_of, within_days: int):
+    """
+    Active projects whose own deadline has passed or falls in the window,
+    with their open task count from project_stats, by (deadline, id).
+    """
+    as_of_date, horizon = deadline_window(as_of, within_days)
+    return (
+        select(
+            Project.id, Project.name, Project.deadline,
+            days_between(as_of_date, Project.deadline).label("deadline_in"),
+            (func.coalesce(ProjectStats.task_count, 0) - func.coalesce(ProjectStats.done_count, 0)).label("open_tasks"),
+        )
+        .outerjoin(ProjectStats, ProjectStats.project_id == Project.id)
+        .where(Project.status == ProjectStatus.ACTIVE, Project.deadline <= horizon)
+        .order_by(Project.deadline, Project.id)
+    )
+
+def workload_select(as_of):
+    """
+    One row per user with tasks, plus one (id and name None) for the
+    unassigned tasks: counts by status, open tasks overdue on `as_of`, and
+    the earliest open due date, busiest first. A single pass over
+    ix_tasks_user_id_status_due_date groups by (user, status); the outer
+    query folds those few rows per user.
+    """
+    as_of = literal(as_of, Date)
+    by_status = (
+        select(
+            Task.user_id,
+            Task.status,
+            func.count().label("tasks"),
+            func.count(case((Task.due_date < as_of, 1))).label("late"),
+            func.min(Task.due_date).label("first_due"),
+        )
+        .group_by(Task.user_id, Task.status)
+        .subquery("by_status")
+    )
+
+    def tasks_where(condition, column=by_status.c.tasks):
+        return func.sum(case((condition, column), else_=0))
+
+    is_open = by_status.c.status != TaskStatus.DONE
+    open_count = tasks_where(is_open)
+    return (
+        select(
+            by_status.c.user_id.label("id"),
+            User.name,
+            func.sum(by_status.c.tasks).label("task_count"),
+            tasks_where(by_status.c.status == TaskStatus.TODO).label("todo_count"),
+            tasks_where(by_status.c.status == TaskStatus.IN_PROGRESS).label("in_progress_count"),
+            tasks_where(by_status.c.status == TaskStatus.DONE).label("done_count"),
+            open_count.label("open_count"),
+            tasks_where(is_open, by_status.c.late).label("overdue_count"),
+            func.min(case((is_open, by_status.c.first_due))).label("first_due"),
+        )
+        .outerjoin(User, User.id == by_status.c.user_id)
+        .group_by(by_status.c.user_id)
+        .order_by(open_count.desc(), User.name, by_status.c.user_id)
+    )
@@ -0,0 +1,103 @@
+# project_manager/schema.py
+"""
+Startup schema check, used instead of running create_all on every launch.
+
+The expected revision is read straight from the Alembic migration files (no
+Alembic import needed) and compared with the database's alembic_version row
+in one small query. A brand-new database gets the full schema from the
+models and is stamped at that revision; an out-of-date one gets a warning to
+run `alembic upgrade head`.
+"""
+
+import os
+import re
+import sys
+from functools import lru_cache
+
+from project_manager.models import ROOT_DIR, Base, get_engine
+
+VERSIONS_DIR = os.path.join(ROOT_DIR, "alembic", "versions")
+
+_REVISION_RE = re.compile(r"^revision\b[^=]*=\s*['\"](\w+)['\"]", re.MULTILINE)
+_DOWN_REVISION_RE = re.compile(r"^down_revision\b[^=]*=\s*['\"](\w+)['\"]", re.MULTILINE)
+
+# Engines whose schema has already been checked by this process.
+_checked = set()
+
+
+@lru_cache(maxsize=1)
+def head_revision(versions_dir: str = VERSIONS_DIR):
+    """
+    The single Alembic head revision found in `versions_dir`, or None when
+    the directory is missing or the history has more than one head.
+    """
+    if not os.path.isdir(versions_dir):
+        return None
+    revisions, parents = set(), set()
+    for filename in os.listdir(versions_dir):
+        if not filename.endswith(".py"):
+            continue
+        with open(os.path.join(versions_dir, filename), encoding="utf-8") as fh:
+            source = fh.read()
+        revision = _REVISION_RE.search(source)
+        if revision:
+            revisions.add(revision.group(1))
+            parents.update(_DOWN_REVISION_RE.findall(source))
+    heads = revisions - parents
+    return heads.pop() if len(heads) == 1 else None
+
+
+def _create_schema(connection, head):
+    # Importing the models registers their tables (and the search indexes) on Base.
+    import project_manager.models.project
+    import project_manager.models.task
+    import project_manager.models.user
+    import project_manager.models.search
+
+    Base.metadata.create_all(bind=connection)
+    if head:
+        connection.exec_driver_sql(
+            "CREATE TABLE IF NOT EXISTS alembic_version ("
+            "version_num VARCHAR(32) NOT NULL, "
+            "CONSTRAINT alembic_version_pkc PRIMARY KEY (version_num))"
+        )
+        connection.exec_driver_sql("DELETE FROM alembic_version")
+        connection.exec_driver_sql("INSERT INTO alembic_version (version_num) VALUES (?)", (head,))
+
+
+def ensure_schema(bind=None):
+    """
+    Make sure the database is usable by this version of the code, at most
+    once per engine per process. Returns the database's revision.
+    """
+    bind = bind or get_engine()
+    if id(bind) in _checked:
+        return None
+    head = head_revision()
+    with bind.begin() as conn:
+        tables = set(conn.exec_driver_sql(
+            "SELECT name FROM sqlite_master WHERE type = 'table' "
+            "AND name IN ('alembic_version', 'projects')"
+        ).scalars())
+        current = (
+            conn.exec_driver_sql("SELECT version_num FROM alembic_version").scalar()
+            if "alembic_version" in tables else None
+        )
+        if "projects" not in tables:
+            _create_schema(conn, head)
+            current = head
+        elif current is None:
+            # Created by an older build that ran create_all on every launch.
+            _create_schema(conn, None)
+            print(
+                "⚠️ Database has no schema version; run `alembic stamp head` once it is up to date.",
+                file=sys.stderr,
+            )
+    if head and current and current != head:
+        print(
+            f"⚠️ Database schema is at revision {current} but this version expects {head}; "
+            "run `alembic upgrade head`.",
+            file=sys.stderr,
+        )
+    _checked.add(id(bind))
+    return current
@@ -0,0 +1,432 @@
+# project_manager/server.py
+"""
+JSON HTTP server over the service layer, so several people can share one
+database through a single process instead of each running the CLI.
+
+    pipenv run python project_manager/cli.py serve [--host 127.0.0.1] [--port 8000] [--readers 4]
+
+    GET    /projects[?limit=&after=]    GET    /tasks[?limit=&after=]     GET    /users[?limit=&after=]
+    GET    /projects/<ref>              GET    /tasks/<id>                GET    /users/<ref>
+    GET    /projects/<ref>/tasks        POST   /tasks                     POST   /users
+    POST   /projects                    PATCH  /tasks/<id>                PATCH  /users/<ref>
+    PATCH  /projects/<ref>              DELETE /tasks/<id>                DELETE /users/<ref>
+    DELETE /projects/<ref>              POST   /tasks/set-status, /tasks/reassign, /tasks/shift-due
+    POST   /batch   [{"method": ..., "path": ..., "body": {...}}, ...] in one transaction
+    GET    /reports/deadlines[?as_of=&within=&limit=]   GET    /reports/workload[?as_of=]
+
+Listings return {"items": [...], "next": cursor}; pass the cursor back as
+`after` for the following page. Bodies and responses are JSON, dates ISO
+strings, and errors {"error": message} with 400 (or 404 for a missing row).
+
+Reads go through a pool of read-only connections. Writes are queued to a
+single writer thread owning the only read-write connection, which applies
+whatever has queued up (up to WRITE_BATCH requests) in one transaction with
+a SAVEPOINT per request, so a failing request doesn't affect its neighbours
+and many writers cost one commit. Every GET carries an ETag derived from
+SQLite's PRAGMA data_version, which changes whenever any connection (ours or
+another process's) commits; a matching If-None-Match gets 304 without
+touching the tables.
+"""
+
+import argparse
+import base64
+import json
+import os
+import queue
+import re
+import sys
+import threading
+from concurrent.futures import Future
+from dataclasses import asdict
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import Date
+from sqlalchemy.orm import sessionmaker
+from project_manager.cache import DataVersion
+from project_manager.models import create_sqlite_engine, database_url, enable_savepoints
+from project_manager.operations import NotFound
+from project_manager.pagination import DEFAULT_PAGE_SIZE
+from project_manager.schema import ensure_schema
+from project_manager.services import ProjectService, ReportService, TaskService, UserService
+
+DEFAULT_READERS = 4
+WRITE_BATCH = 64   # most requests one writer commit covers
+MAX_PAGE_SIZE = 500
+
+# ─── Database Access ─────────────────────────────────────────────────────────
+
+class Store:
+    """The writer thread, the reader pool and the data version behind the ETags."""
+
+    def __init__(self, url=None, readers=DEFAULT_READERS):
+        url = url or database_url()
+        self.writer_engine = create_sqlite_engine(url, pool_size=1, max_overflow=0)
+        # SAVEPOINTs per request, with the write lock taken up front.
+        enable_savepoints(self.writer_engine, "BEGIN IMMEDIATE")
+        ensure_schema(self.writer_engine)
+        self.reader_engine = create_sqlite_engine(url, read_only=True, pool_size=readers, max_overflow=0)
+        self._write_session = sessionmaker(bind=self.writer_engine, autoflush=False)
+        self._read_session = sessionmaker(bind=self.reader_engine, autoflush=False)
+
+        self._version = DataVersion(url)
+        self._boot = os.urandom(4).hex()
+
+        self._writes = queue.Queue()
+        self._writer = threading.Thread(target=self._write_loop, name="pm-writer", daemon=True)
+        self._writer.start()
+
+    def read(self, fn):
+        with self._read_session() as session:
+            return fn(session)
+
+    def write(self, fn):
+        """Run fn(session) on the writer thread and return its result once committed."""
+        future = Future()
+        self._writes.put((fn, future))
+        return future.result()
+
+    def etag(self) -> str:
+        """Changes whenever anything has committed since the last call."""
+        return f'"{self._boot}-{self._version.current()}"'
+
+    def close(self):
+        self._writes.put(None)
+        self._writer.join()
+        self._version.close()
+        for engine in (self.writer_engine, self.reader_engine):
+            engine.dispose()
+
+    def _write_loop(self):
+        stopping = False
+        while not stopping:
+            job = self._writes.get()
+            if job is None:
+                break
+            jobs = [job]
+            while len(jobs) < WRITE_BATCH:
+                try:
+                    job = self._writes.get_nowait()
+                except queue.Empty:
+                    break
+                if job is None:
+                    stopping = True
+                    break
+                jobs.append(job)
+            self._apply(jobs)
+
+    def _apply(self, jobs):
+        outcomes = []
+        with self._write_session() as session:
+            try:
+                for fn, future in jobs:
+                    try:
+                        with session.begin_nested():
+                            outcomes.append((future, fn(session), None))
+                    except Exception as e:
+                        outcomes.append((future, None, e))
+                session.commit()
+            except Exception as e:
+                session.rollback()
+                outcomes = [(future, None, e) for _, future in jobs]
+        for future, result, error in outcomes:
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+# ─── Routes ──────────────────────────────────────────────────────────────────
+
+SERVICES = {"projects": ProjectService, "tasks": TaskService, "users": UserService}
+DATE_FIELDS = {"deadline", "start_date", "due_date"}
+# JSON types each other field accepts; refs and codes take an id/code or a name/label.
+FIELD_TYPES = {
+    **dict.fromkeys(("name", "description", "email"), (str,)),
+    **dict.fromkeys(("project", "user", "from_user", "to_user", "status", "from_status", "priority"), (str, int)),
+    "days": (int,),
+    "unassign": (bool,),
+}
+TYPE_NAMES = {str: "a string", int: "a number", bool: "true or false"}
+
+
+def _fields(body, allowed, required=()):
+    """Keyword arguments from a JSON object: only `allowed` keys, types checked, ISO dates parsed."""
+    if not isinstance(body, dict):
+        raise ValueError("Request body must be a JSON object.")
+    unknown = set(body) - set(allowed)
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}.")
+    missing = [f for f in required if body.get(f) in (None, "")]
+    if missing:
+        raise ValueError(f"Missing fields: {', '.join(missing)}.")
+    kwargs = {}
+    for key, value in body.items():
+        if key in DATE_FIELDS and value is not None:
+            try:
+                value = date.fromisoformat(value)
+            except (TypeError, ValueError):
+                raise ValueError(f"{key} must be a date (YYYY-MM-DD), not {value!r}.") from None
+        elif key in FIELD_TYPES and value is not None:
+            types = FIELD_TYPES[key]
+            # bool is an int to isinstance, but true is not a number here.
+            if not isinstance(value, types) or (isinstance(value, bool) and bool not in types):
+                names = " or ".join(TYPE_NAMES[t] for t in types)
+                raise ValueError(f"{key} must be {names}, not {value!r}.")
+        kwargs[key] = value
+    return kwargs
+
+
+def _encode_cursor(key) -> str:
+    return base64.urlsafe_b64encode(json.dumps(key, default=str).encode()).decode()
+
+
+def _decode_cursor(service, cursor):
+    try:
+        value, last_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor.") from None
+    if value is not None and isinstance(getattr(service.model, service.sort_field).type, Date):
+        value = date.fromisoformat(value)
+    return value, int(last_id)
+
+
+def _limit(query, default):
+    try:
+        limit = int(query.get("limit", default))
+    except ValueError:
+        raise ValueError("limit must be a number.") from None
+    if not 1 <= limit <= MAX_PAGE_SIZE:
+        raise ValueError(f"limit must be between 1 and {MAX_PAGE_SIZE}.")
+    return limit
+
+
+def _page(service, query):
+    limit = _limit(query, DEFAULT_PAGE_SIZE)
+    after = _decode_cursor(service, query["after"]) if query.get("after") else None
+    rows = service.list(after=after, limit=limit + 1)
+    more = len(rows) > limit
+    rows = rows[:limit]
+    return 200, {
+        "items": [asdict(row) for row in rows],
+        "next": _encode_cursor(service.page_key(rows[-1])) if more else None,
+    }
+
+
+def _list(session, kind, query, body):
+    return _page(SERVICES[kind](session), query)
+
+
+def _get(session, kind, query, body, ref):
+    return 200, asdict(SERVICES[kind](session).get(ref))
+
+
+def _project_tasks(session, kind, query, body, ref):
+    return 200, {"items": [asdict(row) for row in ProjectService(session).tasks(ref)]}
+
+
+CREATE_FIELDS = {
+    "projects": (("name", "deadline", "description", "start_date", "priority"), ("name", "deadline")),
+    "tasks": (("name", "project", "description", "status", "due_date", "user"), ("name", "project")),
+    "users": (("name", "email"), ("name", "email")),
+}
+UPDATE_FIELDS = {
+    "projects": ("name", "description", "deadline", "priority", "status"),
+    "tasks": ("name", "description", "status", "due_date", "project", "user", "unassign"),
+    "users": ("name", "email"),
+}
+
+
+def _create(session, kind, query, body):
+    allowed, required = CREATE_FIELDS[kind]
+    return 201, asdict(SERVICES[kind](session).create(**_fields(body, allowed, required)))
+
+
+def _update(session, kind, query, body, ref):
+    return 200, asdict(SERVICES[kind](session).update(ref, **_fields(body, UPDATE_FIELDS[kind])))
+
+
+def _delete(session, kind, query, body, ref):
+    return 200, asdict(SERVICES[kind](session).delete(ref))
+
+
+def _deadlines(session, kind, query, body):
+    try:
+        as_of = date.fromisoformat(query["as_of"]) if query.get("as_of") else None
+        within = int(query.get("within", 7))
+    except ValueError:
+        raise ValueError("as_of must be a date (YYYY-MM-DD); within a number.") from None
+    return 200, asdict(ReportService(session).deadlines(as_of, within, _limit(query, 50)))
+
+
+def _workload(session, kind, query, body):
+    try:
+        as_of = date.fromisoformat(query["as_of"]) if query.get("as_of") else None
+    except ValueError:
+        raise ValueError("as_of must be a date (YYYY-MM-DD).") from None
+    return 200, {"items": [asdict(row) for row in ReportService(session).workload(as_of)]}
+
+
+def _bulk(method, allowed, required):
+    def handler(session, kind, query, body):
+        changed = getattr(TaskService(session), method)(**_fields(body, allowed, required))
+        return 200, {"changed": changed}
+    return handler
+
+
+# (HTTP method, path pattern, handler, entity kind, writes?); refs are the pattern's groups.
+ROUTES = [
+    *[("GET", rf"/{kind}", _list, kind, False) for kind in SERVICES],
+    ("GET", r"/projects/([^/]+)/tasks", _project_tasks, "projects", False),
+    ("GET", r"/reports/deadlines", _deadlines, None, False),
+    ("GET", r"/reports/workload", _workload, None, False),
+    *[("GET", rf"/{kind}/([^/]+)", _get, kind, False) for kind in SERVICES],
+    ("POST", r"/tasks/set-status", _bulk("set_status", ("project", "status", "from_status"), ("project", "status")), "tasks", True),
+    ("POST", r"/tasks/reassign", _bulk("reassign", ("from_user", "to_user", "project"), ("from_user",)), "tasks", True),
+    ("POST", r"/tasks/shift-due", _bulk("shift_due_dates", ("project", "days"), ("project", "days")), "tasks", True),
+    *[("POST", rf"/{kind}", _create, kind, True) for kind in SERVICES],
+    *[("PATCH", rf"/{kind}/([^/]+)", _update, kind, True) for kind in SERVICES],
+    *[("DELETE", rf"/{kind}/([^/]+)", _delete, kind, True) for kind in SERVICES],
+]
+ROUTES = [(method, re.compile(pattern + "/?"), handler, kind, writes) for method, pattern, handler, kind, writes in ROUTES]
+
+
+def route(method, path):
+    """(handler taking (session, query, body), writes?) for a request."""
+    for route_method, pattern, handler, kind, writes in ROUTES:
+        match = pattern.fullmatch(path)
+        if route_method == method and match:
+            refs = tuple(unquote(group) for group in match.groups())
+            return (lambda session, query, body: handler(session, kind, query, body, *refs)), writes
+    raise NotFound(f"No route for {method} {path}.")
+
+
+def run_batch(session, requests):
+    """Every request of a /batch body in order, in the caller's transaction."""
+    if not isinstance(requests, list):
+        raise ValueError("A batch is a JSON list of {method, path, body} objects.")
+    responses = []
+    for index, request in enumerate(requests):
+        try:
+            url = urlsplit(request["path"])
+            handler, _ = route(request.get("method", "GET").upper(), url.path)
+            query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+            status, payload = handler(session, query, request.get("body") or {})
+        except (KeyError, TypeError):
+            raise ValueError(f"request {index}: needs a method and a path.") from None
+        except ValueError as e:
+            raise type(e)(f"request {index}: {e}") from None
+        responses.append({"status": status, "body": payload})
+    return 200, {"responses": responses}
+
+# ─── HTTP ────────────────────────────────────────────────────────────────────
+
+class Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128   # many clients connect at once; the default backlog is 5
+
+
+class Handler(BaseHTTPRequestHandler):
+    server_version = "ProjectManager/1.0"
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_PATCH(self):
+        self._dispatch("PATCH")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+    def _dispatch(self, method):
+        store = self.server.store
+        url = urlsplit(self.path)
+        try:
+            body = self._body()
+            if method == "POST" and url.path.rstrip("/") == "/batch":
+                status, payload = store.write(lambda session: run_batch(session, body))
+                return self._send(status, payload)
+            handler, writes = route(method, url.path)
+            query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+            if writes:
+                status, payload = store.write(lambda session: handler(session, query, body))
+                return self._send(status, payload)
+            # Tag before reading: a write landing in between only makes the tag older.
+            etag = store.etag()
+            if url.path.startswith("/reports/") and not query.get("as_of"):
+                # Reports default to today: yesterday's copy is stale even with no writes.
+                etag = f'{etag[:-1]}-{date.today()}"'
+            if etag in self.headers.get("If-None-Match", ""):
+                return self._send(304, None, etag)
+            status, payload = store.read(lambda session: handler(session, query, body))
+            self._send(status, payload, etag)
+        except NotFound as e:
+            self._send(404, {"error": str(e)})
+        except ValueError as e:
+            self._send(400, {"error": str(e)})
+        except Exception as e:
+            self.log_error("%s %s failed: %r", method, self.path, e)
+            self._send(500, {"error": "Internal error."})
+
+    def _body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        try:
+            return json.loads(self.rfile.read(length))
+        except ValueError:
+            raise ValueError("Request body is not valid JSON.") from None
+
+    def _send(self, status, payload, etag=None):
+        data = b"" if payload is None else json.dumps(payload, default=str).encode()
+        self.send_response(status)
+        if payload is not None:
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        if etag:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+def make_server(host="127.0.0.1", port=8000, readers=DEFAULT_READERS, url=None, verbose=False):
+    httpd = Server((host, port), Handler)
+    httpd.store = Store(url, readers)
+    httpd.verbose = verbose
+    return httpd
+
+
+def build_parser(parser=None):
+    parser = parser or argparse.ArgumentParser(description="Serve the project manager as a JSON HTTP API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--readers", type=int, default=DEFAULT_READERS, help="read-only connections")
+    parser.add_argument("--verbose", action="store_true", help="log every request")
+    return parser
+
+
+def run(args):
+    httpd = make_server(args.host, args.port, args.readers, verbose=args.verbose)
+    print(f"✅ Serving on http://{args.host}:{httpd.server_address[1]} (Ctrl+C to stop)")
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        httpd.server_close()
+        httpd.store.close()
+
+
+if __name__ == "__main__":
+    run(build_parser().parse_args())
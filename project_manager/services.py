@@ -0,0 +1,485 @@
+# project_manager/services.py
+"""
+Service API for projects, tasks and users, independent of the CLI.
+
+    with SessionLocal() as session:
+        tasks = TaskService(session)
+        page = tasks.list(limit=50)
+        more = tasks.list(after=page[-1], limit=50)
+        tasks.update_many([t.id for t in page], status="Done")
+        session.commit()
+
+Reads run Core selects and return frozen, slotted dataclasses: no identity
+map, no change tracking and no lazy loads, so they are cheap to build and
+safe to hand around after the session closes. Single-object writes go
+through project_manager.operations (same rules as the prompts).
+
+search() ranks full-text matches from the FTS5 indexes. get_many and
+update_many work on many ids with one statement per chunk, and TaskService's
+set_status/reassign/shift_due_dates change every matching task with a
+single UPDATE. ReportService answers whole-database questions with a few
+aggregate statements. Like operations, services flush but leave committing
+to the caller.
+"""
+
+from dataclasses import dataclass
+from datetime import date
+from itertools import islice
+
+from sqlalchemy import Date, func, literal, select, update
+from project_manager import operations
+from project_manager.operations import NotFound, _project_record, _user_record
+from project_manager.models.enums import Priority, ProjectStatus, TaskStatus
+from project_manager.models.project import Project
+from project_manager.models.task import Task, check_due_date
+from project_manager.models.user import User
+from project_manager.models.search import fts_match_expression, ranked_search
+from project_manager.pagination import DEFAULT_PAGE_SIZE, keyset_predicate
+from project_manager.cache import cached_result
+from project_manager.queries import (
+    deadline_groups_select, deadline_projects_select, deadline_tasks_select,
+    project_progress_select, user_listing_select, workload_select,
+)
+
+# Ids per IN (...) list, well under SQLite's bound-parameter limit.
+ID_CHUNK = 500
+
+
+@dataclass(frozen=True, slots=True)
+class ProjectRow:
+    id: int
+    name: str
+    description: str | None
+    start_date: date
+    deadline: date
+    priority: Priority
+    status: ProjectStatus
+
+
+@dataclass(frozen=True, slots=True)
+class ProjectProgress:
+    id: int
+    name: str
+    deadline: date
+    priority: Priority
+    status: ProjectStatus
+    task_count: int
+    todo_count: int
+    in_progress_count: int
+    done_count: int
+    completion_percentage: float
+
+
+@dataclass(frozen=True, slots=True)
+class TaskRow:
+    id: int
+    name: str
+    description: str | None
+    status: TaskStatus
+    due_date: date | None
+    project_id: int
+    project_name: str
+    user_id: int | None
+    user_name: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class UserRow:
+    id: int
+    name: str
+    email: str
+
+
+@dataclass(frozen=True, slots=True)
+class ProjectDeadline:
+    id: int
+    name: str
+    deadline: date
+    deadline_in: int    # days from as_of; negative once past
+    open_tasks: int
+
+
+@dataclass(frozen=True, slots=True)
+class DeadlineTask:
+    id: int
+    name: str
+    status: TaskStatus
+    due_date: date
+    due_in: int         # days from as_of; negative when overdue
+    project_id: int
+    project_name: str
+    user_id: int | None
+    user_name: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class ProjectDeadlineGroup:
+    id: int
+    name: str
+    deadline: date
+    deadline_in: int
+    overdue: int
+    due_soon: int
+    first_due: date
+    first_due_in: int
+
+
+@dataclass(frozen=True, slots=True)
+class UserDeadlineGroup:
+    id: int | None      # None: the unassigned tasks
+    name: str | None
+    overdue: int
+    due_soon: int
+    first_due: date
+    first_due_in: int
+
+
+@dataclass(frozen=True, slots=True)
+class DeadlineReport:
+    as_of: date
+    within_days: int
+    overdue: int
+    due_soon: int
+    projects: list      # [ProjectDeadline] past or near their own deadline
+    by_project: list    # [ProjectDeadlineGroup]
+    by_user: list       # [UserDeadlineGroup]
+    tasks: list         # [DeadlineTask], the earliest due first
+
+
+@dataclass(frozen=True, slots=True)
+class WorkloadRow:
+    id: int | None      # None: the unassigned tasks
+    name: str | None
+    task_count: int
+    todo_count: int
+    in_progress_count: int
+    done_count: int
+    open_count: int
+    overdue_count: int
+    first_due: date | None  # earliest due date of an open task
+
+
+def _chunks(ids, size=ID_CHUNK):
+    ids = iter(sorted(set(ids)))
+    while chunk := list(islice(ids, size)):
+        yield chunk
+
+
+class _Service:
+    """get/get_many/search over `row_type` rows of `model`."""
+
+    model = None
+    row_type = None
+    sort_field = "id"   # list() pages by (sort_field, id)
+
+    def __init__(self, session):
+        self.session = session
+
+    def page_key(self, row) -> tuple:
+        """The (sort value, id) key list() resumes after; `after` takes a row or a key."""
+        return row if isinstance(row, tuple) else (getattr(row, self.sort_field), row.id)
+
+    def _select(self):
+        return select(*(getattr(self.model, f) for f in self.row_type.__slots__))
+
+    def _rows(self, stmt):
+        row_type = self.row_type
+        return [row_type(*row) for row in self.session.execute(stmt)]
+
+    def get_many(self, ids):
+        """Rows for the given ids (missing ones skipped), ordered by id."""
+        rows = []
+        for chunk in _chunks(ids):
+            rows.extend(self._rows(self._select().where(self.model.id.in_(chunk))))
+        return sorted(rows, key=lambda row: row.id)
+
+    def search(self, term: str, limit=DEFAULT_PAGE_SIZE):
+        """Rows whose indexed text matches every word of `term` as a prefix, best first; limit=None for all."""
+        if fts_match_expression(term) is None:
+            return []
+        stmt = ranked_search(self._select(), self.model, term)
+        return self._rows(stmt if limit is None else stmt.limit(limit))
+
+
+class _UpdatableService(_Service):
+    """A _Service whose rows can be changed in bulk with update_many."""
+
+    updatable = ()      # fields update_many accepts
+
+    def update_many(self, ids, **values) -> int:
+        """Set the same values on every id with one UPDATE per chunk; returns rows changed."""
+        unknown = set(values) - set(self.updatable)
+        if unknown:
+            raise ValueError(
+                f"Can't update {', '.join(sorted(unknown))}; "
+                f"choose from: {', '.join(self.updatable)}."
+            )
+        ids = list(ids)
+        if not values or not ids:
+            return 0
+        values = self._values(ids, values)
+        return sum(
+            self._bulk_update(update(self.model).where(self.model.id.in_(chunk)).values(**values))
+            for chunk in _chunks(ids)
+        )
+
+    def _bulk_update(self, stmt) -> int:
+        """Run an ORM-enabled UPDATE (so the lookup cache sees it); returns rows changed."""
+        changed = self.session.execute(stmt, execution_options={"synchronize_session": False}).rowcount
+        self.session.expire_all()
+        return changed
+
+    def _values(self, ids, values):
+        """Checked and normalised {column: value} for update_many."""
+        return values
+
+
+class ProjectService(_UpdatableService):
+    model = Project
+    row_type = ProjectRow
+    sort_field = "deadline"
+    updatable = ("priority", "status")
+
+    def list(self, after=None, limit=DEFAULT_PAGE_SIZE):
+        """A page of projects with progress, by (deadline, id), after the row `after`."""
+        key = self.page_key(after) if after else None
+        stmt = project_progress_select(keyset_predicate(Project.deadline, Project.id, key), limit=limit)
+        return [ProjectProgress(*row) for row in self.session.execute(stmt)]
+
+    def get(self, ref) -> ProjectRow:
+        return self._row(operations.get_project(self.session, ref).id)
+
+    def tasks(self, ref):
+        """All tasks of a project by (due_date, id)."""
+        project_id = operations.get_project(self.session, ref).id
+        return TaskService(self.session).list(Task.project_id == project_id, limit=None)
+
+    def create(self, name, deadline, description=None, start_date=None, priority="Medium") -> ProjectRow:
+        project = operations.create_project(self.session, name, deadline, description, start_date, priority)
+        return self._row(project.id)
+
+    def update(self, ref, **changes) -> ProjectRow:
+        return self._row(operations.update_project(self.session, ref, **changes).id)
+
+    def delete(self, ref) -> ProjectRow:
+        row = self.get(ref)
+        operations.delete_project(self.session, row.id)
+        return row
+
+    def _row(self, project_id):
+        return self._rows(self._select().where(Project.id == project_id))[0]
+
+    def _values(self, ids, values):
+        enums = {"priority": Priority, "status": ProjectStatus}
+        return {field: enums[field].parse(value, field.capitalize()) for field, value in values.items()}
+
+
+class TaskService(_UpdatableService):
+    model = Task
+    row_type = TaskRow
+    sort_field = "due_date"
+    updatable = ("status", "due_date", "user")
+
+    def _select(self):
+        return (
+            select(
+                Task.id, Task.name, Task.description, Task.status, Task.due_date,
+                Task.project_id, Project.name, Task.user_id, User.name,
+            )
+            .join(Project, Task.project_id == Project.id)
+            .outerjoin(User, Task.user_id == User.id)
+        )
+
+    def list(self, *criteria, after=None, limit=DEFAULT_PAGE_SIZE):
+        """A page of tasks by (due_date, id), after the row `after`; limit=None for all."""
+        key = self.page_key(after) if after else None
+        stmt = (
+            self._select()
+            .where(keyset_predicate(Task.due_date, Task.id, key), *criteria)
+            .order_by(Task.due_date, Task.id)
+        )
+        return self._rows(stmt if limit is None else stmt.limit(limit))
+
+    def get(self, task_id) -> TaskRow:
+        rows = self._rows(self._select().where(Task.id == int(task_id)))
+        if not rows:
+            raise NotFound(f"Task {task_id} does not exist.")
+        return rows[0]
+
+    def create(self, name, project, description=None, status="To Do", due_date=None, user=None) -> TaskRow:
+        task = operations.create_task(self.session, name, project, description, status, due_date, user)
+        return self.get(task.id)
+
+    def update(self, task_id, **changes) -> TaskRow:
+        return self.get(operations.update_task(self.session, task_id, **changes).id)
+
+    def delete(self, task_id) -> TaskRow:
+        row = self.get(task_id)
+        operations.delete_task(self.session, row.id)
+        return row
+
+    def update_many(self, ids, **values) -> int:
+        """
+        As for every service; `user` takes a user ID or name, or None to
+        unassign. A due_date past the deadline of any of the tasks' projects
+        is refused before anything is written.
+        """
+        return super().update_many(ids, **values)
+
+    def _values(self, ids, values):
+        values = dict(values)
+        if "status" in values:
+            values["status"] = TaskStatus.parse(values["status"], "Status")
+        if "user" in values:
+            user = values.pop("user")
+            values["user_id"] = _user_record(self.session, user).id if user is not None else None
+        due_date = values.get("due_date")
+        if due_date is not None:
+            check_due_date(due_date)
+            for chunk in _chunks(ids):
+                late = self.session.execute(
+                    select(func.count(), func.min(Project.deadline))
+                    .select_from(Task)
+                    .join(Project, Task.project_id == Project.id)
+                    .where(Task.id.in_(chunk), Project.deadline < due_date)
+                ).one()
+                if late[0]:
+                    raise ValueError(
+                        f"Due date ({due_date}) cannot exceed project deadline ({late[1]}) "
+                        f"of {late[0]} of these tasks."
+                    )
+        return values
+
+    # Set-based operations: each is a single UPDATE ... WHERE over however
+    # many tasks match, returning the number of rows it changed.
+
+    def set_status(self, project, status, from_status=None) -> int:
+        """Give every task of a project `status` (only those in `from_status`, if given)."""
+        project_id = _project_record(self.session, project).id
+        status = TaskStatus.parse(status, "Status")
+        criteria = [Task.project_id == project_id, Task.status != status]
+        if from_status:
+            criteria.append(Task.has_status(from_status))
+        return self._bulk_update(update(Task).where(*criteria).values(status=status))
+
+    def reassign(self, from_user, to_user=None, project=None) -> int:
+        """Move every task of `from_user` (in one project, if given) to `to_user`, or unassign them."""
+        from_id = _user_record(self.session, from_user).id
+        to_id = _user_record(self.session, to_user).id if to_user is not None else None
+        if from_id == to_id:
+            return 0
+        criteria = [Task.user_id == from_id]
+        if project is not None:
+            criteria.append(Task.project_id == _project_record(self.session, project).id)
+        return self._bulk_update(update(Task).where(*criteria).values(user_id=to_id))
+
+    def shift_due_dates(self, project, days: int, today=None) -> int:
+        """
+        Move the due dates of a project's tasks by `days`, clamped in SQL to
+        the project's deadline. Moving earlier never goes before `today`
+        (default: the current date) and leaves already overdue tasks alone.
+        """
+        project_id = _project_record(self.session, project).id
+        days = int(days)
+        if days == 0:
+            return 0
+        today = today or date.today()
+        deadline = select(Project.deadline).where(Project.id == Task.project_id).scalar_subquery()
+        shifted = func.date(Task.due_date, f"{days:+d} days")
+        criteria = [Task.project_id == project_id, Task.due_date.is_not(None)]
+        if days > 0:
+            new_due = func.min(shifted, deadline)
+            criteria.append(Task.due_date < deadline)
+        else:
+            new_due = func.max(shifted, literal(today, Date))
+            criteria.append(Task.due_date > today)
+        return self._bulk_update(update(Task).where(*criteria).values(due_date=new_due))
+
+
+class UserService(_Service):
+    model = User
+    row_type = UserRow
+    sort_field = "name"
+
+    def list(self, after=None, limit=DEFAULT_PAGE_SIZE):
+        """A page of users by (name, id), after the row `after`."""
+        key = self.page_key(after) if after else None
+        return self._rows(user_listing_select(keyset_predicate(User.name, User.id, key), limit=limit))
+
+    def get(self, ref) -> UserRow:
+        return self._row(operations.get_user(self.session, ref).id)
+
+    def task_counts(self):
+        """{user id: number of tasks assigned}, for users with at least one."""
+        return dict(self.session.execute(
+            select(Task.user_id, func.count(Task.id)).where(Task.user_id.is_not(None)).group_by(Task.user_id)
+        ).all())
+
+    def create(self, name, email) -> UserRow:
+        return self._row(operations.create_user(self.session, name, email).id)
+
+    def update(self, ref, **changes) -> UserRow:
+        return self._row(operations.update_user(self.session, ref, **changes).id)
+
+    def delete(self, ref) -> UserRow:
+        row = self.get(ref)
+        operations.delete_user(self.session, row.id)
+        return row
+
+    def _row(self, user_id):
+        return self._rows(self._select().where(User.id == user_id))[0]
+
+
+class ReportService:
+    """Read-only reports computed in SQL over committed data."""
+
+    def __init__(self, session):
+        self.session = session
+
+    def _rows(self, row_type, stmt):
+        return [row_type(*row) for row in self.session.execute(stmt)]
+
+    def deadlines(self, as_of=None, within_days: int = 7, limit: int | None = 50) -> DeadlineReport:
+        """
+        Open tasks that are overdue on `as_of` (default: today) or due within
+        `within_days` after it, counted per project and per user, with the
+        first `limit` of the tasks themselves (None for all) and the active
+        projects whose deadline falls in the same window.
+        """
+        as_of = as_of or date.today()
+        within_days = int(within_days)
+        if within_days < 0:
+            raise ValueError("within_days cannot be negative.")
+        by_project = self._rows(ProjectDeadlineGroup, deadline_groups_select("project", as_of, within_days))
+        by_user = self._rows(UserDeadlineGroup, deadline_groups_select("user", as_of, within_days))
+        # Start the task listing at the earliest open due date, past the
+        # done history that ix_tasks_due_date would otherwise walk first.
+        first_due = min((group.first_due for group in by_project), default=None)
+        tasks = []
+        if first_due is not None:
+            tasks = self._rows(
+                DeadlineTask, deadline_tasks_select(as_of, within_days, Task.due_date >= first_due, limit=limit)
+            )
+        return DeadlineReport(
+            as_of=as_of,
+            within_days=within_days,
+            overdue=sum(group.overdue for group in by_project),
+            due_soon=sum(group.due_soon for group in by_project),
+            projects=self._rows(ProjectDeadline, deadline_projects_select(as_of, within_days)),
+            by_project=by_project,
+            by_user=by_user,
+            tasks=tasks,
+        )
+
+    def workload(self, as_of=None) -> tuple:
+        """
+        WorkloadRow per user with tasks, and one for the unassigned tasks,
+        busiest first; overdue means open and due before `as_of` (default:
+        today). Cached until anything commits to the database, so repeated
+        refreshes of an unchanged database cost one PRAGMA.
+        """
+        as_of = as_of or date.today()
+        return cached_result(
+            self.session, ("workload", as_of),
+            lambda: tuple(self._rows(WorkloadRow, workload_select(as_of))),
+        )
@@ -0,0 +1,123 @@
+# project_manager/unit_of_work.py
+"""
+Session modes for the interactive menus.
+
+By default every menu action opens its own session, commits its change and
+closes it: one transaction, and one fsync, per action. begin_batch() opens
+a unit of work instead. Until commit_batch() or rollback_batch(), every
+action gets the same scoped session, so what one action loaded is still in
+the identity map for the next, and the whole batch commits once.
+
+Each action in a batch runs in a SAVEPOINT. Its changes are flushed when
+the helper commits, so later actions (and their checks, like duplicate
+names) see them, and an action that fails or is rolled back undoes only its
+own changes. Reads see the database as of the batch's first statement, plus
+the batch's own changes. The write lock is taken at the first change and
+held until the batch ends, so other writers wait on it (up to the
+busy_timeout).
+"""
+
+from sqlalchemy.orm import scoped_session, sessionmaker
+from project_manager.models import SessionLocal, create_sqlite_engine, enable_savepoints, get_engine
+
+_batch = None       # scoped_session while a batch is open
+_actions = 0        # actions committed into the open batch
+
+
+class BatchAction:
+    """
+    One menu action inside a batch. Proxies the batch session: commit()
+    releases the action's SAVEPOINT, rollback() rolls back to it, and
+    close() drops whatever wasn't committed but leaves the session open.
+    """
+
+    def __init__(self, session):
+        self._session = session
+        self._savepoint = session.begin_nested()
+
+    def __getattr__(self, name):
+        return getattr(self._session, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def commit(self):
+        global _actions
+        if self._savepoint is not None:
+            savepoint, self._savepoint = self._savepoint, None
+            savepoint.commit()
+            _actions += 1
+
+    def rollback(self):
+        if self._savepoint is not None:
+            savepoint, self._savepoint = self._savepoint, None
+            savepoint.rollback()
+
+    def close(self):
+        self.rollback()
+
+
+def action_session():
+    """
+    The session for one menu action: a new SessionLocal() normally, or a
+    BatchAction while a batch is open. Helpers use both the same way.
+    """
+    if _batch is None:
+        return SessionLocal()
+    return BatchAction(_batch())
+
+
+def in_batch() -> bool:
+    return _batch is not None
+
+
+def batch_actions() -> int:
+    """Actions committed into the open batch so far."""
+    return _actions
+
+
+def begin_batch():
+    """Open a batch. Raises ValueError if one is already open."""
+    global _batch, _actions
+    if _batch is not None:
+        raise ValueError("A batch is already open.")
+    # Same database as SessionLocal, on a connection that can take SAVEPOINTs.
+    url = (SessionLocal.kw.get("bind") or get_engine()).url
+    engine = create_sqlite_engine(url.render_as_string(hide_password=False), pool_size=1, max_overflow=0)
+    enable_savepoints(engine)
+    _batch = scoped_session(sessionmaker(bind=engine, autoflush=False))
+    _actions = 0
+
+
+def commit_batch() -> int:
+    """
+    Commit the open batch in one transaction and return how many actions it
+    held. If the commit fails the batch is rolled back and the error raised.
+    """
+    return _end_batch(commit=True)
+
+
+def rollback_batch() -> int:
+    """Discard the open batch; returns how many actions it held."""
+    return _end_batch(commit=False)
+
+
+def _end_batch(commit):
+    global _batch
+    if _batch is None:
+        raise ValueError("No batch is open.")
+    session = _batch()
+    engine = session.get_bind()
+    try:
+        if commit:
+            session.commit()
+        else:
+            session.rollback()
+    finally:
+        _batch.remove()
+        _batch = None
+        engine.dispose()
+    return _actions
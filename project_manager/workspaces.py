@@ -0,0 +1,184 @@
+# project_manager/workspaces.py
+"""
+Workspaces: one SQLite file per team.
+
+Each workspace is a complete database of its own (projects, tasks, users,
+search indexes, project_stats), so teams never contend for the same write
+lock and each file stays small enough to keep its indexes in cache. The
+current workspace (models.use_workspace) is what SessionLocal and the rest
+of the app use; this module opens any of them by name:
+
+    with WorkspaceSession(workspace="design") as session: ...
+
+Cross-workspace reports fan out: the same read-only query runs on every
+workspace in a thread pool (sqlite3 releases the GIL while a statement
+runs) and the results are merged in Python, each row tagged with the
+workspace it came from. Ids are only unique within a workspace.
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session, sessionmaker
+from project_manager.models import (
+    DEFAULT_WORKSPACE, WORKSPACE_DIR, create_sqlite_engine, current_workspace, workspace_url,
+)
+from project_manager.schema import ensure_schema
+from project_manager.services import DeadlineReport, ReportService
+
+# Engines per (workspace, read_only), shared by every WorkspaceSession.
+_engines = {}
+_engines_lock = threading.Lock()
+
+
+@dataclass(frozen=True, slots=True)
+class WorkspaceRow:
+    workspace: str
+    row: object         # a report row of that workspace, e.g. a WorkloadRow
+
+
+def workspace_path(name: str) -> str:
+    return workspace_url(name)[len("sqlite:///"):]
+
+
+def workspace_exists(name: str) -> bool:
+    return os.path.exists(workspace_path(name))
+
+
+def list_workspaces() -> list:
+    """Names of all existing workspaces, "default" first and the rest by name."""
+    names = []
+    if os.path.isdir(WORKSPACE_DIR):
+        names = sorted(
+            stem for stem, ext in map(os.path.splitext, os.listdir(WORKSPACE_DIR))
+            # NAME.archive.db is NAME's archive (see project_manager.archive).
+            if ext == ".db" and stem != DEFAULT_WORKSPACE and "." not in stem
+        )
+    return [DEFAULT_WORKSPACE, *names] if workspace_exists(DEFAULT_WORKSPACE) else names
+
+
+def workspace_engine(name: str, read_only: bool = False):
+    """
+    The shared engine of a workspace. Raises ValueError for an unknown
+    workspace rather than creating an empty file for a typo.
+    """
+    key = (name, read_only)
+    with _engines_lock:
+        if key not in _engines:
+            if not workspace_exists(name):
+                raise ValueError(f"Workspace '{name}' not found. Create it with `cli.py workspace create {name}`.")
+            _engines[key] = create_sqlite_engine(workspace_url(name), read_only=read_only)
+        return _engines[key]
+
+
+def create_workspace(name: str) -> str:
+    """Create a workspace with an empty, current schema; returns its file."""
+    if name == "all":
+        raise ValueError("'all' is reserved: `alembic -x workspace=all` means every workspace.")
+    if workspace_exists(name):
+        raise ValueError(f"Workspace '{name}' already exists.")
+    os.makedirs(os.path.dirname(workspace_path(name)), exist_ok=True)
+    engine = create_sqlite_engine(workspace_url(name))
+    try:
+        ensure_schema(engine)
+    finally:
+        engine.dispose()
+    return workspace_path(name)
+
+
+class RoutingSession(Session):
+    """
+    A Session routed to one workspace's engine: WorkspaceSession(workspace=
+    "design", read_only=True). The workspace defaults to the current one.
+    """
+
+    def __init__(self, workspace=None, read_only=False, **kw):
+        self.workspace = workspace or current_workspace()
+        self.read_only = read_only
+        super().__init__(**kw)
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        return workspace_engine(self.workspace, self.read_only)
+
+
+WorkspaceSession = sessionmaker(class_=RoutingSession, autoflush=False)
+
+
+def fan_out(fn, workspaces=None, max_workers=None) -> dict:
+    """
+    {workspace: fn(session)} for each workspace (default: all of them), every
+    call on a read-only session of its own and run in parallel. The first
+    error raised by any workspace is raised here. No workspaces, no results.
+    """
+    names = list(workspaces or list_workspaces())
+    if not names:
+        return {}
+    for name in names:
+        workspace_engine(name, read_only=True)     # unknown names fail before anything runs
+
+    def run(name):
+        with WorkspaceSession(workspace=name, read_only=True) as session:
+            return fn(session)
+
+    with ThreadPoolExecutor(max_workers=max_workers or min(len(names), os.cpu_count() or 1)) as pool:
+        return dict(zip(names, pool.map(run, names)))
+
+
+# ─── Cross-workspace Reports ─────────────────────────────────────────────────
+# Merged in the order each query sorts by, with SQLite's NULLs-first for the
+# unassigned rows and the workspace name as the final tie-break.
+
+def _nulls_first(value):
+    return (value is not None, value if value is not None else 0)
+
+
+def _merge(results, rows_of, key):
+    rows = [WorkspaceRow(name, row) for name, result in results.items() for row in rows_of(result)]
+    return sorted(rows, key=lambda w: (*key(w.row), w.workspace))
+
+
+def deadlines(as_of=None, within_days: int = 7, limit: int | None = 50, workspaces=None) -> DeadlineReport:
+    """
+    ReportService.deadlines across workspaces: the totals summed and every
+    section merged into WorkspaceRows, tasks cut to the first `limit`.
+    """
+    as_of = as_of or date.today()
+    reports = fan_out(lambda session: ReportService(session).deadlines(as_of, within_days, limit), workspaces)
+    tasks = _merge(reports, lambda r: r.tasks, lambda t: (t.due_date, t.id))
+    return DeadlineReport(
+        as_of=as_of,
+        within_days=int(within_days),
+        overdue=sum(report.overdue for report in reports.values()),
+        due_soon=sum(report.due_soon for report in reports.values()),
+        projects=_merge(reports, lambda r: r.projects, lambda p: (p.deadline, p.id)),
+        by_project=_merge(reports, lambda r: r.by_project, lambda g: (-g.overdue, g.first_due, g.id)),
+        by_user=_merge(reports, lambda r: r.by_user, lambda g: (-g.overdue, g.first_due, _nulls_first(g.id))),
+        tasks=tasks[:limit] if limit is not None else tasks,
+    )
+
+
+def workload(as_of=None, workspaces=None) -> list:
+    """ReportService.workload across workspaces as WorkspaceRows, busiest first."""
+    as_of = as_of or date.today()
+    results = fan_out(lambda session: ReportService(session).workload(as_of), workspaces)
+    return _merge(
+        results, lambda rows: rows,
+        lambda w: (-w.open_count, _nulls_first(w.name), _nulls_first(w.id)),
+    )
+
+
+def workspace_summary(workspaces=None) -> dict:
+    """{workspace: (projects, tasks, users)}, counted in parallel."""
+    def counts(session):
+        # Tasks from project_stats rather than a count(*) over the tasks table.
+        return tuple(session.execute(text(
+            "SELECT (SELECT count(*) FROM projects), "
+            "(SELECT coalesce(sum(task_count), 0) FROM project_stats), "
+            "(SELECT count(*) FROM users)"
+        )).one())
+
+    return fan_out(counts, workspaces)
@@ -0,0 +1,58 @@
+# tests/conftest.py
+
+from datetime import date, timedelta
+
+import pytest
+
+from project_manager import schema
+from project_manager.cache import invalidate_lookups
+from project_manager.models import SessionLocal, create_sqlite_engine
+from project_manager.services import ProjectService, TaskService, UserService
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    """A fresh database at the current schema, used by SessionLocal for the test."""
+    engine = create_sqlite_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    # ensure_schema remembers engines by id(), which a disposed engine can pass on.
+    monkeypatch.setattr(schema, "_checked", set())
+    schema.ensure_schema(engine)
+    monkeypatch.setitem(SessionLocal.kw, "bind", engine)
+    invalidate_lookups()
+    yield engine
+    invalidate_lookups()
+    engine.dispose()
+
+
+@pytest.fixture
+def seeded(engine):
+    """
+    3 users, 3 projects and 12 tasks: every project has tasks and every user
+    has tasks in more than one project, so a per-row lazy load would show up
+    as repeated statements.
+    """
+    today = date.today()
+    with SessionLocal() as session:
+        users = UserService(session)
+        for n in range(1, 4):
+            users.create(f"User {n}", f"user{n}@example.com")
+        projects = ProjectService(session)
+        for n in range(1, 4):
+            projects.create(f"Project {n}", today + timedelta(days=30 * n))
+        tasks = TaskService(session)
+        for n in range(1, 13):
+            tasks.create(
+                f"Task {n}", f"Project {n % 3 + 1}", due_date=today + timedelta(days=n),
+                user=f"User {n % 3 + 1}" if n % 4 else None,
+            )
+        session.commit()
+    return engine
+
+
+@pytest.fixture
+def answers(monkeypatch):
+    """answers("1", "y") feeds those lines to input(), in order."""
+    def feed(*lines):
+        replies = iter(lines)
+        monkeypatch.setattr("builtins.input", lambda prompt="": next(replies))
+    return feed
@@ -0,0 +1,115 @@
+# tests/test_archive.py
+
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import text
+
+from project_manager import archive
+from project_manager.models import SessionLocal
+from project_manager.services import ProjectService, TaskService
+
+# Far enough ahead that every seeded deadline is long past.
+LATER = date.today() + timedelta(days=1000)
+
+
+def _complete(*names):
+    with SessionLocal() as session:
+        projects = ProjectService(session)
+        for name in names:
+            projects.update(name, status="Completed")
+        session.commit()
+
+
+def _names(engine, schema):
+    with engine.connect() as conn:
+        archive.attach_archive(conn)
+        return sorted(conn.exec_driver_sql(f"SELECT name FROM {schema}.projects").scalars())
+
+
+def _journal(engine):
+    with engine.connect() as conn:
+        archive.attach_archive(conn)
+        return conn.exec_driver_sql("SELECT count(*) FROM archive.moves").scalar()
+
+
+def test_archive_and_restore(seeded):
+    _complete("Project 1", "Project 2")
+    assert archive.archive_projects(seeded, 0, chunk_size=1, today=LATER) == (2, 8)
+    assert _names(seeded, "main") == ["Project 3"]
+    assert _names(seeded, "archive") == ["Project 1", "Project 2"]
+
+    assert archive.restore_projects(seeded, ["Project 2"]) == (1, 4)
+    assert _names(seeded, "main") == ["Project 2", "Project 3"]
+    assert _names(seeded, "archive") == ["Project 1"]
+    assert _journal(seeded) == 0
+
+
+def test_archive_a_project_that_reused_an_archived_id_and_name(seeded):
+    _complete("Project 3")
+    archive.archive_projects(seeded, 0, today=LATER)
+    with SessionLocal() as session:
+        # The highest id is free again, so the new project gets it.
+        project = ProjectService(session).create("Project 3", date.today() + timedelta(days=5))
+        TaskService(session).create("Again", "Project 3")
+        session.commit()
+    _complete("Project 3")
+    with seeded.connect() as conn:
+        assert conn.execute(text("SELECT id FROM projects WHERE name = 'Project 3'")).scalar() == project.id
+
+    assert archive.archive_projects(seeded, 0, today=LATER) == (1, 1)
+    assert _names(seeded, "archive") == ["Project 3", "Project 3"]
+    assert _names(seeded, "main") == ["Project 1", "Project 2"]
+
+
+def test_restore_refuses_any_name_clash(seeded):
+    _complete("Project 1")
+    archive.archive_projects(seeded, 0, today=LATER)
+    with SessionLocal() as session:
+        ProjectService(session).create("Project 1", date.today() + timedelta(days=5))
+        session.commit()
+    with pytest.raises(ValueError, match="already exist"):
+        archive.restore_projects(seeded, ["Project 1"])
+    assert _names(seeded, "archive") == ["Project 1"]
+    assert _journal(seeded) == 0
+
+
+def _interrupt(monkeypatch, name):
+    """Make the next call to archive.<name> fail, as a crash there would."""
+    real = getattr(archive, name)
+
+    def crash(*args):
+        monkeypatch.setattr(archive, name, real)
+        raise RuntimeError("interrupted")
+    monkeypatch.setattr(archive, name, crash)
+
+
+@pytest.mark.parametrize("step", ["_delete", "_clear_journal"])
+def test_interrupted_archive_is_finished_by_the_next_run(seeded, monkeypatch, step):
+    _complete("Project 1")
+    _interrupt(monkeypatch, step)
+    with pytest.raises(RuntimeError):
+        archive.archive_projects(seeded, 0, today=LATER)
+    assert _journal(seeded) == 1
+
+    archive.archive_projects(seeded, 0, today=LATER)
+    assert _names(seeded, "archive") == ["Project 1"]
+    assert _names(seeded, "main") == ["Project 2", "Project 3"]
+    assert _journal(seeded) == 0
+
+
+@pytest.mark.parametrize("step", ["_restore_copy", "_delete"])
+def test_interrupted_restore_is_finished_by_the_next_run(seeded, monkeypatch, step):
+    _complete("Project 1", "Project 2")
+    archive.archive_projects(seeded, 0, today=LATER)
+    _interrupt(monkeypatch, step)
+    with pytest.raises(RuntimeError):
+        archive.restore_projects(seeded, ["Project 1"])
+    assert _journal(seeded) == 1
+
+    assert archive.restore_projects(seeded, ["Project 1", "Project 2"])[0] == 1
+    assert _names(seeded, "main") == ["Project 1", "Project 2", "Project 3"]
+    assert _names(seeded, "archive") == []
+    with seeded.connect() as conn:
+        assert conn.execute(text("SELECT count(*) FROM tasks")).scalar() == 12
+    assert _journal(seeded) == 0
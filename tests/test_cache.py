@@ -0,0 +1,52 @@
+# tests/test_cache.py
+
+import sqlite3
+
+from project_manager.cache import DataVersion, all_users, database_path, lookup_project, lookup_user, user_cache
+from project_manager.models import SessionLocal
+
+
+def _other_process(engine, sql, *params):
+    """A write on a connection of its own, as another process would make it."""
+    conn = sqlite3.connect(database_path(engine))
+    with conn:
+        conn.execute(sql, params)
+    conn.close()
+
+
+def test_lookups_are_cached(seeded):
+    with SessionLocal() as session:
+        lookup_user(session, "User 1")
+        hits = user_cache.hits
+        assert lookup_user(session, "User 1").email == "user1@example.com"
+        assert user_cache.hits == hits + 1
+
+
+def test_commit_elsewhere_invalidates_lookups(seeded):
+    with SessionLocal() as session:
+        assert lookup_user(session, "User 1").email == "user1@example.com"
+        assert len(all_users(session)) == 3
+        assert lookup_project(session, "Project 2") is not None
+    _other_process(seeded, "UPDATE users SET email = 'new@example.com' WHERE name = 'User 1'")
+    _other_process(seeded, "INSERT INTO users (name, email) VALUES ('User 4', 'user4@example.com')")
+    _other_process(seeded, "UPDATE projects SET name = 'Renamed' WHERE name = 'Project 2'")
+    with SessionLocal() as session:
+        assert lookup_user(session, "User 1").email == "new@example.com"
+        assert len(all_users(session)) == 4
+        assert lookup_project(session, "Project 2") is None
+        assert lookup_project(session, "Renamed") is not None
+
+
+def test_data_version_read_once_per_transaction(seeded, monkeypatch):
+    reads = []
+    current = DataVersion.current
+    monkeypatch.setattr(DataVersion, "current", lambda self: reads.append(1) or current(self))
+    with SessionLocal() as session:
+        for _ in range(3):
+            lookup_user(session, "User 1")
+            lookup_project(session, "Project 1")
+            all_users(session)
+        assert len(reads) == 1
+        session.commit()
+        lookup_user(session, "User 1")
+        assert len(reads) == 2
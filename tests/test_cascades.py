@@ -0,0 +1,54 @@
+# tests/test_cascades.py
+"""
+Deletes rely on the schema's ON DELETE rules (see operations.delete_project
+and delete_user), which SQLite only enforces with PRAGMA foreign_keys=ON.
+"""
+
+from datetime import date
+
+import pytest
+from sqlalchemy import insert, select, text
+from sqlalchemy.exc import IntegrityError
+
+from project_manager import operations
+from project_manager.models import SessionLocal
+from project_manager.models.task import Task
+
+
+def test_foreign_keys_are_on(seeded):
+    with seeded.connect() as conn:
+        assert conn.execute(text("PRAGMA foreign_keys")).scalar() == 1
+
+
+def _stats_rows(conn, project_id):
+    return conn.execute(text("SELECT count(*) FROM project_stats WHERE project_id = :id"), {"id": project_id}).scalar()
+
+
+def test_delete_project_removes_its_tasks_and_stats(seeded):
+    with SessionLocal() as session:
+        project_id = operations.get_project(session, "Project 1").id
+        assert _stats_rows(session.connection(), project_id) == 1
+        operations.delete_project(session, project_id)
+        session.commit()
+    with seeded.connect() as conn:
+        assert conn.execute(select(Task.id).where(Task.project_id == project_id)).all() == []
+        assert _stats_rows(conn, project_id) == 0
+        assert conn.execute(select(Task.id)).all() != []     # other projects keep theirs
+
+
+def test_delete_user_unassigns_their_tasks(seeded):
+    with SessionLocal() as session:
+        user_id = operations.get_user(session, "User 1").id
+        task_ids = set(session.scalars(select(Task.id).where(Task.user_id == user_id)))
+        assert task_ids
+        operations.delete_user(session, user_id)
+        session.commit()
+    with seeded.connect() as conn:
+        rows = conn.execute(select(Task.id, Task.user_id).where(Task.id.in_(task_ids))).all()
+    assert sorted(rows) == [(task_id, None) for task_id in sorted(task_ids)]
+
+
+def test_task_with_dangling_project_is_refused(seeded):
+    with pytest.raises(IntegrityError):
+        with seeded.begin() as conn:
+            conn.execute(insert(Task).values(name="Orphan", status=1, project_id=999, due_date=date.today()))
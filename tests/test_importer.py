@@ -0,0 +1,72 @@
+# tests/test_importer.py
+
+import json
+
+import pytest
+
+from sqlalchemy import select
+
+from project_manager import importer
+from project_manager.models import SessionLocal
+from project_manager.models.user import User
+
+
+def test_unreadable_jsonl_lines_are_rejected(engine, tmp_path):
+    path = tmp_path / "users.jsonl"
+    path.write_text("\n".join([
+        '{"name": "Ann", "email": "ann@example.com"}',
+        '{"name": "Bob", ',
+        '["x"]',
+        "3",
+        "",
+        '{"name": "Cy", "email": "cy@example.com"}',
+    ]) + "\n")
+    reject_path = tmp_path / "users.rejects.jsonl"
+
+    report = importer.import_file("users", str(path), str(reject_path), bind=engine, chunk_size=2)
+
+    assert (report.inserted, report.rejected) == (2, 3)
+    rejects = [json.loads(line) for line in reject_path.read_text().splitlines()]
+    assert [r["line"] for r in rejects] == [2, 3, 4]
+    assert rejects[0]["raw"] == '{"name": "Bob", '
+    assert rejects[1]["error"] == "line 3: expected a JSON object, got list"
+    assert rejects[2]["error"] == "line 4: expected a JSON object, got int"
+    with SessionLocal() as session:
+        assert sorted(session.scalars(select(User.name))) == ["Ann", "Cy"]
+
+
+def test_pragma_profile_option():
+    args = importer.build_parser().parse_args(["tasks", "t.csv", "--pragma-profile", "bulk-load"])
+    assert args.pragma_profile == "bulk-load"
+
+
+@pytest.mark.parametrize("size", ["0", "-1", "x"])
+def test_chunk_size_must_be_positive(engine, size):
+    with pytest.raises(SystemExit):
+        importer.build_parser().parse_args(["users", "u.csv", "--chunk-size", size])
+    if size.lstrip("-").isdigit():
+        with pytest.raises(ValueError, match="chunk_size"):
+            importer.import_records("users", [], None, bind=engine, chunk_size=int(size))
+
+
+def test_task_rejects_keep_input_order(seeded, tmp_path):
+    path = tmp_path / "tasks.csv"
+    path.write_text("\n".join([
+        "name,project,user,due_date",
+        "Ghost,No Such Project,,",
+        "By ID,2,3,",
+        ",Project 1,,",
+        "Bad user,Project 1,99,",
+        "By name,Project 1,User 2,",
+    ]) + "\n")
+    reject_path = tmp_path / "tasks.rejects.csv"
+
+    report = importer.import_file("tasks", str(path), str(reject_path), bind=seeded)
+
+    assert (report.inserted, report.rejected) == (2, 3)
+    assert reject_path.read_text().splitlines() == [
+        "line,name,project,user,due_date,error",
+        "2,Ghost,No Such Project,,,project 'No Such Project' does not exist",
+        "4,,Project 1,,,name is required",
+        "5,Bad user,Project 1,99,,user ID 99 does not exist",
+    ]
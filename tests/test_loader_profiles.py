@@ -0,0 +1,63 @@
+# tests/test_loader_profiles.py
+"""
+Statements and rows per helper on the seeded database. Every helper loads
+its graph with a fixed number of statements (see models/loading.py); a
+relationship left to load lazily per row makes the count grow with the
+data, and a raiseload hit shows up as a "❌ Error" message.
+"""
+
+from datetime import date, timedelta
+
+import pytest
+
+from project_manager import helpers
+from project_manager.instrumentation import profile_queries
+from project_manager.models import SessionLocal
+from project_manager.services import TaskService
+
+# (helper, input lines, statements, rows)
+CASES = [
+    ("list_projects", (), 1, 3),
+    ("find_project", ("1",), 1, 1),
+    ("view_project_tasks", ("1",), 4, 7),       # project, its tasks, then their users and project
+    ("list_tasks", (), 1, 12),
+    ("find_task", ("1",), 3, 3),                # task, then its user and project
+    ("find_task", ("Task 5",), 4, 4),           # plus the search
+    ("view_task_details", ("1",), 3, 3),
+    ("list_users", (), 1, 3),
+    ("find_user", ("2",), 1, 1),
+    ("view_workload", (), 1, 4),
+]
+
+
+def _run(engine, helper, capsys):
+    with profile_queries(engine) as profile:
+        getattr(helpers, helper)()
+    output = capsys.readouterr().out
+    assert "❌" not in output, output
+    return profile
+
+
+@pytest.mark.parametrize("helper, lines, statements, rows", CASES)
+def test_statements_and_rows(seeded, answers, capsys, helper, lines, statements, rows):
+    answers(*lines)
+    profile = _run(seeded, helper, capsys)
+    assert (profile.count, profile.rows) == (statements, rows)
+    assert profile.repeated_shapes() == []
+
+
+@pytest.mark.parametrize("helper, lines", [
+    ("list_tasks", ()),
+    ("view_project_tasks", ("1",)),
+    ("find_task", ("1",)),
+])
+def test_statements_do_not_grow_with_tasks(seeded, answers, capsys, helper, lines):
+    answers(*lines)
+    before = _run(seeded, helper, capsys).count
+    with SessionLocal() as session:
+        tasks = TaskService(session)
+        for n in range(6):
+            tasks.create(f"More {n}", "Project 1", due_date=date.today() + timedelta(days=n + 1), user="User 3")
+        session.commit()
+    answers(*lines)
+    assert _run(seeded, helper, capsys).count == before
@@ -0,0 +1,84 @@
+# tests/test_server.py
+
+import json
+import threading
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+import pytest
+
+from project_manager.server import make_server
+
+
+@pytest.fixture
+def server(seeded):
+    httpd = make_server(port=0, url=str(seeded.url))
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.store.close()
+    httpd.server_close()
+
+
+def call(base, method, path, body=None):
+    data = json.dumps(body).encode() if body is not None else None
+    request = Request(base + path, data=data, method=method, headers={"Content-Type": "application/json"})
+    try:
+        with urlopen(request) as response:
+            return response.status, json.load(response)
+    except HTTPError as e:
+        return e.code, json.load(e)
+
+
+@pytest.mark.parametrize("limit", ["0", "-1", "501", "x"])
+def test_page_limit_out_of_range(server, limit):
+    status, body = call(server, "GET", f"/tasks?limit={limit}")
+    assert status == 400, body
+
+
+def test_page_limit(server):
+    status, body = call(server, "GET", "/tasks?limit=5")
+    assert status == 200
+    assert len(body["items"]) == 5 and body["next"]
+
+
+@pytest.mark.parametrize("body", [
+    {"name": ["x"], "email": "x@example.com"},
+    {"name": "X", "email": {"a": 1}},
+    {"name": True, "email": "x@example.com"},
+])
+def test_fields_type_checked(server, body):
+    status, reply = call(server, "POST", "/users", body)
+    assert status == 400, reply
+
+
+def test_ref_and_number_fields(server):
+    assert call(server, "POST", "/tasks", {"name": "T", "project": ["Project 1"]})[0] == 400
+    assert call(server, "POST", "/tasks/shift-due", {"project": "Project 1", "days": "2"})[0] == 400
+    status, task = call(server, "POST", "/tasks", {"name": "T", "project": 1})
+    assert status == 201 and task["project_id"] == 1
+
+
+def test_quoted_ref(server):
+    status, project = call(server, "GET", "/projects/Project%201")
+    assert status == 200 and project["name"] == "Project 1"
+    status, body = call(server, "GET", "/projects/Project%201/tasks")
+    assert status == 200 and len(body["items"]) == 4
+
+
+@pytest.mark.parametrize("name", ["users", "tasks", "projects"])
+def test_project_named_like_a_collection(server, name):
+    assert call(server, "POST", "/projects", {"name": name, "deadline": "2030-01-01"})[0] == 201
+    assert call(server, "POST", "/tasks", {"name": "T", "project": name})[0] == 201
+    status, project = call(server, "GET", f"/projects/{name}")
+    assert status == 200 and project["name"] == name
+    status, body = call(server, "GET", f"/projects/{name}/tasks")
+    assert status == 200 and [task["name"] for task in body["items"]] == ["T"]
+
+
+def test_missing_row_is_404(server):
+    assert call(server, "GET", "/projects/Nope")[0] == 404
+    assert call(server, "PATCH", "/tasks/999", {"name": "X"})[0] == 404
+    assert call(server, "POST", "/tasks", {"name": "T", "project": "Nope"})[0] == 404
+    assert call(server, "POST", "/projects", {"name": "P", "deadline": "2000-01-01"})[0] == 400
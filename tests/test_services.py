@@ -0,0 +1,53 @@
+# tests/test_services.py
+
+import asyncio
+
+import pytest
+
+from project_manager import async_services
+from project_manager.async_services import AsyncSessionLocal, AsyncTaskService, AsyncUserService
+from project_manager.models import SessionLocal
+from project_manager.services import ProjectService, TaskService, UserService
+
+
+@pytest.mark.parametrize("service, term, names", [
+    (ProjectService, "proj 2", ["Project 2"]),
+    (TaskService, "task 1", ["Task 1", "Task 10", "Task 11", "Task 12"]),
+    (UserService, "user3@example", ["User 3"]),
+    (TaskService, "!!", []),
+    (UserService, "nobody", []),
+])
+def test_search(seeded, service, term, names):
+    with SessionLocal() as session:
+        assert [row.name for row in service(session).search(term)] == names
+
+
+def test_search_limit(seeded):
+    with SessionLocal() as session:
+        tasks = TaskService(session)
+        assert len(tasks.search("task", limit=None)) == 12
+        assert len(tasks.search("task", limit=5)) == 5
+
+
+def test_async_search_and_dispose(seeded, monkeypatch):
+    monkeypatch.setattr(async_services, "database_url", lambda: str(seeded.url))
+
+    async def main():
+        try:
+            async with AsyncSessionLocal() as session:
+                tasks = await AsyncTaskService(session).search("task 5")
+                users = await AsyncUserService(session).search("user 1")
+            return tasks, users
+        finally:
+            await async_services.dispose()
+
+    tasks, users = asyncio.run(main())
+    assert [t.name for t in tasks] == ["Task 5"]
+    assert [u.name for u in users] == ["User 1"]
+    assert async_services._async_engine is None
+    assert AsyncSessionLocal.kw.get("bind") is None
+
+
+def test_update_many_only_where_fields_can_be_shared():
+    assert not hasattr(UserService, "update_many") and not hasattr(AsyncUserService, "update_many")
+    assert hasattr(AsyncTaskService, "update_many")
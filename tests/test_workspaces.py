@@ -0,0 +1,10 @@
+# tests/test_workspaces.py
+
+from project_manager import workspaces
+
+
+def test_reports_with_no_workspaces(monkeypatch):
+    monkeypatch.setattr(workspaces, "list_workspaces", lambda: [])
+    assert workspaces.fan_out(lambda session: 1 / 0) == {}
+    assert workspaces.workload() == []
+    assert workspaces.workspace_summary() == {}